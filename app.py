@@ -12,7 +12,6 @@ from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 import plotly.express as px
 import plotly.graph_objects as go
-import pandas as pd
 import numpy as np
 import json
 import base64
@@ -62,9 +61,23 @@ from logic.callbacks.pareto_plot import register_pareto_plot_callbacks
 from logic.callbacks.pareto_selection import register_pareto_selection_callbacks
 from logic.callbacks.consolidation import register_consolidation_callbacks
 from logic.callbacks.genes_analysis import register_genes_analysis_callbacks
+from logic.callbacks.gene_similarity import register_gene_similarity_callbacks
+from logic.callbacks.gene_embedding import register_gene_embedding_callbacks
+from logic.callbacks.front_gene_comparison import register_front_gene_comparison_callbacks
+from logic.callbacks.gene_cooccurrence import register_gene_cooccurrence_callbacks
+from logic.callbacks.gene_association import register_gene_association_callbacks
+from logic.callbacks.gene_stability import register_gene_stability_callbacks
+from logic.callbacks.gene_permutation import register_gene_permutation_callbacks
+from logic.callbacks.gene_cutoff import register_gene_cutoff_callbacks
+from logic.callbacks.front_metrics import register_front_metrics_callbacks
+from logic.callbacks.solution_ranking import register_solution_ranking_callbacks
+from logic.callbacks.objective_clusters import register_objective_cluster_callbacks
+from logic.callbacks.front_playback import register_front_playback_callbacks
 from logic.callbacks.gene_groups_analysis import register_gene_groups_callbacks
 from logic.callbacks.enrichment_analysis import register_enrichment_callbacks
 from logic.callbacks.export_callbacks import register_export_callbacks 
+# Lógica - Utilidades compartidas
+from logic.utils.gene_frequency import conserved_genes, gene_frequencies, genes_at_percentage
 # -------------------------------------------------------------
 BOOTSTRAP_ICONS_URL = "https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/font/bootstrap-icons.css"
 
@@ -264,7 +277,8 @@ app.layout = dbc.Container([
     # STORES (se mantienen en app.py)
     dcc.Store(id='add-all-trigger-store', data=0), 
     dcc.Store(id='restore-trigger-store', data=0),
-    dcc.Store(id='data-store', data={'fronts': [], 'fronts_history': [], 'main_objectives': None, 'explicit_objectives': []}),
+    dcc.Store(id='consolidate-mode-store', data='selection'),
+    dcc.Store(id='data-store', data={'fronts': [], 'fronts_history': [], 'main_objectives': None, 'explicit_objectives': [], 'objective_meta': {}}),
     dcc.Store(id='enrichment-data-store'),
     dcc.Store(id='enrichment-params-store'),
     dcc.Store(id='objectives-store'),
@@ -273,6 +287,9 @@ app.layout = dbc.Container([
     dcc.Store(id='genes-tab-gene-group-temp-store', data=None),
     dcc.Store(id='genes-tab-individual-gene-temp-store', data=None),
     dcc.Store(id='selected-solutions-store', data=[]),
+    dcc.Store(id='hv-reference-store', data=None, storage_type='session'),
+    dcc.Store(id='reference-front-store', data=None),
+    dcc.Store(id='gene-embedding-version-store', data=None),
     dcc.Store(id='combined-gene-groups-store', data=[], storage_type='session'),
     dcc.Store(id='gene-groups-analysis-tab-temp-store', data=None),
     dcc.Store(id='intersection-data-temp-store', data=None),
@@ -936,22 +953,14 @@ def open_modal_for_gene_groups(n_clicks_list, data):
         
     clicked_index = triggered_id_dict['index']
     
-    all_solutions_list = []
-    for front in data.get("fronts", []):
-        if front.get("visible", True):
-            all_solutions_list.extend(front["data"])
-
-    if not all_solutions_list:
+    frequency = gene_frequencies(data)
+    if frequency.total_solutions == 0:
         raise PreventUpdate
 
-    all_genes = [gene for solution in all_solutions_list for gene in solution.get('selected_genes', [])]
-    gene_counts = pd.Series(all_genes).value_counts()
-    total_solutions = len(all_solutions_list)
-
     if clicked_index == '100pct':
-        genes_100_percent = gene_counts[gene_counts == total_solutions]
+        genes_100_percent = conserved_genes(frequency)
         if len(genes_100_percent) > 0:
-            gene_list = sorted(genes_100_percent.index.tolist())
+            gene_list = genes_100_percent
 
             item_info = html.Div([
                 html.P([html.Strong("Adding Gene Group: "), html.Span("Genes/Probes Present in 100% of Solutions")]),
@@ -975,15 +984,10 @@ def open_modal_for_gene_groups(n_clicks_list, data):
         except ValueError:
             raise PreventUpdate
             
-        genes_at_percentage = []
-        genes_under_100 = gene_counts[gene_counts < total_solutions]
-        for gene, count in genes_under_100.items():
-            percentage = round((count / total_solutions) * 100, 1)
-            if percentage == clicked_percentage:
-                genes_at_percentage.append(gene)
-
-        if genes_at_percentage:
-            gene_list = sorted(genes_at_percentage)
+        genes_in_group = [gene for gene, _ in genes_at_percentage(frequency, clicked_percentage)]
+
+        if genes_in_group:
+            gene_list = sorted(genes_in_group)
             item_info = html.Div([
                 html.P([html.Strong("Adding Gene Group: "), html.Span(f"Genes/Probes with {clicked_percentage}% frequency")]),
                 html.P([html.Strong("Number of genes/probes: "), html.Span(f"{len(gene_list)}")])
@@ -1596,7 +1600,19 @@ register_data_management_callbacks(app)
 register_pareto_plot_callbacks(app)
 register_pareto_selection_callbacks(app)
 register_consolidation_callbacks(app)
+register_front_metrics_callbacks(app)
+register_solution_ranking_callbacks(app)
+register_objective_cluster_callbacks(app)
+register_front_playback_callbacks(app)
 register_genes_analysis_callbacks(app)
+register_gene_similarity_callbacks(app)
+register_gene_embedding_callbacks(app)
+register_front_gene_comparison_callbacks(app)
+register_gene_cooccurrence_callbacks(app)
+register_gene_association_callbacks(app)
+register_gene_stability_callbacks(app)
+register_gene_permutation_callbacks(app)
+register_gene_cutoff_callbacks(app)
 register_gene_groups_callbacks(app)
 
 # Registros de la Fase 4
@@ -8,23 +8,43 @@ from datetime import datetime
 import pandas as pd
 import logging
 
+from logic.utils.dominance import non_dominated_mask, assign_pareto_ranks, merge_fronts_non_dominated
+from logic.utils.objectives import build_objective_meta, get_dominance_objectives, objective_directions, objective_matrix, to_minimization
+from logic.utils.analysis_cache import new_front_version
+
 logger = logging.getLogger(__name__)
 
+
+def _record_origin(solution, front_name, front_id):
+    """
+    Store the provenance (origin front, its id and the original solution ID) as one unit. Solutions of an
+    already consolidated front keep their first-level provenance, so the three fields always agree.
+    """
+    if solution.get('origin_front') is not None:
+        return
+    solution['origin_front'] = front_name
+    solution['origin_front_id'] = front_id
+    solution['original_solution_id'] = solution.get('solution_id')
+
+
 def register_consolidation_callbacks(app):
     
     # 1. Callback para abrir/cerrar modal de confirmación
     @app.callback(
         [Output('consolidate-modal', 'is_open'),
          Output('consolidate-modal-info', 'children'),
-         Output('consolidate-front-name-input', 'value')],
+         Output('consolidate-front-name-input', 'value'),
+         Output('consolidate-mode-store', 'data')],
         [Input('consolidate-selection-btn', 'n_clicks'),
+         Input('merge-all-fronts-btn', 'n_clicks'),
          Input('consolidate-cancel-btn', 'n_clicks'),
          Input('consolidate-confirm-btn', 'n_clicks')],
         [State('selected-solutions-store', 'data'),
+         State('data-store', 'data'),
          State('consolidate-modal', 'is_open')],
         prevent_initial_call=True
     )
-    def toggle_consolidate_modal(consolidate_clicks, cancel_clicks, confirm_clicks, selected_solutions, is_open):
+    def toggle_consolidate_modal(consolidate_clicks, merge_all_clicks, cancel_clicks, confirm_clicks, selected_solutions, data_store, is_open):
         """Toggle consolidation modal and populate initial data"""
         ctx = dash.callback_context
         if not ctx.triggered:
@@ -33,7 +53,24 @@ def register_consolidation_callbacks(app):
         trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
 
         if trigger_id in ['consolidate-cancel-btn', 'consolidate-confirm-btn']:
-            return False, dash.no_update, dash.no_update
+            return False, dash.no_update, dash.no_update, dash.no_update
+
+        if trigger_id == 'merge-all-fronts-btn' and merge_all_clicks:
+            visible_fronts = [f for f in (data_store or {}).get('fronts', []) if f.get('visible', True)]
+            if not visible_fronts:
+                raise PreventUpdate
+
+            total_solutions = sum(len(f.get('data', [])) for f in visible_fronts)
+            info = html.Div([
+                html.P(f"All {len(visible_fronts)} visible front(s) will be merged ({total_solutions} solutions)."),
+                html.P(", ".join(f['name'] for f in visible_fronts), className="small text-muted"),
+                html.P("Every solution is streamed through a non-dominated archive: only solutions that are not "
+                       "dominated by any other loaded solution are kept. Solutions with identical objective values "
+                       "(e.g. different gene sets) are all kept, as when consolidating a selection. "
+                       "Each solution keeps its origin front and original solution ID.")
+            ])
+            default_name = f"Merged_Front_{datetime.now().strftime('%H%M')}"
+            return True, info, default_name, 'merge_all'
 
         if trigger_id == 'consolidate-selection-btn' and consolidate_clicks:
             if not selected_solutions:
@@ -45,13 +82,14 @@ def register_consolidation_callbacks(app):
             info = html.Div([
                 html.P(f"You have selected {num_solutions} solution(s)."),
                 html.P(f"These solutions come from the following front(s): {', '.join(front_names)}."),
-                html.P("Confirm to create a new consolidated Pareto front with these solutions.")
+                html.P("Confirm to create a new consolidated Pareto front with these solutions. "
+                       "Solutions dominated by other selected solutions will be discarded.")
             ])
             
             timestamp = datetime.now().strftime("%H%M")
             default_name = f"Consolidated_Front_{timestamp}"
 
-            return True, info, default_name
+            return True, info, default_name, 'selection'
 
         raise PreventUpdate
 
@@ -64,12 +102,14 @@ def register_consolidation_callbacks(app):
          State('selected-solutions-store', 'data'),
          State('consolidate-front-name-input', 'value'),
          State('x-axis-store', 'data'), 
-         State('y-axis-store', 'data')], 
+         State('y-axis-store', 'data'),
+         State('consolidate-mode-store', 'data')], 
         prevent_initial_call=True
     )
-    def perform_consolidation(n_clicks, current_data, selected_solutions, new_front_name, current_x_axis, current_y_axis):
-        """Performs the consolidation of selected solutions into a new Pareto front."""
-        if not n_clicks or not selected_solutions or not current_data:
+    def perform_consolidation(n_clicks, current_data, selected_solutions, new_front_name, current_x_axis, current_y_axis, mode):
+        """Performs the consolidation of selected solutions (or of all visible fronts) into a new Pareto front."""
+        merge_all = mode == 'merge_all'
+        if not n_clicks or not current_data or (not merge_all and not selected_solutions):
             raise PreventUpdate
             
         updated_data = current_data.copy()
@@ -90,8 +130,18 @@ def register_consolidation_callbacks(app):
 
         # 2. Preparar datos del nuevo frente
         new_front_data = []
-        
-        for sol in selected_solutions:
+
+        if merge_all:
+            # Fusión automática: archivo no dominado incremental sobre todos los frentes visibles
+            for front, index in merge_fronts_non_dominated(updated_data, keep_duplicates=True):
+                original_data = dict(front['data'][index])
+                _record_origin(original_data, front['name'], front['id'])
+                new_front_data.append(original_data)
+            if not new_front_data:
+                raise PreventUpdate
+
+        front_ids = {f['name']: f['id'] for f in updated_data.get('fronts', [])}
+        for sol in ([] if merge_all else selected_solutions):
             # Copia de los datos originales completos
             original_data = sol['full_data'].copy()
             
@@ -108,31 +158,44 @@ def register_consolidation_callbacks(app):
                 
             if current_y_axis and visual_y is not None:
                 original_data[current_y_axis] = visual_y
-            
+
+            _record_origin(original_data, sol.get('front_name'), front_ids.get(sol.get('front_name')))
             new_front_data.append(original_data)
         
-        # 3. Ordenar (Ahora es seguro porque inyectamos las claves)
+        # 3. Filtrar soluciones dominadas: el frente consolidado debe ser realmente no dominado
+        dominance_objectives = get_dominance_objectives(updated_data) or [o for o in (current_x_axis, current_y_axis) if o]
+        if dominance_objectives and new_front_data and not merge_all:
+            oriented = to_minimization(objective_matrix(new_front_data, dominance_objectives),
+                                       objective_directions(updated_data, dominance_objectives))
+            keep_mask = non_dominated_mask(oriented)
+            discarded = int((~keep_mask).sum())
+            new_front_data = [sol for sol, keep in zip(new_front_data, keep_mask) if keep]
+            if discarded:
+                logger.info(f"Consolidation discarded {discarded} dominated solution(s).")
+
+        # 4. Ordenar (Ahora es seguro porque inyectamos las claves)
         if current_x_axis and current_y_axis:
             try:
                 new_front_data.sort(key=lambda s: (s.get(current_x_axis, 0), s.get(current_y_axis, 0)))
             except TypeError:
                 pass 
         
-        # 4. Renumerar y nombrar
+        # 5. Renumerar y nombrar
         final_front_name = new_front_name if new_front_name else f"Consolidated_Front_{datetime.now().strftime('%H%M')}"
         
         for i, sol in enumerate(new_front_data):
             # Guardamos el ID original por si acaso, pero generamos uno limpio para el gráfico
-            sol['original_solution_id'] = sol.get('solution_id')
+            sol.setdefault('original_solution_id', sol.get('solution_id'))
             sol['solution_id'] = f"Sol_{i+1}"
             sol['front_name'] = final_front_name
 
-        # 5. Crear objeto frente
+        # 6. Crear objeto frente
         new_front_id = f"consolidated_{datetime.now().strftime('%Y%m%d%H%M%S')}"
 
         new_front = {
             "id": new_front_id,
             "name": final_front_name,
+            "version": new_front_version(),
             "data": new_front_data,
             "objectives": objectives, 
             "visible": True,
@@ -140,13 +203,15 @@ def register_consolidation_callbacks(app):
             "is_consolidated": True
         }
         
-        # 6. Guardar historial para poder restaurar después
+        # 7. Guardar historial para poder restaurar después
         import copy
         current_fronts_snapshot = copy.deepcopy(updated_data.get('fronts', []))
         updated_data.setdefault('fronts_history', []).append(current_fronts_snapshot)
 
-        # 7. Reemplazar frentes actuales con el consolidado
+        # 8. Reemplazar frentes actuales con el consolidado
         updated_data['fronts'] = [new_front]
+        build_objective_meta(updated_data)
+        assign_pareto_ranks(updated_data)
         
         # Limpiar selección al finalizar
         return updated_data, []
@@ -191,5 +256,7 @@ def register_consolidation_callbacks(app):
                 main_objectives = previous_fronts[0].get('objectives')
 
         updated_data['main_objectives'] = main_objectives
+        build_objective_meta(updated_data)
+        assign_pareto_ranks(updated_data)
         
         return updated_data, [], {}
\ No newline at end of file
@@ -15,6 +15,19 @@ import pathlib
 
 # Importar la lógica de procesamiento
 from logic.utils.data_processing import validate_and_process_fronts 
+from logic.utils.dominance import assign_pareto_ranks
+from logic.utils.front_reduction import collapse_near_duplicates, near_duplicate_summary, thin_fronts
+from logic.utils.hypervolume import front_hypervolumes, parse_reference_point
+from logic.utils.near_duplicates import DEFAULT_THRESHOLD
+from logic.utils.objectives import build_objective_meta, get_dominance_objectives
+
+
+def _duplicate_threshold(value):
+    """Jaccard threshold from the input (clipped to [0.5, 1])."""
+    try:
+        return min(max(float(value), 0.5), 1.0)
+    except (TypeError, ValueError):
+        return DEFAULT_THRESHOLD
 
 
 def register_data_management_callbacks(app):
@@ -42,7 +55,7 @@ def register_data_management_callbacks(app):
         # Clear all data
         if trigger_id == 'clear-data-btn' and clear_clicks:
             # Reseteamos data, status, objetivos y EL UPLOADER (None)
-            empty_store = {'fronts': [], 'fronts_history': [], 'main_objectives': None, 'explicit_objectives': []}
+            empty_store = {'fronts': [], 'fronts_history': [], 'main_objectives': None, 'explicit_objectives': [], 'objective_meta': {}}
             success_msg = dbc.Alert("All data cleared successfully", color="info", dismissable=True)
             return empty_store, success_msg, None, None 
 
@@ -58,9 +71,10 @@ def register_data_management_callbacks(app):
     @app.callback(
         Output('fronts-list', 'children'),
         Input('data-store', 'data'),
-        Input('main-tabs', 'active_tab')
+        Input('main-tabs', 'active_tab'),
+        Input('hv-reference-input', 'value')
     )
-    def update_fronts_list(current_data, active_tab):
+    def update_fronts_list(current_data, active_tab, hv_reference_text):
         """Update the display of loaded fronts."""
         if active_tab != 'upload-tab':
             raise PreventUpdate
@@ -71,6 +85,12 @@ def register_data_management_callbacks(app):
         explicit_objectives = current_data.get('explicit_objectives', [])
         objectives_str = ', '.join(explicit_objectives) if explicit_objectives else "Auto-detected"
 
+        # Hypervolume por frente (cacheado por versión de frente y punto de referencia)
+        reference_point = parse_reference_point(hv_reference_text, len(get_dominance_objectives(current_data)))
+        hv_by_front = front_hypervolumes(current_data, reference_point)
+        hv_title = ("Hypervolume in the normalized objective space shared by all loaded fronts "
+                    f"(reference: {'custom' if reference_point else 'auto'}). Higher is better.")
+
         fronts_items = []
         for front in current_data['fronts']:
             card_border = "border-secondary" if not front.get('is_consolidated') else "border-info"
@@ -109,6 +129,16 @@ def register_data_management_callbacks(app):
                     
                     html.Div([
                         html.Span(f"Solutions: {len(front['data'])}", className="badge bg-light text-dark border me-2"),
+                        html.Span(
+                            f"Non-dominated: {sum(1 for s in front['data'] if s.get('pareto_rank') == 1)}",
+                            className="badge bg-light text-success border me-2",
+                            title="Solutions with global Pareto rank 1 (not dominated by any loaded solution)"
+                        ),
+                        html.Span(
+                            f"HV{'' if hv_by_front[front['id']]['exact'] else ' ≈'}: {hv_by_front[front['id']]['hv']:.4f}",
+                            className="badge bg-light text-primary border me-2",
+                            title=hv_title
+                        ) if front['id'] in hv_by_front else None,
                         html.Span(f"Objectives: {objectives_str}", className="badge bg-light text-dark border me-2"),
                         html.Span("CONSOLIDATED", className="badge bg-info text-white") if front.get('is_consolidated') else None
                     ], className="mt-2 small")
@@ -119,6 +149,181 @@ def register_data_management_callbacks(app):
 
         return fronts_items
 
+    # 2b. El punto de referencia HV se comparte con las otras pestañas
+    @app.callback(
+        Output('hv-reference-store', 'data'),
+        Input('hv-reference-input', 'value')
+    )
+    def sync_hv_reference(hv_reference_text):
+        return hv_reference_text or None
+
+    # 2c. Configuración de objetivos (dirección y límites)
+    @app.callback(
+        Output('objective-settings-container', 'children'),
+        Input('data-store', 'data'),
+        Input('main-tabs', 'active_tab')
+    )
+    def render_objective_settings(current_data, active_tab):
+        if active_tab != 'upload-tab':
+            raise PreventUpdate
+
+        meta = (current_data or {}).get('objective_meta') or {}
+        objectives = get_dominance_objectives(current_data)
+        if not objectives:
+            return html.Small("Objectives will appear here once a front is loaded.", className="text-muted")
+
+        rows = []
+        for obj in objectives:
+            obj_meta = meta.get(obj) or {}
+            data_bounds = obj_meta.get('data_bounds') or [None, None]
+            lower, upper = (obj_meta.get('user_bounds') or [None, None])[:2]
+            is_user = obj_meta.get('direction_source') == 'user'
+            rows.append(dbc.Row([
+                dbc.Col(html.Span(obj, className="fw-bold small"), width=12, md=3),
+                dbc.Col(dbc.Select(
+                    id={'type': 'objective-direction-select', 'index': obj},
+                    options=[{'label': 'Minimize', 'value': 'min'}, {'label': 'Maximize', 'value': 'max'}],
+                    value=obj_meta.get('direction') or 'min',
+                    size="sm"
+                ), width=6, md=3),
+                dbc.Col(dbc.Input(
+                    id={'type': 'objective-lower-input', 'index': obj},
+                    type='number', value=lower, debounce=True, size="sm",
+                    placeholder=f"min {data_bounds[0]:.4g}" if data_bounds[0] is not None else "min"
+                ), width=3, md=2),
+                dbc.Col(dbc.Input(
+                    id={'type': 'objective-upper-input', 'index': obj},
+                    type='number', value=upper, debounce=True, size="sm",
+                    placeholder=f"max {data_bounds[1]:.4g}" if data_bounds[1] is not None else "max"
+                ), width=3, md=2),
+                dbc.Col(html.Span(
+                    "user" if is_user else "inferred",
+                    className=f"badge {'bg-primary' if is_user else 'bg-light text-dark border'}"
+                ), width=12, md=2, className="small"),
+            ], className="g-2 align-items-center mb-2"))
+        return rows
+
+    @app.callback(
+        Output('data-store', 'data', allow_duplicate=True),
+        Input({'type': 'objective-direction-select', 'index': ALL}, 'value'),
+        Input({'type': 'objective-lower-input', 'index': ALL}, 'value'),
+        Input({'type': 'objective-upper-input', 'index': ALL}, 'value'),
+        Input('objective-settings-reset-btn', 'n_clicks'),
+        State({'type': 'objective-direction-select', 'index': ALL}, 'id'),
+        State('data-store', 'data'),
+        prevent_initial_call=True
+    )
+    def update_objective_settings(directions, lowers, uppers, reset_clicks, ids, current_data):
+        if not current_data or not current_data.get('fronts'):
+            raise PreventUpdate
+
+        updated_data = current_data.copy()
+        meta = {obj: dict(m) for obj, m in (updated_data.get('objective_meta') or {}).items()}
+        changed = False
+
+        if dash.callback_context.triggered_id == 'objective-settings-reset-btn':
+            if not reset_clicks:
+                raise PreventUpdate
+            for obj_meta in meta.values():
+                changed |= obj_meta.get('direction_source') == 'user' or bool(obj_meta.get('user_bounds'))
+                obj_meta['direction_source'] = 'inferred'
+                obj_meta['user_bounds'] = None
+        else:
+            for id_dict, direction, lower, upper in zip(ids, directions, lowers, uppers):
+                obj_meta = meta.setdefault(id_dict['index'], {})
+                if direction in ('min', 'max') and direction != obj_meta.get('direction'):
+                    obj_meta['direction'] = direction
+                    obj_meta['direction_source'] = 'user'
+                    changed = True
+                user_bounds = [lower, upper] if lower is not None or upper is not None else None
+                if user_bounds != obj_meta.get('user_bounds'):
+                    obj_meta['user_bounds'] = user_bounds
+                    changed = True
+
+        if not changed:
+            raise PreventUpdate
+
+        updated_data['objective_meta'] = meta
+        build_objective_meta(updated_data)
+        # La dominancia depende de la dirección: recalcular rangos globales
+        assign_pareto_ranks(updated_data)
+        return updated_data
+
+    # 2d. Reducción de frentes: duplicados cercanos (MinHash/LSH)
+    @app.callback(
+        Output('front-reduction-status', 'children'),
+        Input('detect-duplicates-btn', 'n_clicks'),
+        State('duplicate-threshold-input', 'value'),
+        State('data-store', 'data'),
+        prevent_initial_call=True
+    )
+    def detect_near_duplicates(n_clicks, threshold, current_data):
+        if not n_clicks:
+            raise PreventUpdate
+        if not current_data or not current_data.get('fronts'):
+            return dbc.Alert("Load at least one front first.", color="light", className="small m-0")
+
+        summary = near_duplicate_summary(current_data, _duplicate_threshold(threshold))
+        items = [
+            html.Li(f"{row['front']}: {row['duplicate_clusters']} near-duplicate cluster(s); "
+                    f"collapsing keeps {row['clusters']} of {row['solutions']} solutions",
+                    className="small text-muted")
+            for row in summary
+        ]
+        return html.Ul(items, className="mb-0 ps-3")
+
+    @app.callback(
+        [Output('data-store', 'data', allow_duplicate=True),
+         Output('front-reduction-status', 'children', allow_duplicate=True),
+         Output('selected-solutions-store', 'data', allow_duplicate=True)],
+        Input('collapse-duplicates-btn', 'n_clicks'),
+        State('duplicate-threshold-input', 'value'),
+        State('data-store', 'data'),
+        prevent_initial_call=True
+    )
+    def collapse_duplicates(n_clicks, threshold, current_data):
+        if not n_clicks or not current_data or not current_data.get('fronts'):
+            raise PreventUpdate
+
+        updated_data, changed = collapse_near_duplicates(current_data, _duplicate_threshold(threshold))
+        if not changed:
+            return dash.no_update, dbc.Alert("No near-duplicates found at this threshold.", color="light", className="small m-0"), dash.no_update
+
+        details = "; ".join(f"{name}: {before} → {after}" for name, before, after in changed)
+        return updated_data, dbc.Alert(f"Collapsed near-duplicates ({details}).", color="success", dismissable=True,
+                                       className="small m-0"), []
+
+    # 2e. Reducción de frentes: adelgazamiento por cajas epsilon
+    @app.callback(
+        [Output('data-store', 'data', allow_duplicate=True),
+         Output('front-reduction-status', 'children', allow_duplicate=True),
+         Output('selected-solutions-store', 'data', allow_duplicate=True)],
+        Input('thin-fronts-btn', 'n_clicks'),
+        State('thinning-target-input', 'value'),
+        State('thinning-epsilon-input', 'value'),
+        State('data-store', 'data'),
+        prevent_initial_call=True
+    )
+    def thin_visible_fronts(n_clicks, target_size, epsilon, current_data):
+        if not n_clicks or not current_data or not current_data.get('fronts'):
+            raise PreventUpdate
+        if not get_dominance_objectives(current_data):
+            return dash.no_update, dbc.Alert("No numeric objectives to thin on.", color="light", className="small m-0"), dash.no_update
+
+        epsilon = float(epsilon) if epsilon else None
+        target_size = max(2, int(target_size)) if target_size and epsilon is None else None
+        if epsilon is None and target_size is None:
+            raise PreventUpdate
+
+        updated_data, changed = thin_fronts(current_data, target_size=target_size, epsilon=epsilon)
+        if not changed:
+            return dash.no_update, dbc.Alert("Nothing to thin: the visible fronts are already within the target.",
+                                             color="light", className="small m-0"), dash.no_update
+
+        details = "; ".join(f"{name}: {before} → {after}" for name, before, after in changed)
+        return updated_data, dbc.Alert(f"Thinned fronts ({details}).", color="success", dismissable=True,
+                                       className="small m-0"), []
+
     # 3. Callback nombres
     @app.callback(
         Output('data-store', 'data', allow_duplicate=True),
@@ -167,6 +372,11 @@ def register_data_management_callbacks(app):
         if not updated_data['fronts']:
              updated_data['explicit_objectives'] = []
              updated_data['main_objectives'] = None 
+             updated_data['objective_meta'] = {}
+        else:
+             # Los rangos y límites son globales: al quitar un frente pueden cambiar
+             build_objective_meta(updated_data)
+             assign_pareto_ranks(updated_data)
 
         return updated_data, None
 
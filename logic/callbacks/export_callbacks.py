@@ -13,6 +13,10 @@ from services.report_generator import (
     export_genes_list,
     generate_item_pdf,
 )
+from logic.callbacks.front_metrics import active_reference_solutions
+from logic.utils.gene_frequency import gene_frequencies
+from logic.utils.hypervolume import parse_reference_point
+from logic.utils.objectives import get_dominance_objectives
 
 
 def register_export_callbacks(app):
@@ -922,14 +926,19 @@ def register_export_callbacks(app):
         Output("pdf-report-download", "data"),
         Input("generate-pdf-report", "n_clicks"),
         [State('data-store', 'data'),
-         State('enrichment-data-store', 'data')],
+         State('enrichment-data-store', 'data'),
+         State('reference-front-store', 'data'),
+         State('hv-reference-store', 'data')],
         prevent_initial_call=True
     )
-    def download_pdf_report(n_clicks, data_store, enrichment_data):
+    def download_pdf_report(n_clicks, data_store, enrichment_data, reference_front, hv_reference_text):
         if not n_clicks or not data_store or not data_store.get('fronts'):
             raise PreventUpdate
 
-        pdf_buffer = generate_pdf_report(data_store, enrichment_data)
+        reference_solutions = active_reference_solutions(reference_front)
+        reference_point = parse_reference_point(hv_reference_text, len(get_dominance_objectives(data_store)))
+        pdf_buffer = generate_pdf_report(data_store, enrichment_data,
+                                         reference_solutions=reference_solutions, reference_point=reference_point)
         if pdf_buffer:
             return dcc.send_bytes(pdf_buffer.getvalue(), f"BioPareto_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf")
         raise PreventUpdate
@@ -939,14 +948,18 @@ def register_export_callbacks(app):
         Output("txt-report-download", "data"),
         Input("generate-txt-report", "n_clicks"),
         [State('data-store', 'data'),
-         State('enrichment-data-store', 'data')],
+         State('enrichment-data-store', 'data'),
+         State('reference-front-store', 'data'),
+         State('hv-reference-store', 'data')],
         prevent_initial_call=True
     )
-    def download_txt_report(n_clicks, data_store, enrichment_data):
+    def download_txt_report(n_clicks, data_store, enrichment_data, reference_front, hv_reference_text):
         if not n_clicks or not data_store or not data_store.get('fronts'):
             raise PreventUpdate
 
-        txt_content = generate_txt_report(data_store, enrichment_data)
+        reference_solutions = active_reference_solutions(reference_front)
+        reference_point = parse_reference_point(hv_reference_text, len(get_dominance_objectives(data_store)))
+        txt_content = generate_txt_report(data_store, enrichment_data, reference_solutions, reference_point)
         if txt_content:
             return dcc.send_string(txt_content, f"BioPareto_Summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
         raise PreventUpdate
@@ -1023,11 +1036,10 @@ def register_export_callbacks(app):
 
         fronts = data_store.get('fronts', [])
         all_solutions = [s for f in fronts for s in f.get('data', []) if f.get('visible', True)]
-        unique_genes = set(g for sol in all_solutions for g in sol.get('selected_genes', []))
 
         return dbc.ListGroup([
             dbc.ListGroupItem(f"Loaded Fronts: {len(fronts)}"),
             dbc.ListGroupItem(f"Total Solutions: {len(all_solutions)}"),
-            dbc.ListGroupItem(f"Unique Genes/Probes: {len(unique_genes)}"),
+            dbc.ListGroupItem(f"Unique Genes/Probes: {len(gene_frequencies(data_store).genes)}"),
             dbc.ListGroupItem(f"Items in Interest Panel: {len(interest_items) if interest_items else 0}"),
         ])
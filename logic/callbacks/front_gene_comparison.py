@@ -0,0 +1,140 @@
+# logic/callbacks/front_gene_comparison.py
+# Frecuencia diferencial de genes entre dos frentes (o un frente contra el resto): gráfico + tabla ordenable.
+
+import numpy as np
+import plotly.graph_objects as go
+from dash import Output, Input, State, dcc, html, ctx
+from dash.exceptions import PreventUpdate
+import dash_bootstrap_components as dbc
+
+from logic.utils.gene_frequency import REST_OF_FRONTS, differential_frequency, front_frequencies
+from logic.utils.table_query import frame_page, paging_restarted
+
+SIGNIFICANCE_LEVEL = 0.05
+TABLE_COLUMNS = ('gene', 'count_a', 'freq_a', 'count_b', 'freq_b', 'difference', 'log2_ratio', 'p_value', 'q_value')
+
+
+def _comparison(data_store, front_a, front_b):
+    """(FrontFrequency, differential DataFrame or None)."""
+    frequency = front_frequencies(data_store)
+    if not front_a or not front_b:
+        return frequency, None
+    return frequency, differential_frequency(frequency, front_a, front_b)
+
+
+def _side_label(frequency, front_id):
+    if front_id == REST_OF_FRONTS:
+        return "other fronts"
+    return frequency.front_names[frequency.front_ids.index(front_id)]
+
+
+def build_comparison_figure(result, label_a, label_b):
+    """Frequency in A vs frequency in B; FDR-significant genes colored by direction."""
+    significant = result['q_value'].to_numpy() < SIGNIFICANCE_LEVEL
+    higher_a = result['difference'].to_numpy() > 0
+    groups = [
+        (~significant, f"Not significant (q ≥ {SIGNIFICANCE_LEVEL})", 'rgba(140,140,140,0.45)'),
+        (significant & higher_a, f"Enriched in {label_a}", '#0d6efd'),
+        (significant & ~higher_a, f"Enriched in {label_b}", '#dc3545'),
+    ]
+    fig = go.Figure()
+    for mask, name, color in groups:
+        if not mask.any():
+            continue
+        subset = result[mask]
+        fig.add_trace(go.Scattergl(
+            x=subset['freq_b'], y=subset['freq_a'], mode='markers', name=name,
+            marker=dict(size=7, color=color), text=subset['gene'],
+            customdata=np.stack([subset['q_value'], subset['count_a'], subset['count_b']], axis=-1),
+            hovertemplate=(f"<b>%{{text}}</b><br>{label_a}: %{{y:.1%}} (%{{customdata[1]}})<br>"
+                           f"{label_b}: %{{x:.1%}} (%{{customdata[2]}})<br>q = %{{customdata[0]:.2e}}<extra></extra>")
+        ))
+    fig.add_trace(go.Scatter(x=[0, 1], y=[0, 1], mode='lines', line=dict(color='#adb5bd', dash='dot'),
+                             hoverinfo='skip', showlegend=False))
+    fig.update_layout(
+        template='plotly_white', height=420, margin=dict(l=50, r=20, t=20, b=40),
+        xaxis=dict(title=f"Frequency in {label_b}", tickformat='.0%', range=[-0.03, 1.03]),
+        yaxis=dict(title=f"Frequency in {label_a}", tickformat='.0%', range=[-0.03, 1.03]),
+        legend=dict(orientation='h', y=1.02, x=1, xanchor='right', yanchor='bottom')
+    )
+    return fig
+
+
+def register_front_gene_comparison_callbacks(app):
+
+    # 1. Opciones de frentes (B admite "resto de frentes")
+    @app.callback(
+        Output('front-diff-a-select', 'options'),
+        Output('front-diff-b-select', 'options'),
+        Output('front-diff-a-select', 'value'),
+        Output('front-diff-b-select', 'value'),
+        Input('data-store', 'data'),
+        State('front-diff-a-select', 'value'),
+        State('front-diff-b-select', 'value')
+    )
+    def update_front_diff_options(data_store, front_a, front_b):
+        fronts = [f for f in (data_store or {}).get('fronts', []) if f.get('visible', True)]
+        options = [{'label': f['name'], 'value': f['id']} for f in fronts]
+        ids = [f['id'] for f in fronts]
+        if front_a not in ids:
+            front_a = ids[0] if ids else None
+        if front_b != REST_OF_FRONTS and front_b not in ids:
+            front_b = REST_OF_FRONTS
+        return options, [{'label': 'All other visible fronts', 'value': REST_OF_FRONTS}] + options, front_a, front_b
+
+    # 2. Resumen y gráfico de la comparación
+    @app.callback(
+        Output('front-diff-summary-container', 'children'),
+        Input('front-diff-a-select', 'value'),
+        Input('front-diff-b-select', 'value'),
+        Input('data-store', 'data')
+    )
+    def update_front_diff_view(front_a, front_b, data_store):
+        visible = [f for f in (data_store or {}).get('fronts', []) if f.get('visible', True)]
+        if len(visible) < 2:
+            return dbc.Alert("Load two or more visible fronts to compare their gene frequencies.",
+                             color="light", className="text-center small text-muted border-0 m-0")
+        frequency, result = _comparison(data_store, front_a, front_b)
+        if result is None:
+            return dbc.Alert("Choose two different fronts.", color="light", className="small m-0")
+
+        label_a, label_b = _side_label(frequency, front_a), _side_label(frequency, front_b)
+        significant = result['q_value'] < SIGNIFICANCE_LEVEL
+        n_a = int(frequency.sizes[frequency.front_ids.index(front_a)])
+        n_b = int(frequency.sizes.sum() - n_a) if front_b == REST_OF_FRONTS else \
+            int(frequency.sizes[frequency.front_ids.index(front_b)])
+        return html.Div([
+            html.Div([
+                dbc.Badge(f"A: {label_a} ({n_a} solutions)", color="primary", className="me-2"),
+                dbc.Badge(f"B: {label_b} ({n_b} solutions)", color="danger", className="me-2"),
+                html.Small(f"{len(result)} genes compared, {int(significant.sum())} differ at FDR < {SIGNIFICANCE_LEVEL} "
+                           f"({int((significant & (result['difference'] > 0)).sum())} higher in A, "
+                           f"{int((significant & (result['difference'] < 0)).sum())} higher in B).",
+                           className="text-muted")
+            ], className="d-flex flex-wrap align-items-center mb-2"),
+            dcc.Graph(id='front-diff-graph', figure=build_comparison_figure(result, label_a, label_b),
+                      config={'responsive': True}),
+        ])
+
+    # 3. Tabla (orden, filtro y paginación en el servidor sobre el resultado cacheado)
+    @app.callback(
+        Output('front-diff-table', 'data'),
+        Output('front-diff-table', 'page_count'),
+        Output('front-diff-table', 'page_current'),
+        Input('front-diff-a-select', 'value'),
+        Input('front-diff-b-select', 'value'),
+        Input('front-diff-table', 'filter_query'),
+        Input('front-diff-table', 'sort_by'),
+        Input('front-diff-table', 'page_current'),
+        Input('front-diff-table', 'page_size'),
+        State('data-store', 'data')
+    )
+    def update_front_diff_table(front_a, front_b, filter_query, sort_by, page_current, page_size, data_store):
+        if not (data_store or {}).get('fronts'):
+            raise PreventUpdate
+        _, result = _comparison(data_store, front_a, front_b)
+        if result is None:
+            return [], 1, 0
+
+        return frame_page(result, TABLE_COLUMNS, filter_query, sort_by, page_current, page_size,
+                          paging_restarted(ctx.triggered, 'front-diff-table'))
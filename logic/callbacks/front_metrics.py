@@ -0,0 +1,199 @@
+# logic/callbacks/front_metrics.py
+# Indicadores de calidad por frente (HV, IGD, IGD+, GD, Spread, Epsilon) en la pestaña Pareto.
+
+import base64
+import json
+
+from dash import Output, Input, State, dcc, html, dash_table
+from dash.exceptions import PreventUpdate
+import dash_bootstrap_components as dbc
+import numpy as np
+import plotly.graph_objects as go
+
+from logic.utils.data_validation import validate_json_structure
+from logic.utils.front_comparison import pairwise_front_comparison
+from logic.utils.hypervolume import parse_reference_point
+from logic.utils.objectives import get_dominance_objectives
+from logic.utils.quality_indicators import INDICATOR_COLUMNS, INDICATOR_LABELS, compute_front_indicators, format_indicator
+
+
+def decode_reference_front(contents, filename):
+    """Decode an uploaded reference front. Returns (store_data, error_message)."""
+    if not filename or not filename.endswith('.json'):
+        return None, "Only JSON files accepted"
+    try:
+        _, content_string = contents.split(',')
+        data = json.loads(base64.b64decode(content_string).decode('utf-8'))
+    except Exception as e:
+        return None, f"Error reading/decoding file - {str(e)}"
+
+    is_valid, msg = validate_json_structure(data)
+    if not is_valid:
+        return None, msg
+
+    # Sólo se guardan los valores numéricos (los genes no se usan como referencia)
+    solutions = [
+        {k: v for k, v in sol.items() if isinstance(v, (int, float)) and not isinstance(v, bool)}
+        for sol in data
+    ]
+    return {'filename': filename, 'solutions': solutions, 'active': True}, None
+
+
+def active_reference_solutions(reference_front):
+    """Solutions of the uploaded reference front when it is the selected reference set, else None."""
+    if reference_front and reference_front.get('active') and reference_front.get('solutions'):
+        return reference_front['solutions']
+    return None
+
+
+def register_front_metrics_callbacks(app):
+
+    # 1. Carga del frente de referencia
+    @app.callback(
+        [Output('reference-front-store', 'data'),
+         Output('reference-front-upload-label', 'children'),
+         Output('indicator-reference-source', 'value')],
+        Input('reference-front-upload', 'contents'),
+        State('reference-front-upload', 'filename'),
+        prevent_initial_call=True
+    )
+    def store_reference_front(contents, filename):
+        if not contents:
+            raise PreventUpdate
+
+        reference, error = decode_reference_front(contents, filename)
+        if error:
+            label = html.Span([html.I(className="bi bi-exclamation-triangle-fill me-2"), f"{filename}: {error}"],
+                              className="text-danger")
+            return None, label, 'merged'
+
+        label = html.Span([html.I(className="bi bi-check-circle-fill me-2"),
+                           f"{filename} ({len(reference['solutions'])} solutions)"], className="text-success")
+        return reference, label, 'uploaded'
+
+    # 1b. La fuente elegida se guarda con el frente (la usan también los reportes)
+    @app.callback(
+        Output('reference-front-store', 'data', allow_duplicate=True),
+        Input('indicator-reference-source', 'value'),
+        State('reference-front-store', 'data'),
+        prevent_initial_call=True
+    )
+    def update_reference_source(reference_source, reference_front):
+        if not reference_front or reference_front.get('active') == (reference_source == 'uploaded'):
+            raise PreventUpdate
+        return {**reference_front, 'active': reference_source == 'uploaded'}
+
+    # 2. Tabla de indicadores
+    @app.callback(
+        Output('front-indicators-container', 'children'),
+        Input('data-store', 'data'),
+        Input('indicator-reference-source', 'value'),
+        Input('reference-front-store', 'data'),
+        Input('main-tabs', 'active_tab'),
+        State('hv-reference-store', 'data')
+    )
+    def update_front_indicators(data_store, reference_source, reference_front, active_tab, hv_reference_text):
+        if active_tab != 'pareto-tab':
+            raise PreventUpdate
+
+        if not data_store or not data_store.get('fronts'):
+            return dbc.Alert("Load at least one front to compute quality indicators.",
+                             color="light", className="text-center small text-muted border-0 m-0")
+
+        if reference_source == 'uploaded' and not (reference_front or {}).get('solutions'):
+            return dbc.Alert("Upload a reference front (JSON with the same objectives) or use the merged set.",
+                             color="warning", className="small m-0")
+
+        reference_solutions = reference_front['solutions'] if reference_source == 'uploaded' else None
+        reference_point = parse_reference_point(hv_reference_text, len(get_dominance_objectives(data_store)))
+        rows, reference_label = compute_front_indicators(data_store, reference_solutions, reference_point)
+        if not rows:
+            return dbc.Alert("No numeric objectives available to compute indicators.",
+                             color="light", className="small m-0")
+
+        table_rows = [
+            {'front': r['front'], 'size': r['size'], **{c: format_indicator(r[c]) for c in INDICATOR_COLUMNS}}
+            for r in rows
+        ]
+        columns = [{'name': 'Front', 'id': 'front'}, {'name': 'Solutions', 'id': 'size'}] + \
+                  [{'name': INDICATOR_LABELS[c], 'id': c} for c in INDICATOR_COLUMNS]
+
+        table = dash_table.DataTable(
+            id='front-indicators-table',
+            data=table_rows,
+            columns=columns,
+            sort_action='native',
+            style_table={'overflowX': 'auto'},
+            style_header={'backgroundColor': '#f8f9fa', 'color': '#333', 'fontWeight': 'bold', 'borderBottom': '2px solid #dee2e6'},
+            style_cell={'textAlign': 'left', 'padding': '8px', 'fontFamily': 'sans-serif', 'fontSize': '0.9rem'},
+            style_data_conditional=[{'if': {'row_index': 'odd'}, 'backgroundColor': '#f8f9fa'}],
+        )
+
+        return html.Div([
+            table,
+            html.Small(
+                f"Reference set: {reference_label}. All indicators are computed in the normalized objective space "
+                "shared by the fronts. HV: higher is better; IGD, IGD+, GD, Spread and Eps+: lower is better.",
+                className="text-muted d-block mt-2"
+            )
+        ])
+
+    # 3. Comparación por pares (C-metric / soluciones dominadas)
+    @app.callback(
+        Output('front-comparison-container', 'children'),
+        Input('data-store', 'data'),
+        Input('front-comparison-metric', 'value'),
+        Input('main-tabs', 'active_tab')
+    )
+    def update_front_comparison(data_store, metric, active_tab):
+        if active_tab != 'pareto-tab':
+            raise PreventUpdate
+
+        comparison = pairwise_front_comparison(data_store)
+        if not comparison:
+            return dbc.Alert("Load (and show) at least two fronts to compare them.",
+                             color="light", className="text-center small text-muted border-0 m-0")
+
+        names = comparison['names']
+        sizes = comparison['sizes']
+        if metric == 'dominated':
+            z = comparison['dominated'].astype(float)
+            np.fill_diagonal(z, np.nan)
+            text = [[('' if i == j else f"{int(z[i][j])}/{sizes[j]}") for j in range(len(names))] for i in range(len(names))]
+            hover = "<b>%{y}</b> dominates %{z:.0f} solution(s) of <b>%{x}</b><extra></extra>"
+            colorbar_title = "Dominated"
+        else:
+            z = comparison['coverage']
+            text = [[('' if np.isnan(v) else f"{v:.2f}") for v in row] for row in z]
+            hover = "C(<b>%{y}</b>, <b>%{x}</b>) = %{z:.3f}<br>fraction of %{x} weakly dominated by %{y}<extra></extra>"
+            colorbar_title = "C(A,B)"
+
+        fig = go.Figure(go.Heatmap(
+            z=z,
+            x=names,
+            y=names,
+            text=text,
+            texttemplate="%{text}",
+            hovertemplate=hover,
+            colorscale='Blues',
+            zmin=0,
+            zmax=1 if metric != 'dominated' else None,
+            colorbar=dict(title=colorbar_title)
+        ))
+        fig.update_layout(
+            xaxis_title="B (compared front)",
+            yaxis_title="A (dominating front)",
+            yaxis=dict(autorange='reversed'),
+            plot_bgcolor='white', paper_bgcolor='white',
+            height=max(350, 40 * len(names) + 150),
+            margin=dict(l=60, r=30, t=30, b=60)
+        )
+
+        return html.Div([
+            dcc.Graph(figure=fig, config={'displayModeBar': False}),
+            html.Small(
+                "Row A vs column B. Coverage C(A,B) is the fraction of B's solutions weakly dominated by at least one "
+                "solution of A; C(A,B) = 1 and C(B,A) < 1 means A is better. Counts show B's solutions strictly dominated by A.",
+                className="text-muted d-block mt-2"
+            )
+        ])
@@ -0,0 +1,115 @@
+# logic/callbacks/front_playback.py
+# Reproducción de la evolución de los frentes (figura con frames: la animación y el slider corren en el navegador).
+
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from dash import Output, Input, State, dcc, html
+from dash.exceptions import PreventUpdate
+import dash_bootstrap_components as dbc
+
+from logic.utils.front_playback import playback_frames
+from logic.utils.hypervolume import parse_reference_point
+from logic.utils.objectives import get_dominance_objectives
+
+FRAME_DURATION_MS = 700
+
+
+def _frame_title(frame):
+    hv = "n/a" if frame['hv'] is None else f"{'' if frame['hv_exact'] else '≈'}{frame['hv']:.4f}"
+    shown = f" ({frame['shown']} shown)" if frame['shown'] < frame['size'] else ""
+    return (f"<b>{frame['name']}</b> | HV: {hv} | size: {frame['size']}{shown} | "
+            f"non-dominated on these axes: {frame['non_dominated']}")
+
+
+def build_playback_figure(playback, x_axis, y_axis):
+    """One figure with a Plotly frame per front: scatter (previous front faded) + HV trajectory."""
+    frames = playback['frames']
+    names = [f['name'] for f in frames]
+    hv_values = [f['hv'] for f in frames]
+
+    fig = make_subplots(rows=2, cols=1, row_heights=[0.72, 0.28], vertical_spacing=0.12)
+    first = frames[0]
+    fig.add_trace(go.Scatter(x=[], y=[], mode='markers', name='Previous front',
+                             marker=dict(size=7, color='rgba(150,150,150,0.35)')), row=1, col=1)
+    fig.add_trace(go.Scatter(x=first['x'], y=first['y'], mode='markers', name='Current front',
+                             marker=dict(size=8, color='#0d6efd', line=dict(width=0.5, color='white'))), row=1, col=1)
+    fig.add_trace(go.Scatter(x=names, y=hv_values, mode='lines+markers', name='Hypervolume',
+                             line=dict(color='#6c757d'), marker=dict(size=6)), row=2, col=1)
+    fig.add_trace(go.Scatter(x=[names[0]], y=[hv_values[0]], mode='markers', name='Current HV', showlegend=False,
+                             marker=dict(size=13, color='#dc3545')), row=2, col=1)
+
+    plotly_frames = []
+    for i, frame in enumerate(frames):
+        previous = frames[i - 1] if i > 0 else {'x': [], 'y': []}
+        plotly_frames.append(go.Frame(
+            name=frame['name'],
+            data=[
+                go.Scatter(x=previous['x'], y=previous['y']),
+                go.Scatter(x=frame['x'], y=frame['y']),
+                go.Scatter(x=[frame['name']], y=[frame['hv']]),
+            ],
+            traces=[0, 1, 3],
+            layout=go.Layout(title_text=_frame_title(frame))
+        ))
+    fig.frames = plotly_frames
+
+    step_args = {'mode': 'immediate', 'frame': {'duration': 0, 'redraw': True}, 'transition': {'duration': 0}}
+    fig.update_layout(
+        template='plotly_white', height=620, margin=dict(l=50, r=20, t=60, b=40),
+        title=dict(text=_frame_title(first), font=dict(size=13)),
+        legend=dict(orientation='h', y=1.02, x=1, xanchor='right', yanchor='bottom'),
+        updatemenus=[{
+            'type': 'buttons', 'direction': 'left', 'x': 0, 'y': -0.08, 'xanchor': 'left', 'yanchor': 'top',
+            'pad': {'r': 10, 't': 10},
+            'buttons': [
+                {'label': '▶ Play', 'method': 'animate',
+                 'args': [None, {'frame': {'duration': FRAME_DURATION_MS, 'redraw': True}, 'fromcurrent': True,
+                                 'transition': {'duration': 0}}]},
+                {'label': '❚❚ Pause', 'method': 'animate', 'args': [[None], step_args]},
+            ]
+        }],
+        sliders=[{
+            'active': 0, 'x': 0.15, 'y': -0.08, 'len': 0.85, 'xanchor': 'left', 'yanchor': 'top',
+            'currentvalue': {'prefix': 'Front: ', 'font': {'size': 12}},
+            'steps': [{'label': name, 'method': 'animate', 'args': [[name], step_args]} for name in names]
+        }]
+    )
+    # Rangos fijos: los ejes no saltan de un frame a otro
+    fig.update_xaxes(title_text=x_axis.replace('_', ' ').title(), range=playback['x_range'], row=1, col=1)
+    fig.update_yaxes(title_text=y_axis.replace('_', ' ').title(), range=playback['y_range'], row=1, col=1)
+    fig.update_xaxes(showticklabels=len(names) <= 30, row=2, col=1)
+    fig.update_yaxes(title_text='HV', row=2, col=1)
+    return fig
+
+
+def register_front_playback_callbacks(app):
+
+    @app.callback(
+        Output('front-playback-container', 'children'),
+        Input('front-playback-order', 'value'),
+        Input('data-store', 'data'),
+        Input('x-axis-store', 'data'),
+        Input('y-axis-store', 'data'),
+        Input('hv-reference-store', 'data'),
+        State('main-tabs', 'active_tab')
+    )
+    def update_front_playback(order, data_store, x_axis, y_axis, hv_reference_text, active_tab):
+        if active_tab != 'pareto-tab':
+            raise PreventUpdate
+
+        fronts = [f for f in (data_store or {}).get('fronts', []) if f.get('data')]
+        if len(fronts) < 2 or not x_axis or not y_axis:
+            return dbc.Alert("Load two or more fronts (e.g. successive generations) to play back their evolution.",
+                             color="light", className="text-center small text-muted border-0 m-0")
+
+        reference_point = parse_reference_point(hv_reference_text, len(get_dominance_objectives(data_store)))
+        playback = playback_frames(data_store, x_axis, y_axis, order or 'upload', reference_point)
+        if not playback or playback['x_range'] is None or playback['y_range'] is None:
+            return dbc.Alert("The fronts have no values on the plotted objectives.", color="light", className="small m-0")
+
+        return html.Div([
+            dcc.Graph(id='front-playback-graph', figure=build_playback_figure(playback, x_axis, y_axis),
+                      config={'responsive': True}),
+            html.Small("Every loaded front is one frame (hidden fronts included). HV is computed on all dominance "
+                       "objectives in the normalized space shared by the fronts.", className="text-muted d-block mt-1")
+        ])
@@ -0,0 +1,111 @@
+# logic/callbacks/gene_association.py
+# Asociación gen-objetivo: volcano plot (efecto vs significancia) + tabla ordenable calculada en el servidor.
+
+import numpy as np
+import plotly.graph_objects as go
+from dash import Output, Input, State, dcc, html, ctx
+from dash.exceptions import PreventUpdate
+import dash_bootstrap_components as dbc
+
+from logic.utils.gene_association import gene_association
+from logic.utils.objectives import get_dominance_objectives
+from logic.utils.table_query import frame_page, paging_restarted
+
+SIGNIFICANCE_LEVEL = 0.05
+TABLE_COLUMNS = ('gene', 'n_with', 'n_without', 'mean_with', 'mean_without', 'effect', 'p_value', 'q_value',
+                 'better_with_gene')
+EFFECT_LABELS = {'mannwhitney': 'Rank-biserial r', 'welch': "Hedges' g"}
+
+
+def build_volcano_figure(result, objective, test):
+    """Effect size vs -log10(p); FDR-significant genes colored by whether they go with better values."""
+    tested = result[result['p_value'].notna()]
+    significant = tested['q_value'].to_numpy() < SIGNIFICANCE_LEVEL
+    better = tested['better_with_gene'].to_numpy() == 'yes'
+    groups = [
+        (~significant, f"Not significant (q ≥ {SIGNIFICANCE_LEVEL})", 'rgba(140,140,140,0.45)'),
+        (significant & better, f"Better {objective} with gene", '#198754'),
+        (significant & ~better, f"Worse {objective} with gene", '#dc3545'),
+    ]
+    fig = go.Figure()
+    for mask, name, color in groups:
+        if not mask.any():
+            continue
+        subset = tested[mask]
+        fig.add_trace(go.Scattergl(
+            x=subset['effect'], y=-np.log10(np.maximum(subset['p_value'].to_numpy(dtype=float), 1e-300)),
+            mode='markers', name=name, marker=dict(size=7, color=color), text=subset['gene'],
+            customdata=np.stack([subset['q_value'], subset['n_with'], subset['mean_with'], subset['mean_without']], axis=-1),
+            hovertemplate=("<b>%{text}</b> (in %{customdata[1]} solutions)<br>effect: %{x:.3f}<br>"
+                           f"mean {objective} with / without: %{{customdata[2]:.4g}} / %{{customdata[3]:.4g}}<br>"
+                           "q = %{customdata[0]:.2e}<extra></extra>")
+        ))
+    fig.update_layout(
+        template='plotly_white', height=420, margin=dict(l=50, r=20, t=20, b=40),
+        xaxis_title=f"{EFFECT_LABELS[test]} (with gene vs without)", yaxis_title="-log10(p-value)",
+        legend=dict(orientation='h', y=1.02, x=1, xanchor='right', yanchor='bottom')
+    )
+    return fig
+
+
+def register_gene_association_callbacks(app):
+
+    # 1. Objetivos disponibles
+    @app.callback(
+        Output('gene-association-objective-select', 'options'),
+        Output('gene-association-objective-select', 'value'),
+        Input('data-store', 'data'),
+        State('gene-association-objective-select', 'value')
+    )
+    def update_association_objective_options(data_store, current):
+        objectives = get_dominance_objectives(data_store)
+        options = [{'label': obj.replace('_', ' ').title(), 'value': obj} for obj in objectives]
+        return options, current if current in objectives else (objectives[0] if objectives else None)
+
+    # 2. Resumen y volcano plot
+    @app.callback(
+        Output('gene-association-summary-container', 'children'),
+        Input('gene-association-objective-select', 'value'),
+        Input('gene-association-test', 'value'),
+        Input('data-store', 'data')
+    )
+    def update_association_view(objective, test, data_store):
+        result = gene_association(data_store, objective, test) if (data_store or {}).get('fronts') else None
+        if result is None:
+            return dbc.Alert("Load solutions with numeric objective values to test gene-objective associations.",
+                             color="light", className="text-center small text-muted border-0 m-0")
+
+        tested = result['p_value'].notna()
+        significant = result['q_value'] < SIGNIFICANCE_LEVEL
+        better = significant & (result['better_with_gene'] == 'yes')
+        return html.Div([
+            html.Small(f"{int(tested.sum())} of {len(result)} genes tested (present and absent in at least two "
+                       f"solutions each); {int(significant.sum())} associated at FDR < {SIGNIFICANCE_LEVEL}: "
+                       f"{int(better.sum())} with better and {int((significant & ~better).sum())} with worse "
+                       f"{objective}.", className="text-muted d-block mb-2"),
+            dcc.Graph(id='gene-association-graph', figure=build_volcano_figure(result, objective, test),
+                      config={'responsive': True}),
+        ])
+
+    # 3. Tabla (filtro, orden y paginación en el servidor)
+    @app.callback(
+        Output('gene-association-table', 'data'),
+        Output('gene-association-table', 'page_count'),
+        Output('gene-association-table', 'page_current'),
+        Input('gene-association-objective-select', 'value'),
+        Input('gene-association-test', 'value'),
+        Input('gene-association-table', 'filter_query'),
+        Input('gene-association-table', 'sort_by'),
+        Input('gene-association-table', 'page_current'),
+        Input('gene-association-table', 'page_size'),
+        State('data-store', 'data')
+    )
+    def update_association_table(objective, test, filter_query, sort_by, page_current, page_size, data_store):
+        if not (data_store or {}).get('fronts'):
+            raise PreventUpdate
+        result = gene_association(data_store, objective, test)
+        if result is None:
+            return [], 1, 0
+
+        return frame_page(result, TABLE_COLUMNS, filter_query, sort_by, page_current, page_size,
+                          paging_restarted(ctx.triggered, 'gene-association-table'))
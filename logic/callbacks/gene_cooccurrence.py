@@ -0,0 +1,108 @@
+# logic/callbacks/gene_cooccurrence.py
+# Co-ocurrencia de genes entre soluciones: red de los pares más co-seleccionados + tabla.
+
+import numpy as np
+import plotly.graph_objects as go
+from dash import Output, Input, dcc, html, dash_table
+import dash_bootstrap_components as dbc
+
+from logic.utils.gene_cooccurrence import PAIR_METRICS, cooccurrence_pairs, network_layout, top_pairs
+from logic.utils.gene_frequency import gene_frequencies
+
+METRIC_LABELS = {'count': 'Co-occurrence count', 'lift': 'Lift', 'pmi': 'PMI (bits)'}
+EDGE_WIDTHS = (1.0, 2.5, 4.5)
+MAX_TOP_PAIRS = 200
+
+
+def build_network_figure(pairs, metric, frequency):
+    """Genes as nodes (size = frequency), top pairs as edges (width = metric tercile)."""
+    genes = sorted(set(pairs['gene_a']) | set(pairs['gene_b']))
+    index = {gene: i for i, gene in enumerate(genes)}
+    edges = np.array([[index[a], index[b]] for a, b in zip(pairs['gene_a'], pairs['gene_b'])])
+    values = pairs[metric].to_numpy(dtype=float)
+    weights = values - values.min() if values.size else values
+    positions = network_layout(len(genes), edges, weights)
+
+    fig = go.Figure()
+    # Una traza por grosor de arista (Plotly no admite ancho por segmento)
+    bins = np.zeros(len(values), dtype=int) if np.ptp(values) == 0 else \
+        np.digitize(values, np.quantile(values, [1 / 3, 2 / 3]))
+    for level, width in enumerate(EDGE_WIDTHS):
+        members = np.flatnonzero(bins == level)
+        if members.size == 0:
+            continue
+        xs = np.column_stack([positions[edges[members, 0], 0], positions[edges[members, 1], 0],
+                              np.full(members.size, np.nan)]).ravel()
+        ys = np.column_stack([positions[edges[members, 0], 1], positions[edges[members, 1], 1],
+                              np.full(members.size, np.nan)]).ravel()
+        fig.add_trace(go.Scatter(x=xs, y=ys, mode='lines', line=dict(width=width, color='rgba(13,110,253,0.35)'),
+                                 hoverinfo='skip', showlegend=False))
+
+    gene_share = dict(zip(frequency.genes, frequency.counts / max(frequency.total_solutions, 1)))
+    shares = np.array([gene_share.get(g, 0.0) for g in genes])
+    degree = np.bincount(edges.ravel(), minlength=len(genes)) if len(edges) else np.zeros(len(genes), dtype=int)
+    fig.add_trace(go.Scatter(
+        x=positions[:, 0], y=positions[:, 1], mode='markers+text', text=genes, textposition='top center',
+        textfont=dict(size=10),
+        marker=dict(size=10 + 25 * shares, color=shares, colorscale='Blues', cmin=0, cmax=1, showscale=True,
+                    colorbar=dict(title='Freq.', tickformat='.0%'), line=dict(width=1, color='#495057')),
+        customdata=np.column_stack([shares, degree]),
+        hovertemplate="<b>%{text}</b><br>in %{customdata[0]:.1%} of solutions<br>%{customdata[1]} top pairs<extra></extra>",
+        showlegend=False
+    ))
+    fig.update_layout(
+        template='plotly_white', height=520, margin=dict(l=10, r=10, t=10, b=10),
+        xaxis=dict(visible=False), yaxis=dict(visible=False, scaleanchor='x'), hovermode='closest'
+    )
+    return fig
+
+
+def register_gene_cooccurrence_callbacks(app):
+
+    @app.callback(
+        Output('cooccurrence-container', 'children'),
+        Input('cooccurrence-metric', 'value'),
+        Input('cooccurrence-topk-input', 'value'),
+        Input('cooccurrence-min-count-input', 'value'),
+        Input('data-store', 'data')
+    )
+    def update_cooccurrence_view(metric, top_k, min_count, data_store):
+        if not (data_store or {}).get('fronts'):
+            return dbc.Alert("Load at least one front to analyze gene co-occurrence.",
+                             color="light", className="text-center small text-muted border-0 m-0")
+        metric = metric if metric in PAIR_METRICS else 'count'
+        top_k = int(np.clip(top_k or 30, 1, MAX_TOP_PAIRS))
+        pairs = top_pairs(cooccurrence_pairs(data_store, min_count or 2), metric, top_k)
+        if pairs is None or pairs.empty:
+            return dbc.Alert("No gene pair co-occurs in enough solutions. Lower the minimum count.",
+                             color="light", className="small m-0")
+
+        frequency = gene_frequencies(data_store)
+        table = dash_table.DataTable(
+            data=pairs.to_dict('records'),
+            columns=[
+                {'name': 'Gene A', 'id': 'gene_a'},
+                {'name': 'Gene B', 'id': 'gene_b'},
+                {'name': 'Count', 'id': 'count', 'type': 'numeric'},
+                {'name': 'Support', 'id': 'support', 'type': 'numeric', 'format': {'specifier': '.1%'}},
+                {'name': 'Lift', 'id': 'lift', 'type': 'numeric', 'format': {'specifier': '.2f'}},
+                {'name': 'PMI', 'id': 'pmi', 'type': 'numeric', 'format': {'specifier': '.2f'}},
+            ],
+            sort_action='native',
+            page_size=10,
+            style_table={'overflowX': 'auto'},
+            style_header={'backgroundColor': '#f8f9fa', 'color': '#333', 'fontWeight': 'bold',
+                          'borderBottom': '2px solid #dee2e6'},
+            style_cell={'textAlign': 'left', 'padding': '8px', 'fontFamily': 'sans-serif', 'fontSize': '0.9rem'},
+            style_data_conditional=[{'if': {'row_index': 'odd'}, 'backgroundColor': '#f8f9fa'}],
+        )
+        return dbc.Row([
+            dbc.Col([
+                dcc.Graph(id='cooccurrence-network-graph', figure=build_network_figure(pairs, metric, frequency),
+                          config={'responsive': True}),
+                html.Small(f"Top {len(pairs)} pairs by {METRIC_LABELS[metric].lower()}. Node size and color show "
+                           "how often each gene is selected; thicker edges rank higher.",
+                           className="text-muted d-block mt-1")
+            ], width=12, lg=7),
+            dbc.Col(table, width=12, lg=5),
+        ])
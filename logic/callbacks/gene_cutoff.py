@@ -0,0 +1,106 @@
+# logic/callbacks/gene_cutoff.py
+# Frecuencia de genes según un corte del objetivo: las curvas se calculan una sola vez (barrido acumulado)
+# y el gráfico solo selecciona las columnas de los genes elegidos.
+
+import plotly.express as px
+import plotly.graph_objects as go
+from dash import Output, Input, State, dcc, html
+import dash_bootstrap_components as dbc
+
+from logic.utils.gene_cutoff import curve_genes, frequency_curves
+from logic.utils.gene_frequency import gene_frequencies, top_genes
+from logic.utils.objectives import get_dominance_objectives, objective_directions
+
+DEFAULT_CURVE_GENES = 8
+MAX_GENE_OPTIONS = 2000
+
+
+def build_cutoff_figure(curves, genes, frequencies):
+    """One line per gene (frequency vs cutoff) plus the number of solutions kept on a secondary axis."""
+    objective = curves.objective.replace('_', ' ')
+    sign = '≤' if curves.direction == 'below' else '≥'
+    palette = px.colors.qualitative.Plotly
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=curves.cutoffs, y=curves.sizes, name="Solutions kept", yaxis='y2', mode='lines',
+        line=dict(color='rgba(108,117,125,0.5)', dash='dot', shape='hv'),
+        hovertemplate=f"{objective} {sign} %{{x:.4g}}: %{{y}} solutions<extra></extra>"
+    ))
+    for i, gene in enumerate(genes):
+        fig.add_trace(go.Scatter(
+            x=curves.cutoffs, y=frequencies[:, i], name=str(gene), mode='lines+markers',
+            line=dict(color=palette[i % len(palette)], width=2), marker=dict(size=5),
+            customdata=curves.sizes,
+            hovertemplate=(f"<b>{gene}</b><br>{objective} {sign} %{{x:.4g}}<br>"
+                           "frequency: %{y:.1%} of %{customdata} solutions<extra></extra>")
+        ))
+    fig.update_layout(
+        template='plotly_white', height=420, margin=dict(l=50, r=50, t=20, b=40), hovermode='closest',
+        xaxis_title=f"{objective} cutoff (solutions with {objective} {sign} cutoff)",
+        yaxis=dict(title="Gene frequency", tickformat='.0%', range=[0, 1.05]),
+        yaxis2=dict(title="Solutions kept", overlaying='y', side='right', showgrid=False, rangemode='tozero'),
+        legend=dict(orientation='h', y=1.02, x=1, xanchor='right', yanchor='bottom')
+    )
+    return fig
+
+
+def register_gene_cutoff_callbacks(app):
+
+    # 1. Objetivos y genes disponibles (por defecto, los más frecuentes)
+    @app.callback(
+        Output('gene-cutoff-objective-select', 'options'),
+        Output('gene-cutoff-objective-select', 'value'),
+        Output('gene-cutoff-genes-select', 'options'),
+        Output('gene-cutoff-genes-select', 'value'),
+        Input('data-store', 'data'),
+        State('gene-cutoff-objective-select', 'value'),
+        State('gene-cutoff-genes-select', 'value')
+    )
+    def update_cutoff_options(data_store, current_objective, current_genes):
+        objectives = get_dominance_objectives(data_store)
+        objective_options = [{'label': obj.replace('_', ' ').title(), 'value': obj} for obj in objectives]
+        objective = current_objective if current_objective in objectives else (objectives[0] if objectives else None)
+        if not (data_store or {}).get('fronts'):
+            return objective_options, objective, [], []
+
+        frequency = gene_frequencies(data_store)
+        ranked = top_genes(frequency, MAX_GENE_OPTIONS)
+        gene_options = [{'label': f"{gene} ({count})", 'value': gene} for gene, count in ranked]
+        available = {gene for gene, _ in ranked}
+        genes = [gene for gene in (current_genes or []) if gene in available]
+        return objective_options, objective, gene_options, genes or [gene for gene, _ in ranked[:DEFAULT_CURVE_GENES]]
+
+    # 2. Sentido del corte según el objetivo (minimizar: por debajo, maximizar: por encima)
+    @app.callback(
+        Output('gene-cutoff-direction', 'value'),
+        Input('gene-cutoff-objective-select', 'value'),
+        State('data-store', 'data')
+    )
+    def update_cutoff_direction(objective, data_store):
+        if not objective:
+            return 'below'
+        return 'above' if objective_directions(data_store, [objective])[0] == 'max' else 'below'
+
+    # 3. Curvas
+    @app.callback(
+        Output('gene-cutoff-container', 'children'),
+        Input('gene-cutoff-objective-select', 'value'),
+        Input('gene-cutoff-direction', 'value'),
+        Input('gene-cutoff-genes-select', 'value'),
+        Input('data-store', 'data')
+    )
+    def update_cutoff_curves(objective, direction, genes, data_store):
+        curves = frequency_curves(data_store, objective, direction) if (data_store or {}).get('fronts') else None
+        if curves is None:
+            return dbc.Alert("Load solutions with numeric objective values to follow gene frequencies across cutoffs.",
+                             color="light", className="text-center small text-muted border-0 m-0")
+        genes, frequencies = curve_genes(curves, list(genes or []))
+        if not genes:
+            return dbc.Alert("Select at least one gene.", color="light", className="text-center small text-muted border-0 m-0")
+
+        return html.Div([
+            html.Small(f"{len(curves.cutoffs)} cutoffs over {int(curves.sizes[-1])} solutions with a value for "
+                       f"{objective.replace('_', ' ')}.", className="text-muted d-block mb-2"),
+            dcc.Graph(id='gene-cutoff-graph', figure=build_cutoff_figure(curves, genes, frequencies),
+                      config={'responsive': True}),
+        ])
@@ -0,0 +1,218 @@
+# logic/callbacks/gene_embedding.py
+# Mapa 2D de las soluciones en el espacio de genes (PCA precalculado en segundo plano), enlazado con la selección Pareto.
+# El intervalo sondea solo la clave del trabajo (gene-embedding-version-store); el mapa se redibuja al cambiar su estado.
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.express as px
+from dash import Output, Input, State, dcc, html, ctx, no_update
+from dash.exceptions import PreventUpdate
+import dash_bootstrap_components as dbc
+
+from logic.utils.gene_embedding import (
+    cancel_gene_embedding, embedding_key, embedding_status, schedule_gene_embedding
+)
+from logic.utils.gene_sets import gene_incidence
+from logic.utils.objectives import get_dominance_objectives
+
+
+def _selection_entry(front, sol, x_axis, y_axis):
+    unique_id = f"{sol.get('solution_id', 'N/A')}|{front['name']}"
+    sol_data = dict(sol)
+    sol_data['front_name'] = front['name']
+    sol_data['unique_id'] = unique_id
+    sol_data['x'] = sol.get(x_axis)
+    sol_data['y'] = sol.get(y_axis)
+    sol_data['objectives'] = front.get('objectives', [])
+    return {
+        'id': sol.get('solution_id', 'N/A'),
+        'front_name': front['name'],
+        'unique_id': unique_id,
+        'x': sol_data['x'],
+        'y': sol_data['y'],
+        'objectives': sol_data['objectives'],
+        'full_data': sol_data
+    }
+
+
+def register_gene_embedding_callbacks(app):
+
+    # 1. Precalcular el embedding en segundo plano en cuanto cambian los datos (único callback del sondeo que lee data-store)
+    @app.callback(
+        Output('gene-embedding-version-store', 'data'),
+        Output('gene-embedding-interval', 'disabled'),
+        Input('data-store', 'data'),
+        State('gene-embedding-version-store', 'data')
+    )
+    def schedule_embedding(data_store, previous_state):
+        previous_key = (previous_state or {}).get('key')
+        if not (data_store or {}).get('fronts'):
+            cancel_gene_embedding(previous_key)
+            return None, True
+        key = schedule_gene_embedding(data_store)
+        # El embedding de la versión anterior ya no se muestra: si sigue en cola, no llega a calcularse
+        if previous_key != key:
+            cancel_gene_embedding(previous_key)
+        status, _ = embedding_status(key)
+        return {'key': key, 'status': status}, status != 'running'
+
+    # 2. Sondeo del cálculo: solo lee la clave del trabajo
+    @app.callback(
+        Output('gene-embedding-version-store', 'data', allow_duplicate=True),
+        Output('gene-embedding-interval', 'disabled', allow_duplicate=True),
+        Input('gene-embedding-interval', 'n_intervals'),
+        State('gene-embedding-version-store', 'data'),
+        prevent_initial_call=True
+    )
+    def poll_embedding(n_intervals, state):
+        if not state:
+            return no_update, True
+        status, _ = embedding_status(state['key'])
+        if status == 'running':
+            return no_update, False
+        return {**state, 'status': status}, True
+
+    # 3. Opciones de color (frente, nº de genes u objetivos)
+    @app.callback(
+        Output('gene-embedding-color-select', 'options'),
+        Input('data-store', 'data')
+    )
+    def update_embedding_color_options(data_store):
+        objectives = get_dominance_objectives(data_store)
+        return [{'label': 'Front', 'value': '__front__'}, {'label': 'Number of genes', 'value': '__genes__'}] + \
+               [{'label': obj.replace('_', ' ').title(), 'value': obj} for obj in objectives]
+
+    # 4. Mapa (se redibuja cuando el sondeo cambia el estado del trabajo, no en cada intervalo)
+    @app.callback(
+        Output('gene-embedding-container', 'children'),
+        Input('gene-embedding-color-select', 'value'),
+        Input('gene-embedding-version-store', 'data'),
+        Input('data-store', 'data'),
+        Input('selected-solutions-store', 'data')
+    )
+    def update_gene_embedding(color_by, state, data_store, selected_solutions):
+        if not (data_store or {}).get('fronts') or not state:
+            return dbc.Alert("Load at least one front to map its solutions in gene space.",
+                             color="light", className="text-center small text-muted border-0 m-0")
+        if state['key'] != embedding_key(data_store):
+            raise PreventUpdate
+
+        status, embedding = embedding_status(state['key'])
+        if status == 'running':
+            return html.Div([
+                dbc.Spinner(size="sm", color="primary", spinner_class_name="me-2"),
+                html.Small("Computing the gene-space embedding in the background...", className="text-muted")
+            ], className="d-flex align-items-center justify-content-center p-4")
+        if status == 'failed':
+            return dbc.Alert(f"The embedding could not be computed: {embedding}", color="warning", className="small m-0")
+        if status == 'idle':
+            return dbc.Alert("The embedding computation was interrupted. Change or reload the data to compute it again.",
+                             color="light", className="text-center small text-muted border-0 m-0")
+
+        # Mismas filas que el embedding, con los nombres actuales de los frentes
+        incidence = gene_incidence(data_store, visible_only=False)
+        coordinates = embedding['coordinates']
+        fronts = {f['id']: f for f in data_store.get('fronts', [])}
+        visible_fronts = [i for i, fid in enumerate(incidence.front_ids) if fronts.get(fid, {}).get('visible', True)]
+        rows = np.flatnonzero(np.isin(incidence.front_index, visible_fronts))
+        if rows.size == 0:
+            return dbc.Alert("No visible solutions.", color="light", className="small m-0")
+
+        unique_ids = np.array(incidence.unique_ids, dtype=object)
+        hover = [f"{incidence.solution_ids[r]} ({incidence.front_names[incidence.front_index[r]]})<br>"
+                 f"{int(incidence.sizes[r])} genes" for r in rows]
+        hovertemplate = "%{text}<extra></extra>"
+
+        fig = go.Figure()
+        color_by = color_by or '__front__'
+        if color_by == '__front__':
+            palette = px.colors.qualitative.Plotly
+            for position in visible_fronts:
+                members = rows[incidence.front_index[rows] == position]
+                if members.size == 0:
+                    continue
+                fig.add_trace(go.Scattergl(
+                    x=coordinates[members, 0], y=coordinates[members, 1], mode='markers',
+                    marker=dict(size=7, opacity=0.75, color=palette[position % len(palette)]),
+                    name=incidence.front_names[position],
+                    text=[hover[i] for i in np.searchsorted(rows, members)],
+                    customdata=unique_ids[members], hovertemplate=hovertemplate
+                ))
+        else:
+            if color_by == '__genes__':
+                values, title = incidence.sizes[rows], "Genes"
+            else:
+                values = np.array([
+                    fronts[incidence.front_ids[incidence.front_index[r]]]['data'][incidence.positions[r]].get(color_by)
+                    for r in rows
+                ], dtype=float)
+                title = color_by.replace('_', ' ').title()
+            fig.add_trace(go.Scattergl(
+                x=coordinates[rows, 0], y=coordinates[rows, 1], mode='markers',
+                marker=dict(size=7, opacity=0.8, color=values, colorscale='Viridis', showscale=True,
+                            colorbar=dict(title=title)),
+                name=title, text=hover, customdata=unique_ids[rows], hovertemplate=hovertemplate, showlegend=False
+            ))
+
+        # Soluciones seleccionadas en el gráfico de Pareto
+        selected_ids = {s['unique_id'] for s in (selected_solutions or [])}
+        if selected_ids:
+            highlighted = rows[np.isin(unique_ids[rows], list(selected_ids))]
+            if highlighted.size:
+                fig.add_trace(go.Scattergl(
+                    x=coordinates[highlighted, 0], y=coordinates[highlighted, 1], mode='markers',
+                    marker=dict(size=13, color='rgba(0,0,0,0)', line=dict(width=2, color='#dc3545')),
+                    name='Selected', customdata=unique_ids[highlighted], hoverinfo='skip'
+                ))
+
+        pc1, pc2 = embedding['explained']
+        fig.update_layout(
+            template='plotly_white', height=480, margin=dict(l=40, r=20, t=20, b=40),
+            xaxis_title=f"PC1 ({pc1:.1%} of gene-set variance)", yaxis_title=f"PC2 ({pc2:.1%})",
+            dragmode='lasso', clickmode='event+select'
+        )
+        return html.Div([
+            dcc.Graph(id='gene-embedding-graph', figure=fig, config={'responsive': True}),
+            html.Small("Nearby points share many genes. Click or lasso points to add them to the Pareto selection "
+                       "(selected solutions are circled in red).", className="text-muted d-block mt-1")
+        ])
+
+    # 5. Click / lasso en el mapa -> selección del gráfico de Pareto
+    @app.callback(
+        Output('selected-solutions-store', 'data', allow_duplicate=True),
+        Input('gene-embedding-graph', 'clickData'),
+        Input('gene-embedding-graph', 'selectedData'),
+        State('selected-solutions-store', 'data'),
+        State('data-store', 'data'),
+        State('x-axis-store', 'data'),
+        State('y-axis-store', 'data'),
+        prevent_initial_call=True
+    )
+    def select_from_embedding(click_data, selected_data, current_selection, data_store, x_axis, y_axis):
+        event = selected_data if ctx.triggered and ctx.triggered[0]['prop_id'].endswith('selectedData') else click_data
+        picked = [p.get('customdata') for p in (event or {}).get('points', []) if p.get('customdata')]
+        if not picked or not data_store:
+            raise PreventUpdate
+
+        # x/y deben ser los ejes del gráfico de Pareto (la consolidación los reinyecta en esas claves)
+        if not x_axis or not y_axis:
+            axes = list(data_store.get('main_objectives') or data_store.get('explicit_objectives') or [])
+            x_axis, y_axis = x_axis or (axes + [None])[0], y_axis or (axes + [None, None])[1]
+        picked_fronts = {uid.partition('|')[2] for uid in picked}
+        lookup = {
+            f"{sol.get('solution_id', 'N/A')}|{front['name']}": (front, sol)
+            for front in data_store.get('fronts', []) if front['name'] in picked_fronts
+            for sol in front.get('data', [])
+        }
+        current_selection = current_selection or []
+        existing_ids = {s['unique_id'] for s in current_selection}
+        new_selections = []
+        for unique_id in picked:
+            if unique_id in existing_ids or unique_id not in lookup:
+                continue
+            existing_ids.add(unique_id)
+            new_selections.append(_selection_entry(*lookup[unique_id], x_axis, y_axis))
+
+        if not new_selections:
+            raise PreventUpdate
+        return current_selection + new_selections
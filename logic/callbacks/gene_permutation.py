@@ -0,0 +1,150 @@
+# logic/callbacks/gene_permutation.py
+# Test de permutación de la frecuencia de genes: se lanza en segundo plano, se sondea el progreso con un
+# intervalo (solo con la clave del trabajo, legible desde cualquier proceso del servidor) y el resultado
+# alimenta un gráfico y una tabla calculada en el servidor.
+
+import numpy as np
+import plotly.graph_objects as go
+from dash import Output, Input, State, dcc, html, ctx, no_update
+import dash_bootstrap_components as dbc
+
+from logic.utils.gene_permutation import (
+    cancel_permutation_test, clip_permutations, job_status, permutation_job_key, schedule_permutation_test
+)
+from logic.utils.table_query import frame_page, paging_restarted
+
+SIGNIFICANCE_LEVEL = 0.05
+TABLE_COLUMNS = ('gene', 'count', 'frequency', 'expected', 'fold', 'p_value', 'q_value')
+
+
+def build_permutation_figure(result, n_permutations):
+    """Observed frequency vs -log10(empirical p); the dashed lines are the null expectation and the p-value floor."""
+    significant = result['q_value'].to_numpy() < SIGNIFICANCE_LEVEL
+    fig = go.Figure()
+    for mask, name, color in ((~significant, f"Not significant (q ≥ {SIGNIFICANCE_LEVEL})", 'rgba(140,140,140,0.45)'),
+                              (significant, "Enriched", '#198754')):
+        if not mask.any():
+            continue
+        subset = result[mask]
+        fig.add_trace(go.Scattergl(
+            x=subset['frequency'], y=-np.log10(subset['p_value'].to_numpy(dtype=float)),
+            mode='markers', name=name, marker=dict(size=7, color=color), text=subset['gene'],
+            customdata=np.stack([subset['count'], subset['fold'], subset['q_value']], axis=-1),
+            hovertemplate=("<b>%{text}</b> (in %{customdata[0]} solutions)<br>frequency: %{x:.1%}<br>"
+                           "fold over expected: %{customdata[1]:.2f}<br>q = %{customdata[2]:.2e}<extra></extra>")
+        ))
+    fig.add_vline(x=float(result['expected'].iloc[0]), line_dash='dash', line_color='#6c757d',
+                  annotation_text="expected", annotation_position="top")
+    fig.add_hline(y=np.log10(n_permutations + 1), line_dash='dot', line_color='#adb5bd',
+                  annotation_text=f"smallest p with {n_permutations} permutations", annotation_position="bottom right")
+    fig.update_layout(
+        template='plotly_white', height=400, margin=dict(l=50, r=20, t=20, b=40),
+        xaxis=dict(title="Observed frequency", tickformat='.0%'), yaxis_title="-log10(empirical p-value)",
+        legend=dict(orientation='h', y=1.02, x=1, xanchor='right', yanchor='bottom')
+    )
+    return fig
+
+
+def _progress_bar(fraction):
+    return dbc.Progress(value=round(fraction * 100), label=f"{fraction:.0%}", striped=True, animated=True,
+                        className="mb-3", style={'height': '18px'})
+
+
+def register_gene_permutation_callbacks(app):
+
+    # 1. Lanzar el test (botón) o recuperar su estado al cambiar los datos: único callback que recibe data-store
+    @app.callback(
+        Output('gene-permutation-state-store', 'data'),
+        Output('gene-permutation-interval', 'disabled'),
+        Input('gene-permutation-run-btn', 'n_clicks'),
+        Input('data-store', 'data'),
+        State('gene-permutation-count-input', 'value'),
+        State('gene-permutation-state-store', 'data')
+    )
+    def update_permutation_job(n_clicks, data_store, n_permutations, previous_state):
+        previous_key = (previous_state or {}).get('key')
+        if not (data_store or {}).get('fronts'):
+            cancel_permutation_test(previous_key)
+            return None, True
+        n_permutations = clip_permutations(n_permutations)
+        if ctx.triggered_id == 'gene-permutation-run-btn':
+            key = schedule_permutation_test(data_store, n_permutations)
+        else:
+            key = permutation_job_key(data_store, n_permutations)
+        # El trabajo que se mostraba (otros datos u otro nº de permutaciones) ya no se sondea: se cancela
+        if previous_key != key:
+            cancel_permutation_test(previous_key)
+        status, _ = job_status(key)
+        return {'key': key, 'permutations': n_permutations, 'status': status}, status != 'running'
+
+    # 2. Sondeo del progreso: solo lee la clave del trabajo (no se reenvía data-store en cada intervalo)
+    @app.callback(
+        Output('gene-permutation-progress', 'children'),
+        Output('gene-permutation-state-store', 'data', allow_duplicate=True),
+        Output('gene-permutation-interval', 'disabled', allow_duplicate=True),
+        Input('gene-permutation-interval', 'n_intervals'),
+        State('gene-permutation-state-store', 'data'),
+        prevent_initial_call=True
+    )
+    def poll_permutation_job(n_intervals, state):
+        if not state:
+            return None, no_update, True
+        status, payload = job_status(state['key'])
+        if status == 'running':
+            return _progress_bar(payload), no_update, False
+        return None, {**state, 'status': status}, True
+
+    # 3. Resultado (resumen + gráfico) del trabajo de la clave actual
+    @app.callback(
+        Output('gene-permutation-container', 'children'),
+        Input('gene-permutation-state-store', 'data')
+    )
+    def update_permutation_view(state):
+        if not state:
+            return dbc.Alert("Load at least one front to test its gene frequencies.",
+                             color="light", className="text-center small text-muted border-0 m-0")
+
+        n_permutations = state['permutations']
+        status, payload = job_status(state['key'])
+        if status == 'idle':
+            return html.Small(f"Press Run Test to compare the observed gene frequencies with {n_permutations} "
+                              "permutations.", className="text-muted d-block mb-2")
+        if status == 'running':
+            return html.Small(f"Running {n_permutations} permutations in the background...",
+                              className="text-muted d-block mb-1")
+        if status == 'failed':
+            return dbc.Alert(f"The permutation test could not be run: {payload}", color="warning", className="small m-0")
+        if payload is None:
+            return dbc.Alert("No genes to test in the visible fronts.", color="light",
+                             className="text-center small text-muted border-0 m-0")
+
+        significant = int((payload['q_value'] < SIGNIFICANCE_LEVEL).sum())
+        return html.Div([
+            html.Small(f"{significant} of {len(payload)} genes are selected more often than expected by chance "
+                       f"(FDR < {SIGNIFICANCE_LEVEL}, {n_permutations} permutations). Under the null every gene is "
+                       f"expected in {payload['expected'].iloc[0]:.1%} of the solutions.",
+                       className="text-muted d-block mb-2"),
+            dcc.Graph(id='gene-permutation-graph', figure=build_permutation_figure(payload, n_permutations),
+                      config={'responsive': True}),
+        ])
+
+    # 4. Tabla (filtro, orden y paginación en el servidor)
+    @app.callback(
+        Output('gene-permutation-table', 'data'),
+        Output('gene-permutation-table', 'page_count'),
+        Output('gene-permutation-table', 'page_current'),
+        Input('gene-permutation-state-store', 'data'),
+        Input('gene-permutation-table', 'filter_query'),
+        Input('gene-permutation-table', 'sort_by'),
+        Input('gene-permutation-table', 'page_current'),
+        Input('gene-permutation-table', 'page_size')
+    )
+    def update_permutation_table(state, filter_query, sort_by, page_current, page_size):
+        if not state or state.get('status') != 'ready':
+            return [], 1, 0
+        _, result = job_status(state['key'])
+        if result is None:
+            return [], 1, 0
+
+        return frame_page(result, TABLE_COLUMNS, filter_query, sort_by, page_current, page_size,
+                          paging_restarted(ctx.triggered, 'gene-permutation-table'))
@@ -0,0 +1,168 @@
+# logic/callbacks/gene_similarity.py
+# Similitud entre soluciones según sus genes (heatmap agrupado + búsqueda de soluciones similares).
+
+from dash import Output, Input, State, dcc, html, dash_table
+from dash.exceptions import PreventUpdate
+import dash_bootstrap_components as dbc
+import plotly.graph_objects as go
+
+from logic.utils.gene_sets import gene_incidence
+from logic.utils.gene_similarity import clustered_similarity, similar_solutions
+from logic.utils.objectives import get_dominance_objectives
+
+MAX_QUERY_OPTIONS = 50
+
+
+def _solution_label(unique_id):
+    solution_id, _, front_name = unique_id.partition('|')
+    return f"{solution_id} ({front_name})"
+
+
+def register_gene_similarity_callbacks(app):
+
+    # 1. Opciones de frente
+    @app.callback(
+        Output('similarity-front-select', 'options'),
+        Input('data-store', 'data')
+    )
+    def update_similarity_front_options(data_store):
+        fronts = [f for f in (data_store or {}).get('fronts', []) if f.get('visible', True)]
+        return [{'label': 'All visible fronts', 'value': 'all'}] + \
+               [{'label': f['name'], 'value': f['id']} for f in fronts]
+
+    # 2. Heatmap agrupado
+    @app.callback(
+        Output('similarity-heatmap-container', 'children'),
+        Input('data-store', 'data'),
+        Input('similarity-front-select', 'value'),
+        Input('similarity-metric', 'value')
+    )
+    def update_similarity_heatmap(data_store, front_id, metric):
+        result = clustered_similarity(data_store, front_id, metric)
+        if not result:
+            return dbc.Alert("At least two visible solutions are needed to compare gene sets.",
+                             color="light", className="text-center small text-muted border-0 m-0")
+
+        labels = [_solution_label(uid) for uid in result['labels']]
+        fig = go.Figure(go.Heatmap(
+            z=result['similarity'],
+            x=labels,
+            y=labels,
+            customdata=[result['labels']] * len(labels),
+            colorscale='Viridis',
+            zmin=0,
+            zmax=1,
+            hovertemplate="<b>%{y}</b><br>vs %{x}<br>similarity: %{z:.3f}<extra></extra>",
+            colorbar=dict(title=metric.title() if metric else "Jaccard")
+        ))
+        show_ticks = len(labels) <= 40
+        fig.update_layout(
+            xaxis=dict(showticklabels=show_ticks, tickangle=-45),
+            yaxis=dict(showticklabels=show_ticks, autorange='reversed'),
+            plot_bgcolor='white', paper_bgcolor='white',
+            height=550,
+            margin=dict(l=40, r=30, t=20, b=40)
+        )
+
+        shown = len(labels)
+        note = "Rows and columns are ordered by average-linkage clustering on 1 - similarity."
+        if shown < result['total']:
+            note += f" Showing an evenly spaced sample of {shown} of {result['total']} solutions."
+
+        return html.Div([
+            dcc.Graph(id='similarity-heatmap', figure=fig, config={'displayModeBar': False}),
+            html.Small(note, className="text-muted d-block mt-2")
+        ])
+
+    # 3. Opciones de búsqueda (filtradas en el servidor)
+    @app.callback(
+        Output('similarity-query-select', 'options'),
+        Input('similarity-query-select', 'search_value'),
+        State('similarity-query-select', 'value'),
+        State('data-store', 'data')
+    )
+    def update_similarity_query_options(search_value, current_value, data_store):
+        if not data_store or not data_store.get('fronts'):
+            raise PreventUpdate
+        incidence = gene_incidence(data_store)
+        needle = (search_value or '').lower()
+        options = []
+        for uid in incidence.unique_ids:
+            if needle in uid.lower():
+                options.append({'label': _solution_label(uid), 'value': uid})
+                if len(options) >= MAX_QUERY_OPTIONS:
+                    break
+        if current_value and current_value not in {o['value'] for o in options}:
+            options.insert(0, {'label': _solution_label(current_value), 'value': current_value})
+        return options
+
+    # 4. Clic en el heatmap -> solución consultada
+    @app.callback(
+        Output('similarity-query-select', 'value'),
+        Input('similarity-heatmap', 'clickData'),
+        prevent_initial_call=True
+    )
+    def select_similarity_query(click_data):
+        if not click_data or not click_data.get('points'):
+            raise PreventUpdate
+        unique_id = click_data['points'][0].get('customdata')
+        if not unique_id:
+            raise PreventUpdate
+        return unique_id
+
+    # 5. Soluciones más similares
+    @app.callback(
+        Output('similarity-results-container', 'children'),
+        Input('similarity-query-select', 'value'),
+        Input('similarity-topk-input', 'value'),
+        Input('similarity-metric', 'value'),
+        State('data-store', 'data')
+    )
+    def update_similar_solutions(unique_id, top_k, metric, data_store):
+        if not unique_id or not data_store:
+            return html.Small("Select a solution (or click a heatmap cell) to list its most similar solutions.",
+                              className="text-muted")
+
+        neighbours = similar_solutions(data_store, unique_id, int(top_k or 10), metric)
+        if not neighbours:
+            return dbc.Alert("The selected solution is not among the visible solutions.", color="light", className="small m-0")
+
+        incidence = gene_incidence(data_store)
+        fronts = {f['id']: f for f in data_store.get('fronts', [])}
+        objectives = get_dominance_objectives(data_store)
+        rows = []
+        for row, similarity, shared in neighbours:
+            front = fronts[incidence.front_ids[incidence.front_index[row]]]
+            solution = front['data'][incidence.positions[row]]
+            rows.append({
+                'solution_id': solution.get('solution_id', 'N/A'),
+                'front': front['name'],
+                'similarity': round(similarity, 4),
+                'shared': shared,
+                'genes': int(incidence.sizes[row]),
+                **{obj: solution.get(obj) for obj in objectives}
+            })
+
+        columns = [
+            {'name': 'Solution', 'id': 'solution_id'},
+            {'name': 'Front', 'id': 'front'},
+            {'name': (metric or 'jaccard').title(), 'id': 'similarity', 'type': 'numeric'},
+            {'name': 'Shared Genes', 'id': 'shared', 'type': 'numeric'},
+            {'name': 'Genes', 'id': 'genes', 'type': 'numeric'},
+        ] + [{'name': obj.replace('_', ' ').title(), 'id': obj, 'type': 'numeric', 'format': {'specifier': '.4~f'}}
+             for obj in objectives]
+
+        return html.Div([
+            html.H6(f"Most similar to {_solution_label(unique_id)} ({int(incidence.sizes[incidence.unique_ids.index(unique_id)])} genes)",
+                    className="fw-bold mb-2"),
+            dash_table.DataTable(
+                data=rows,
+                columns=columns,
+                sort_action='native',
+                page_size=15,
+                style_table={'overflowX': 'auto'},
+                style_header={'backgroundColor': '#f8f9fa', 'color': '#333', 'fontWeight': 'bold', 'borderBottom': '2px solid #dee2e6'},
+                style_cell={'textAlign': 'left', 'padding': '8px', 'fontFamily': 'sans-serif', 'fontSize': '0.9rem'},
+                style_data_conditional=[{'if': {'row_index': 'odd'}, 'backgroundColor': '#f8f9fa'}],
+            )
+        ])
@@ -0,0 +1,78 @@
+# logic/callbacks/gene_stability.py
+# Estabilidad de la selección de genes (Kuncheva, Jaccard, curvas de probabilidad de selección) por frente y combinada.
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.express as px
+from dash import Output, Input, dcc, html, dash_table
+import dash_bootstrap_components as dbc
+
+from logic.utils.gene_stability import POOLED_LABEL, format_stability, stability_indices
+
+
+def build_selection_curves_figure(curves):
+    """Selection probability of each gene (decreasing) per front; the pooled curve is dashed."""
+    palette = px.colors.qualitative.Plotly
+    fig = go.Figure()
+    for i, (label, curve) in enumerate(curves.items()):
+        pooled = label == POOLED_LABEL
+        fig.add_trace(go.Scattergl(
+            x=np.arange(1, curve.size + 1), y=curve, mode='lines', name=label,
+            line=dict(width=3 if pooled else 2, dash='dash' if pooled else 'solid',
+                      color='#212529' if pooled else palette[i % len(palette)]),
+            hovertemplate=f"<b>{label}</b><br>gene rank %{{x}}<br>selected by %{{y:.1%}} of solutions<extra></extra>"
+        ))
+    fig.add_hline(y=0.5, line=dict(color='#adb5bd', dash='dot'))
+    fig.update_layout(
+        template='plotly_white', height=380, margin=dict(l=50, r=20, t=20, b=40),
+        xaxis=dict(title="Gene rank (most selected first)", type='log'),
+        yaxis=dict(title="Selection probability", tickformat='.0%', range=[0, 1.03]),
+        legend=dict(orientation='h', y=1.02, x=1, xanchor='right', yanchor='bottom')
+    )
+    return fig
+
+
+def register_gene_stability_callbacks(app):
+
+    @app.callback(
+        Output('gene-stability-container', 'children'),
+        Input('data-store', 'data')
+    )
+    def update_gene_stability(data_store):
+        stability = stability_indices(data_store) if (data_store or {}).get('fronts') else None
+        if not stability:
+            return dbc.Alert("Load solutions with selected genes to measure selection stability.",
+                             color="light", className="text-center small text-muted border-0 m-0")
+
+        rows = [{
+            'front': r['front'], 'solutions': r['solutions'], 'mean_size': round(r['mean_size'], 2),
+            'genes': r['genes'], 'core_genes': r['core_genes'],
+            'kuncheva': format_stability(r['kuncheva']), 'jaccard': format_stability(r['jaccard']),
+        } for r in stability['rows']]
+        table = dash_table.DataTable(
+            data=rows,
+            columns=[
+                {'name': 'Front', 'id': 'front'},
+                {'name': 'Solutions', 'id': 'solutions'},
+                {'name': 'Mean Genes', 'id': 'mean_size'},
+                {'name': 'Distinct Genes', 'id': 'genes'},
+                {'name': 'Genes ≥ 50%', 'id': 'core_genes'},
+                {'name': 'Kuncheva Index', 'id': 'kuncheva'},
+                {'name': 'Jaccard Stability', 'id': 'jaccard'},
+            ],
+            style_table={'overflowX': 'auto'},
+            style_header={'backgroundColor': '#f8f9fa', 'color': '#333', 'fontWeight': 'bold',
+                          'borderBottom': '2px solid #dee2e6'},
+            style_cell={'textAlign': 'left', 'padding': '8px', 'fontFamily': 'sans-serif', 'fontSize': '0.9rem'},
+            style_data_conditional=[
+                {'if': {'row_index': 'odd'}, 'backgroundColor': '#f8f9fa'},
+                {'if': {'filter_query': f'{{front}} = "{POOLED_LABEL}"'}, 'fontWeight': 'bold'},
+            ],
+        )
+        return html.Div([
+            table,
+            html.Small("Kuncheva: 0 = overlap expected by chance, 1 = identical gene subsets. Jaccard: mean pairwise "
+                       "|A∩B| / |A∪B| between the solutions' subsets.", className="text-muted d-block mt-1 mb-3"),
+            dcc.Graph(id='gene-stability-curves', figure=build_selection_curves_figure(stability['curves']),
+                      config={'responsive': True}),
+        ])
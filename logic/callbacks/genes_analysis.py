@@ -8,9 +8,14 @@ import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 import numpy as np
-from io import StringIO 
 from datetime import datetime
 
+from logic.utils.gene_frequency import conserved_genes, gene_frequencies, genes_at_percentage, percentage_groups
+from logic.utils.genes_table import (
+    column_values, filter_pairs, genes_of_pairs, genes_table, is_numeric_column,
+    metric_distribution, page_records, sorted_pairs
+)
+
 def register_genes_analysis_callbacks(app):
 
     # --- CALLBACK 1: PROCESAR DATOS Y ANÁLISIS COMÚN (CON PREPARACIÓN PARA EXPANSIÓN) ---
@@ -24,48 +29,33 @@ def register_genes_analysis_callbacks(app):
             return dbc.Alert("No data loaded. Please upload a file and select a range.", color="warning"), None
 
         all_solutions_list = []
-        available_objectives = []
-        genes_data = []
-
         for front in data.get("fronts", []):
-            if not front.get("visible", True):
-                continue
-                
-            front_name = front.get("name", "Unknown Front")
-            solutions_data = front.get("data", [])
-            all_solutions_list.extend(solutions_data)
-
-            if not solutions_data:
-                continue
-
-            if not available_objectives:
-                available_objectives = data.get('explicit_objectives', [])
-
-            for solution in solutions_data:
-                sol_id = solution.get('solution_id', 'N/A')
-                unique_sol_id = f"{front_name} - {sol_id}"
-                
-                for gene in solution.get('selected_genes', []):
-                    row = {
-                        'front_name': front_name, 
-                        'unique_solution_id': unique_sol_id, 
-                        'solution_id': sol_id, 
-                        'gene': gene
-                    }
-                    for objective in available_objectives:
-                        row[objective] = solution.get(objective, None)
-                    genes_data.append(row)
+            if front.get("visible", True):
+                all_solutions_list.extend(front.get("data", []))
 
         if not all_solutions_list:
             return dbc.Alert("No solutions visible in the selected range.", color="info"), None
-            
-        genes_df = pd.DataFrame(genes_data)
 
-        all_genes = [gene for solution in all_solutions_list for gene in solution.get('selected_genes', [])]
-        gene_counts = pd.Series(all_genes).value_counts()
-        total_solutions = len(all_solutions_list)
-        genes_100_percent = gene_counts[gene_counts == total_solutions]
-        genes_under_100 = gene_counts[gene_counts < total_solutions]
+        # La tabla detallada se sirve desde la matriz de incidencia (sin formato largo en el navegador)
+        table = genes_table(data)
+        table_info = None
+        if table is not None:
+            front_positions = np.unique(table.incidence.front_index[table.pair_rows])
+            table_info = {
+                'key': table.key,
+                'front_names': [table.incidence.front_names[i] for i in front_positions],
+                'objectives': table.objectives,
+                'numeric_objectives': [obj for obj in table.objectives if is_numeric_column(table, obj)],
+                'float_objectives': [obj for obj in table.objectives
+                                     if is_numeric_column(table, obj) and table.solutions[obj].dtype == 'float64'],
+                'total_rows': int(table.pair_rows.size),
+            }
+
+        frequency = gene_frequencies(data)
+        total_solutions = frequency.total_solutions
+        genes_100_percent = conserved_genes(frequency)
+        groups = percentage_groups(frequency)
+        n_variable_genes = sum(groups.values())
 
         # --- SECCIÓN 1.1: GENES 100% ---
         genes_100_content = []
@@ -95,7 +85,7 @@ def register_genes_analysis_callbacks(app):
                                 className="me-1 mb-1 p-2",
                                 style={'cursor': 'pointer', 'fontSize': '0.85rem'}
                             )
-                            for gene in sorted(genes_100_percent.index)
+                            for gene in genes_100_percent
                         ], className="d-flex flex-wrap")
                     ])
                 ], className="mb-4 bg-light border-success border-opacity-25 shadow-sm")
@@ -105,15 +95,9 @@ def register_genes_analysis_callbacks(app):
         
         # --- SECCIÓN 1.2: GRÁFICO DE FRECUENCIA ---
         genes_under_100_content = []
-        if len(genes_under_100) > 0:
-            percentage_groups = {}
-            for gene, count in genes_under_100.items():
-                percentage = round((count / total_solutions) * 100, 1)
-                if percentage not in percentage_groups:
-                    percentage_groups[percentage] = []
-                percentage_groups[percentage].append(gene)
-            percentages = sorted(percentage_groups.keys())
-            gene_counts_per_percentage = [len(percentage_groups[p]) for p in percentages]
+        if n_variable_genes > 0:
+            percentages = list(groups.keys())
+            gene_counts_per_percentage = list(groups.values())
             
             fig = go.Figure(data=[
                 go.Bar(
@@ -126,7 +110,7 @@ def register_genes_analysis_callbacks(app):
                 )
             ])
             fig.update_layout(
-                title={'text': f'Variable Gene Distribution ({len(genes_under_100)} genes < 100%)', 'font': {'size': 14}},
+                title={'text': f'Variable Gene Distribution ({n_variable_genes} genes < 100%)', 'font': {'size': 14}},
                 xaxis_title='Frequency (%)', 
                 yaxis_title='Gene Count', 
                 height=350,
@@ -152,20 +136,18 @@ def register_genes_analysis_callbacks(app):
 
         combined_analysis = genes_100_content + genes_under_100_content + [expansion_placeholder]
 
-        return combined_analysis, genes_df.to_json(orient='split')
+        return combined_analysis, table_info
 
     # --- CALLBACK 2: CONSTRUIR LAYOUT DETALLADO (POPOVER ESTILO UNIFICADO) ---
     @app.callback(
         Output('genes-table-container', 'children'),
         Input('genes-analysis-internal-store', 'data')
     )
-    def build_detailed_layout(data_json):
-        if not data_json:
+    def build_detailed_layout(table_info):
+        if not table_info:
             return dbc.Alert("No data available for detailed analysis.", color="secondary")
             
-        genes_df = pd.read_json(StringIO(data_json), orient='split')
-        
-        front_names = genes_df['front_name'].unique()
+        front_names = table_info['front_names']
         
         # --- LÓGICA AÑADIDA: Detectar si existe un solo frente ---
         is_single_front = len(front_names) <= 1
@@ -173,29 +155,20 @@ def register_genes_analysis_callbacks(app):
         front_filter_options = [{'label': 'All Fronts', 'value': 'all'}] + \
                                [{'label': name, 'value': name} for name in front_names]
         
-        objective_options = []
-        
         # --- LÓGICA AÑADIDA: Definición dinámica de métricas categóricas ---
         # Solo añadimos 'front_name' a las métricas si hay más de un frente.
         categorical_cols_for_metrics = ['gene', 'unique_solution_id']
         if not is_single_front:
             categorical_cols_for_metrics.append('front_name')
         
-        # Columnas a excluir del escaneo de objetivos numéricos
-        excluded_cols = ['gene', 'front_name', 'unique_solution_id', 'solution_id']
-        
-        for col in genes_df.columns:
-            if col in excluded_cols: continue
-            if pd.api.types.is_numeric_dtype(genes_df[col]):
-                objective_options.append({'label': col.replace('_', ' ').title(), 'value': col})
+        objective_options = [{'label': col.replace('_', ' ').title(), 'value': col} for col in table_info['numeric_objectives']]
 
         # Generamos las opciones del dropdown usando la lista dinámica
         categorical_options = [{'label': col.replace('_', ' ').title(), 'value': col} for col in categorical_cols_for_metrics]
         metric_options = categorical_options + objective_options
 
-        table_columns = []
-        for col in genes_df.columns:
-            if col == 'unique_solution_id': continue 
+        table_columns_def = []
+        for col in ['front_name', 'solution_id', 'gene'] + table_info['objectives']:
             column_name = col.replace('_', ' ').title()
             col_def = {'name': column_name, 'id': col, 'hideable': True}
             
@@ -203,10 +176,10 @@ def register_genes_analysis_callbacks(app):
             elif col == 'solution_id': col_def.update({'name': 'Solution'})
             elif col == 'gene': col_def.update({'name': 'Gene/Probe', 'presentation': 'markdown'}) 
             
-            if col in [o['value'] for o in objective_options]:
-                col_def.update({'type': 'numeric', 'format': {'specifier': '.3f'} if genes_df[col].dtype == 'float64' else None})
+            if col in table_info['numeric_objectives']:
+                col_def.update({'type': 'numeric', 'format': {'specifier': '.3f'} if col in table_info['float_objectives'] else None})
             
-            table_columns.append(col_def)
+            table_columns_def.append(col_def)
             
         # Toolbar
         controls_toolbar = dbc.Card([
@@ -281,11 +254,15 @@ def register_genes_analysis_callbacks(app):
         
         table = dash_table.DataTable(
             id='detailed-genes-table',
-            data=genes_df.to_dict('records'),
-            columns=table_columns,
-            sort_action='native',
-            filter_action='native',
-            page_action='native',
+            data=[],
+            columns=table_columns_def,
+            # Modo servidor: sólo viaja la página visible (filtro y orden se aplican en el backend)
+            sort_action='custom',
+            sort_by=[],
+            filter_action='custom',
+            filter_query='',
+            page_action='custom',
+            page_current=0,
             page_size=15, 
             style_table={'overflowX': 'auto'},
             style_header={'backgroundColor': '#f8f9fa', 'color': '#333', 'fontWeight': 'bold', 'borderBottom': '2px solid #dee2e6'},
@@ -302,6 +279,7 @@ def register_genes_analysis_callbacks(app):
                 html.Div([
                     html.H6("Detailed Data", className="fw-bold m-0"),
                     html.I(id="genes-filter-help-icon", className="bi bi-question-circle-fill text-muted ms-2", style={'cursor': 'pointer'}),
+                    html.Small(id='detailed-genes-table-info', className="text-muted ms-3"),
                 ], className="d-flex align-items-center"),
                 dbc.Button("Clear Filters", id='genes-table-clear-filters-btn', size="sm", color="secondary", outline=True)
             ], className="d-flex justify-content-between align-items-center mb-2 mt-4"),
@@ -310,23 +288,38 @@ def register_genes_analysis_callbacks(app):
         ])
     
 
-    # --- CALLBACK 3: FILTRAR TABLA (SIN CAMBIOS) ---
+    # --- CALLBACK 3: PÁGINA VISIBLE DE LA TABLA (FILTRO, ORDEN Y PAGINACIÓN EN EL SERVIDOR) ---
     @app.callback(
-        Output('detailed-genes-table', 'data'),
-        Input('genes-global-front-filter', 'value'),
-        State('genes-analysis-internal-store', 'data')
+        [Output('detailed-genes-table', 'data'),
+         Output('detailed-genes-table', 'page_count'),
+         Output('detailed-genes-table', 'page_current'),
+         Output('detailed-genes-table-info', 'children')],
+        [Input('genes-global-front-filter', 'value'),
+         Input('detailed-genes-table', 'filter_query'),
+         Input('detailed-genes-table', 'sort_by'),
+         Input('detailed-genes-table', 'page_current'),
+         Input('detailed-genes-table', 'page_size')],
+        State('data-store', 'data')
     )
-    def filter_table_by_front(selected_front, data_json):
-        if not data_json:
+    def update_detailed_table_page(selected_front, filter_query, sort_by, page_current, page_size, data):
+        table = genes_table(data)
+        if table is None:
             raise PreventUpdate
-            
-        genes_df = pd.read_json(StringIO(data_json), orient='split')
-        
-        if selected_front == 'all':
-            return genes_df.to_dict('records')
-        
-        filtered_df = genes_df[genes_df['front_name'] == selected_front]
-        return filtered_df.to_dict('records')
+
+        pairs = sorted_pairs(table, selected_front, filter_query, sort_by)
+        page_size = int(page_size or 15)
+        page_count = max(1, -(-pairs.size // page_size))
+        # Un filtro nuevo vuelve a la primera página; una página fuera de rango se ajusta
+        filter_changed = any(t['prop_id'] in ('genes-global-front-filter.value', 'detailed-genes-table.filter_query')
+                             for t in ctx.triggered or [])
+        page_current = 0 if filter_changed else min(int(page_current or 0), page_count - 1)
+
+        start = page_current * page_size
+        shown = pairs[start:start + page_size]
+        info = f"Rows {start + 1:,}-{start + shown.size:,} of {pairs.size:,}" if shown.size else "No rows match the filters"
+        if pairs.size < table.pair_rows.size:
+            info += f" (filtered from {table.pair_rows.size:,})"
+        return page_records(table, shown), page_count, page_current, info
         
 
     # --- CALLBACK 4: MOSTRAR DETALLE EXPANDIDO (POPOVER ESTILO UNIFICADO) ---
@@ -346,24 +339,10 @@ def register_genes_analysis_callbacks(app):
         if trigger_id_dict and isinstance(trigger_id_dict, dict) and trigger_id_dict.get('type') == 'close-freq-detail-btn': return []
         if not clickData or not data: return []
 
-        all_solutions_list = []
-        for front in data.get("fronts", []):
-            if front.get("visible", True): all_solutions_list.extend(front["data"])
-
         clicked_percentage = clickData['points'][0]['x']
-        all_genes = [gene for solution in all_solutions_list for gene in solution.get('selected_genes', [])]
-        gene_counts = pd.Series(all_genes).value_counts()
-        total_solutions = len(all_solutions_list)
-        
-        genes_under_100 = gene_counts[gene_counts < total_solutions]
-        genes_at_percentage = []
-        for gene, count in genes_under_100.items():
-            percentage = round((count / total_solutions) * 100, 1)
-            if percentage == clicked_percentage:
-                genes_at_percentage.append({'gene': gene, 'count': count, 'frequency': f"{percentage}%"})
-
-        if not genes_at_percentage: return []
-        genes_at_percentage.sort(key=lambda x: (-x['count'], x['gene']))
+        genes_in_group = [{'gene': gene, 'count': count, 'frequency': f"{clicked_percentage}%"}
+                          for gene, count in genes_at_percentage(gene_frequencies(data), clicked_percentage)]
+        if not genes_in_group: return []
         
         # --- POPOVER UNIFICADO: Filter Syntax Guide ---
         freq_help_popover = dbc.Popover(
@@ -402,7 +381,7 @@ def register_genes_analysis_callbacks(app):
                 html.H6([
                     html.I(className="bi bi-diagram-2-fill me-2 text-primary"),
                     f"Group: {clicked_percentage}% Frequency ",
-                    dbc.Badge(f"{len(genes_at_percentage)} Genes/Probes", color="light", text_color="primary", className="ms-1 border"),
+                    dbc.Badge(f"{len(genes_in_group)} Genes/Probes", color="light", text_color="primary", className="ms-1 border"),
                     html.I(id="freq-table-help-icon", className="bi bi-question-circle-fill text-muted ms-2", style={'cursor': 'pointer', 'fontSize': '1rem'}, title="Click for filter help")
                 ], className="m-0 fw-bold d-flex align-items-center")
             ], width=True, className="d-flex align-items-center"),
@@ -414,7 +393,7 @@ def register_genes_analysis_callbacks(app):
 
         data_table = dash_table.DataTable(
             id='frequency-detail-table',
-            data=genes_at_percentage,
+            data=genes_in_group,
             columns=[{'name': 'Gene/Probe', 'id': 'gene'}, {'name': 'Occurrence (Count)', 'id': 'count'}, {'name': 'Frequency', 'id': 'frequency'}],
             page_size=10,
             sort_action='native',
@@ -424,7 +403,7 @@ def register_genes_analysis_callbacks(app):
             style_filter={'backgroundColor': 'rgb(220, 235, 255)', 'border': '1px solid rgb(180, 200, 220)', 'fontWeight': 'bold', 'color': '#333'},
             style_cell={'textAlign': 'left', 'padding': '8px', 'fontSize': '0.9rem'},
             style_data_conditional=[{'if': {'row_index': 'odd'}, 'backgroundColor': '#f8f9fa'}, {'if': {'state': 'active'}, 'backgroundColor': 'rgba(13, 110, 253, 0.1)', 'border': '1px solid #0d6efd'}],
-            tooltip_data=[{'gene': {'value': 'Click to add individual gene to panel', 'type': 'text'}} for _ in genes_at_percentage],
+            tooltip_data=[{'gene': {'value': 'Click to add individual gene to panel', 'type': 'text'}} for _ in genes_in_group],
             tooltip_duration=None
         )
 
@@ -506,17 +485,18 @@ def register_genes_analysis_callbacks(app):
 
         return True, title, body, footer, temp_data
 
-    # --- CALLBACK 5: ACTUALIZAR GRÁFICO Y PANEL DE RESUMEN (OPTIMIZADO) ---
+    # --- CALLBACK 5: ACTUALIZAR GRÁFICO Y PANEL DE RESUMEN (CALCULADO EN EL SERVIDOR CON EL MISMO FILTRO) ---
     @app.callback(
         [Output('genes-table-histogram', 'figure'),
         Output('save-graph-group-btn', 'style'), 
         Output('genes-table-summary-panel', 'children')], 
-        [Input('detailed-genes-table', 'derived_virtual_data'),
+        [Input('genes-global-front-filter', 'value'),
+        Input('detailed-genes-table', 'filter_query'),
         Input('genes-table-graph-metric-select', 'value'),
         Input('genes-analysis-internal-store', 'data')], 
-        [State('genes-analysis-internal-store', 'data')] 
+        [State('data-store', 'data')] 
     )
-    def update_table_histogram_and_summary(derived_virtual_data, selected_metric, internal_store_data_input, internal_store_data_state):
+    def update_table_histogram_and_summary(selected_front, filter_query, selected_metric, table_info, data):
         
         # Layout base con uirevision para mantener el estado del usuario (zoom/scroll) tras interacciones
         default_layout = go.Layout(
@@ -528,35 +508,23 @@ def register_genes_analysis_callbacks(app):
         default_summary = dbc.Alert("Loading statistics...", color="light")
         save_btn_style = {'display': 'none'}
         
-        final_df = None
-        
-        if internal_store_data_state:
-            try:
-                full_genes_df = pd.read_json(StringIO(internal_store_data_state), orient='split')
-            except Exception as e:
-                print(f"Error reading internal store for graph update: {e}")
-                return go.Figure(layout=default_layout), save_btn_style, default_summary
-
-            if derived_virtual_data is not None and len(derived_virtual_data) > 0:
-                final_df = pd.DataFrame(derived_virtual_data)
-            elif full_genes_df is not None and not full_genes_df.empty:
-                final_df = full_genes_df
-            
-        if final_df is None or final_df.empty or not selected_metric:
-            if derived_virtual_data is not None and len(derived_virtual_data) == 0:
-                layout_empty = go.Layout(
-                    title='No data matches the current filter selection.',
-                    height=400,
-                    uirevision='genes_analysis_user_state'
-                )
-                return go.Figure(layout=layout_empty), save_btn_style, dbc.Alert("No data matching filters.", color="warning")
-
+        table = genes_table(data) if table_info else None
+        if table is None or not selected_metric:
             return go.Figure(layout=default_layout), save_btn_style, default_summary
 
+        distribution = metric_distribution(table, selected_front, filter_query, selected_metric)
+        if distribution.total_rows == 0:
+            layout_empty = go.Layout(
+                title='No data matches the current filter selection.',
+                height=400,
+                uirevision='genes_analysis_user_state'
+            )
+            return go.Figure(layout=layout_empty), save_btn_style, dbc.Alert("No data matching filters.", color="warning")
+
         # --- CÁLCULO DE RESUMEN (Sobre todos los datos filtrados, sin recorte) ---
-        total_rows = len(final_df)
-        unique_solutions = final_df['unique_solution_id'].nunique()
-        unique_genes = final_df['gene'].nunique()
+        total_rows = distribution.total_rows
+        unique_solutions = distribution.unique_solutions
+        unique_genes = distribution.unique_genes
 
         summary_panel = dbc.Row([
             dbc.Col(dbc.Card(dbc.CardBody([
@@ -590,19 +558,18 @@ def register_genes_analysis_callbacks(app):
             ]), className="h-100 shadow-sm border-start border-success border-5"), width=12, md=4, className="mb-2"),
         ])
 
-        if selected_metric not in final_df.columns:
+        if selected_metric != 'gene' and selected_metric not in table.solutions.columns:
             default_layout.title = f"Metric '{selected_metric}' not in data."
             return go.Figure(layout=default_layout), save_btn_style, summary_panel
         
         metric_name = selected_metric.replace('_', ' ').title()
         
         # --- LÓGICA GRÁFICA ---
-        if not pd.api.types.is_numeric_dtype(final_df[selected_metric]):
+        if distribution.kind == 'categorical':
             # Métrica Categórica (Genes, Frentes, etc.)
             save_btn_style = {'display': 'block'}
 
-            counts = final_df[selected_metric].value_counts().reset_index()
-            counts.columns = [selected_metric, 'count']
+            counts = pd.DataFrame({selected_metric: distribution.labels, 'count': distribution.counts})
             
             # --- OPTIMIZACIÓN DE RENDIMIENTO ---
             # 1. Límite Duro (Top 300) para evitar lag del navegador y spinner colgado
@@ -652,29 +619,17 @@ def register_genes_analysis_callbacks(app):
             return fig, save_btn_style, summary_panel
         
         else:
-            # Métrica Numérica (Histograma) - Se mantiene igual, solo añade uirevision
-            valid_data = final_df[selected_metric].dropna()
-            if valid_data.empty:
+            # Métrica Numérica (Histograma precalculado en el servidor)
+            if distribution.kind != 'numeric':
                 default_layout.title = f"No valid numeric data for '{metric_name}'."
                 return go.Figure(layout=default_layout), save_btn_style, summary_panel
-                
-            counts, bin_edges = np.histogram(valid_data, bins=20)
-            
-            bin_data_to_plot = []
-            for i in range(len(counts)):
-                if counts[i] > 0:
-                    bin_data_to_plot.append({
-                        'count': counts[i],
-                        'bin_label': f"{bin_edges[i]:.3g} - {bin_edges[i+1]:.3g}",
-                        'bin_start': bin_edges[i],
-                        'bin_end': bin_edges[i+1]
-                    })
-            
-            if not bin_data_to_plot:
-                default_layout.title = f"No data to plot for '{metric_name}'."
-                return go.Figure(layout=default_layout), save_btn_style, summary_panel
 
-            hist_df = pd.DataFrame(bin_data_to_plot)
+            hist_df = pd.DataFrame({
+                'count': distribution.counts,
+                'bin_label': distribution.labels,
+                'bin_start': distribution.bin_edges[:, 0],
+                'bin_end': distribution.bin_edges[:, 1],
+            })
             
             fig = px.bar(
                 hist_df,
@@ -716,10 +671,12 @@ def register_genes_analysis_callbacks(app):
         [Input('genes-table-histogram', 'clickData'),
          Input('save-graph-group-btn', 'n_clicks')],
         [State('genes-table-graph-metric-select', 'value'),
-         State('detailed-genes-table', 'derived_virtual_data')],
+         State('genes-global-front-filter', 'value'),
+         State('detailed-genes-table', 'filter_query'),
+         State('data-store', 'data')],
         prevent_initial_call=True
     )
-    def handle_graph_interactions(clickData, group_n_clicks, selected_metric, derived_virtual_data):
+    def handle_graph_interactions(clickData, group_n_clicks, selected_metric, selected_front, filter_query, data):
         """
         Maneja interacciones.
         🔑 CAMBIO: Soporte especial para 'unique_solution_id' como solución individual.
@@ -727,12 +684,14 @@ def register_genes_analysis_callbacks(app):
         
         triggered_id = ctx.triggered_id
         
-        if not triggered_id or derived_virtual_data is None:
+        table = genes_table(data)
+        if not triggered_id or table is None:
             raise PreventUpdate
             
-        filtered_df = pd.DataFrame(derived_virtual_data)
+        # Mismo filtro que la tabla, evaluado en el servidor
+        pairs = filter_pairs(table, selected_front, filter_query)
         
-        if filtered_df.empty:
+        if pairs.size == 0:
             raise PreventUpdate
 
         cancel_button = dbc.Button("Cancel", id='genes-graph-modal-cancel-btn', color="secondary", className="me-2")
@@ -742,7 +701,7 @@ def register_genes_analysis_callbacks(app):
         # --- Opción B: Guardar Grupo Visible (Sin cambios) ---
         if triggered_id == 'save-graph-group-btn':
             
-            genes_in_group = sorted(filtered_df['gene'].unique())
+            genes_in_group = genes_of_pairs(table, pairs)
             
             group_name = f"Visible Group ({selected_metric})"
             source_display = f"Visible group from '{selected_metric}' analysis"
@@ -778,7 +737,7 @@ def register_genes_analysis_callbacks(app):
             if not clickData:
                 raise PreventUpdate 
             
-            is_numeric = pd.api.types.is_numeric_dtype(filtered_df[selected_metric])
+            is_numeric = is_numeric_column(table, selected_metric)
             
             # --- 1. Clic en Métrica Categórica ---
             if not is_numeric:
@@ -817,19 +776,19 @@ def register_genes_analysis_callbacks(app):
                     full_sol_id_str = clicked_category # e.g. "Front 1 - sol_0"
                     
                     # Filtrar para obtener datos solo de esta solución
-                    sol_df = filtered_df[filtered_df['unique_solution_id'] == full_sol_id_str]
+                    sol_pairs = pairs[column_values(table, 'unique_solution_id', pairs) == full_sol_id_str]
                     
-                    if sol_df.empty:
+                    if sol_pairs.size == 0:
                          return True, "Error", dbc.Alert("Could not find solution data.", color="danger"), footer, None
 
                     # Extraer datos
-                    genes_in_sol = sorted(sol_df['gene'].unique())
-                    front_name = sol_df['front_name'].iloc[0]
-                    sol_id = sol_df['solution_id'].iloc[0]
+                    genes_in_sol = genes_of_pairs(table, sol_pairs)
+                    sol_record = page_records(table, sol_pairs[:1])[0]
+                    front_name = sol_record['front_name']
+                    sol_id = sol_record['solution_id']
                     
-                    # Intentar extraer objetivos (columnas numéricas que no son gene, id, etc)
-                    ignored_cols = ['gene', 'front_name', 'unique_solution_id', 'solution_id']
-                    objectives_data = {col: sol_df[col].iloc[0] for col in sol_df.columns if col not in ignored_cols}
+                    # Objetivos de la solución (columnas a nivel de solución que no son ids)
+                    objectives_data = {col: sol_record[col] for col in table.objectives}
                     
                     # Formatear objetivos para mostrar
                     objs_display = ", ".join([f"{k}: {v}" for k, v in objectives_data.items()])
@@ -865,8 +824,8 @@ def register_genes_analysis_callbacks(app):
 
                 # Caso 1.3: Grupo Genérico (e.g., 'front_name')
                 else:
-                    category_df = filtered_df[filtered_df[selected_metric] == clicked_category]
-                    genes_in_category = sorted(category_df['gene'].unique())
+                    in_category = pd.Series(column_values(table, selected_metric, pairs), dtype=object).astype(str) == str(clicked_category)
+                    genes_in_category = genes_of_pairs(table, pairs[in_category.to_numpy()])
                     
                     group_name = f"Genes/Probes from '{clicked_category}'"
                     source_display = f"Graph click ({selected_metric} = {clicked_category})"
@@ -900,8 +859,9 @@ def register_genes_analysis_callbacks(app):
             # --- 2. Clic en Métrica Numérica (Histograma) ---
             else:
                 
-                valid_data = filtered_df[selected_metric].dropna()
-                if valid_data.empty:
+                metric_values = column_values(table, selected_metric, pairs).astype(float)
+                valid_data = metric_values[~np.isnan(metric_values)]
+                if valid_data.size == 0:
                     return True, "No Data", dbc.Alert("No valid data in this bin to analyze.", color="warning"), footer, None
 
                 try:
@@ -915,18 +875,13 @@ def register_genes_analysis_callbacks(app):
                 try:
                     is_last_bin = (bin_end == valid_data.max())
 
-                    if is_last_bin:
-                         bin_data = filtered_df[
-                             (filtered_df[selected_metric] >= bin_start) & 
-                             (filtered_df[selected_metric] <= bin_end)
-                         ]
-                    else:
-                        bin_data = filtered_df[
-                             (filtered_df[selected_metric] >= bin_start) & 
-                             (filtered_df[selected_metric] < bin_end)
-                         ]
+                    with np.errstate(invalid='ignore'):
+                        if is_last_bin:
+                            in_bin = (metric_values >= bin_start) & (metric_values <= bin_end)
+                        else:
+                            in_bin = (metric_values >= bin_start) & (metric_values < bin_end)
                     
-                    genes_in_bin = sorted(bin_data['gene'].unique())
+                    genes_in_bin = genes_of_pairs(table, pairs[in_bin])
 
                     group_name = f"Genes/Probes from Bin '{clicked_bin_label}'"
                     source_display = f"Graph click ({selected_metric} bin: {clicked_bin_label})"
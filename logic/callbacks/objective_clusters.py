@@ -0,0 +1,166 @@
+# logic/callbacks/objective_clusters.py
+# Vista de clusters en el espacio de objetivos normalizado (pestaña Pareto).
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.express as px
+from dash import Output, Input, State, html, dcc, dash_table
+from dash.exceptions import PreventUpdate
+import dash_bootstrap_components as dbc
+
+from logic.utils.objective_clustering import cluster_solutions
+
+CLUSTER_COLORS = px.colors.qualitative.Dark24
+
+
+def _cluster_color(cluster):
+    return CLUSTER_COLORS[cluster % len(CLUSTER_COLORS)]
+
+
+def register_objective_cluster_callbacks(app):
+
+    # 1. Gráfico coloreado por cluster + tabla de tamaños, centroides y genes frecuentes
+    @app.callback(
+        Output('cluster-view-container', 'children'),
+        Input('cluster-method-select', 'value'),
+        Input('cluster-k-input', 'value'),
+        Input('data-store', 'data'),
+        Input('x-axis-store', 'data'),
+        Input('y-axis-store', 'data'),
+        State('main-tabs', 'active_tab')
+    )
+    def update_cluster_view(method, k, data_store, x_axis, y_axis, active_tab):
+        if active_tab != 'pareto-tab':
+            raise PreventUpdate
+
+        result = cluster_solutions(data_store, method or 'kmeans', int(k or 6))
+        if not result or not result['clusters']:
+            return dbc.Alert("Load at least one front with numeric objectives to cluster its solutions.",
+                             color="light", className="text-center small text-muted border-0 m-0")
+
+        objectives = result['objectives']
+        x_axis = x_axis if x_axis in objectives else objectives[0]
+        y_axis = y_axis if y_axis in objectives else objectives[min(1, len(objectives) - 1)]
+        fronts = {f['id']: f for f in data_store.get('fronts', [])}
+        labels = result['labels']
+        xs = np.array([fronts[fid]['data'][i].get(x_axis) for fid, i in result['rows']], dtype=float)
+        ys = np.array([fronts[fid]['data'][i].get(y_axis) for fid, i in result['rows']], dtype=float)
+        x_index, y_index = objectives.index(x_axis), objectives.index(y_axis)
+
+        fig = go.Figure()
+        for cluster in result['clusters']:
+            c = cluster['cluster']
+            members = labels == c
+            color = _cluster_color(c)
+            fig.add_trace(go.Scattergl(
+                x=xs[members], y=ys[members], mode='markers',
+                marker=dict(size=7, color=color, opacity=0.7),
+                name=f"Cluster {c + 1} ({cluster['size']})",
+                legendgroup=str(c),
+                hovertemplate=f"Cluster {c + 1}<br>{x_axis}: %{{x}}<br>{y_axis}: %{{y}}<extra></extra>"
+            ))
+            fig.add_trace(go.Scatter(
+                x=[cluster['centroid_raw'][x_index]], y=[cluster['centroid_raw'][y_index]], mode='markers',
+                marker=dict(size=16, color=color, symbol='x', line=dict(width=2, color='#333')),
+                customdata=[c], legendgroup=str(c), showlegend=False,
+                hovertemplate=f"Centroid {c + 1} ({cluster['size']} solutions)<br>Click to select the cluster<extra></extra>"
+            ))
+        fig.update_layout(
+            template='plotly_white', height=420, margin=dict(l=40, r=20, t=20, b=40),
+            xaxis_title=x_axis.replace('_', ' ').title(), yaxis_title=y_axis.replace('_', ' ').title(),
+            legend=dict(orientation='v', x=1.02, y=1), clickmode='event'
+        )
+
+        rows = [
+            {
+                'cluster': cluster['cluster'] + 1,
+                'size': cluster['size'],
+                **{obj: round(value, 6) for obj, value in zip(objectives, cluster['centroid_raw'])},
+                'top_genes': ", ".join(f"{g['gene']} ({g['frequency']:.0%})" for g in cluster['top_genes'][:5]) or '-',
+            }
+            for cluster in result['clusters']
+        ]
+        columns = (
+            [{'name': 'Cluster', 'id': 'cluster', 'type': 'numeric'}, {'name': 'Size', 'id': 'size', 'type': 'numeric'}]
+            + [{'name': f"Centroid {obj.replace('_', ' ')}", 'id': obj, 'type': 'numeric'} for obj in objectives]
+            + [{'name': 'Most frequent genes', 'id': 'top_genes'}]
+        )
+        unclustered = int((labels < 0).sum())
+        note = f"{len(result['clusters'])} clusters over {int((labels >= 0).sum())} visible solutions"
+        if unclustered:
+            note += f"; {unclustered} solutions with missing objectives were left out"
+
+        return html.Div([
+            dcc.Graph(id='cluster-scatter', figure=fig, config={'responsive': True}),
+            dash_table.DataTable(
+                id='cluster-summary-table',
+                data=rows,
+                columns=columns,
+                sort_action='native',
+                page_size=10,
+                style_table={'overflowX': 'auto'},
+                style_header={'backgroundColor': '#f8f9fa', 'color': '#333', 'fontWeight': 'bold', 'borderBottom': '2px solid #dee2e6'},
+                style_cell={'textAlign': 'left', 'padding': '8px', 'fontFamily': 'sans-serif', 'fontSize': '0.9rem',
+                            'whiteSpace': 'normal', 'height': 'auto'},
+                style_data_conditional=[{'if': {'row_index': 'odd'}, 'backgroundColor': '#f8f9fa'}] + [
+                    {'if': {'filter_query': f"{{cluster}} = {row['cluster']}", 'column_id': 'cluster'},
+                     'color': _cluster_color(row['cluster'] - 1), 'fontWeight': 'bold'}
+                    for row in rows
+                ],
+            ),
+            html.Small(note + ". Click a centroid (X) to add its cluster to the selection.", className="text-muted d-block mt-2")
+        ])
+
+    # 2. Click en un centroide -> el cluster completo pasa a la selección
+    @app.callback(
+        Output('selected-solutions-store', 'data', allow_duplicate=True),
+        Input('cluster-scatter', 'clickData'),
+        State('cluster-method-select', 'value'),
+        State('cluster-k-input', 'value'),
+        State('selected-solutions-store', 'data'),
+        State('data-store', 'data'),
+        State('x-axis-store', 'data'),
+        State('y-axis-store', 'data'),
+        prevent_initial_call=True
+    )
+    def select_cluster(click_data, method, k, current_selection, data_store, x_axis, y_axis):
+        points = (click_data or {}).get('points') or []
+        if not points or points[0].get('customdata') is None:
+            raise PreventUpdate
+
+        result = cluster_solutions(data_store, method or 'kmeans', int(k or 6))
+        if not result:
+            raise PreventUpdate
+        cluster = int(np.ravel(points[0]['customdata'])[0])
+        fronts = {f['id']: f for f in data_store.get('fronts', [])}
+
+        current_selection = current_selection or []
+        existing_ids = {s['unique_id'] for s in current_selection}
+        new_selections = []
+        for row in np.flatnonzero(result['labels'] == cluster):
+            front_id, index = result['rows'][row]
+            front = fronts[front_id]
+            sol = front['data'][index]
+            unique_id = f"{sol.get('solution_id', 'N/A')}|{front['name']}"
+            if unique_id in existing_ids:
+                continue
+            existing_ids.add(unique_id)
+            sol_data = dict(sol)
+            sol_data['front_name'] = front['name']
+            sol_data['unique_id'] = unique_id
+            sol_data['x'] = sol.get(x_axis)
+            sol_data['y'] = sol.get(y_axis)
+            sol_data['objectives'] = front.get('objectives', [])
+            new_selections.append({
+                'id': sol.get('solution_id', 'N/A'),
+                'front_name': front['name'],
+                'unique_id': unique_id,
+                'x': sol_data['x'],
+                'y': sol_data['y'],
+                'objectives': sol_data['objectives'],
+                'full_data': sol_data
+            })
+
+        if not new_selections:
+            raise PreventUpdate
+        return current_selection + new_selections
@@ -10,6 +10,9 @@ from collections import defaultdict
 import json
 import logging
 
+from logic.utils.attainment import EAF_LEVELS, front_attainment_surfaces
+from logic.utils.decision_support import front_decision_points
+
 logger = logging.getLogger(__name__)
 
 def register_pareto_plot_callbacks(app):
@@ -64,10 +67,16 @@ def register_pareto_plot_callbacks(app):
          Input('x-axis-store', 'data'), 
          Input('y-axis-store', 'data'), 
          Input({'type': 'main-front-checkbox', 'index': ALL}, 'value'),
-         Input({'type': 'front-name-input', 'index': ALL}, 'value')],
+         Input({'type': 'front-name-input', 'index': ALL}, 'value'),
+         Input('decision-highlight-options', 'value'),
+         Input('knee-method-select', 'value'),
+         Input('knee-count-input', 'value'),
+         Input('eaf-surface-options', 'value'),
+         Input('eaf-custom-level-input', 'value')],
         prevent_initial_call=True
     )
-    def update_pareto_plot(data_store, selected_solutions, x_axis_value, y_axis_value, main_front_checkboxes, front_name_inputs):
+    def update_pareto_plot(data_store, selected_solutions, x_axis_value, y_axis_value, main_front_checkboxes, front_name_inputs,
+                           highlight_options, knee_method, knee_count, eaf_options, eaf_custom_level):
         """
         Update Pareto plot with FULL EXPLORATION TOOLS enabled (Spikes, Slider, etc).
         """
@@ -122,6 +131,39 @@ def register_pareto_plot_callbacks(app):
                 
             return df, found_x, found_y
 
+        # --- Soporte de decisión: crowding distance, knees y extremos (cacheado por versión de frente) ---
+        decision_points = front_decision_points(data_store, n_knees=int(knee_count or 1), method=knee_method or 'bulge')
+        crowding_by_uid = {}
+        role_uids = {'knees': set(), 'extremes': set()}
+        for front in visible_fronts:
+            points = decision_points.get(front['id'])
+            if not points:
+                continue
+            for sol, crowding in zip(front['data'], points['crowding']):
+                crowding_by_uid[f"{sol.get('solution_id')}|{front['name']}"] = crowding
+            for role in role_uids:
+                role_uids[role].update(f"{front['data'][i].get('solution_id')}|{front['name']}" for i in points[role])
+
+        def fmt_crowding(uid):
+            crowding = crowding_by_uid.get(uid)
+            if crowding is None or crowding != crowding:
+                return ""
+            return f"Crowding: {'∞' if crowding == float('inf') else fmt_val(crowding)}<br>"
+
+        def fmt_origin(sol):
+            """Provenance line for consolidated/merged solutions."""
+            origin = sol.get('origin_front')
+            if not isinstance(origin, str):
+                return ""
+            return f"<i>Origin: {sol.get('original_solution_id', '')} ({origin})</i><br>"
+
+        def fmt_represents(sol):
+            """Number of original solutions behind a representative (collapsed/thinned fronts)."""
+            count = sol.get('represented_count')
+            if not isinstance(count, (int, float)) or count != count or count <= 1:
+                return ""
+            return f"<i>Represents {int(count)} solutions</i><br>"
+
         # --- 2. Pre-procesar y Agrupar Soluciones ---
         coord_to_solutions = defaultdict(list)
         all_objectives = set(objectives) 
@@ -185,7 +227,10 @@ def register_pareto_plot_callbacks(app):
                     
                     hover_text = (f"<b>{sol_in_front['solution_id']}</b> ({sol_in_front['front_name']})<br>"
                                   f"{x_axis.replace('_', ' ').title()}: {fmt_val(sol_in_front['current_x'])}<br>"
-                                  f"{y_axis.replace('_', ' ').title()}: {fmt_val(sol_in_front['current_y'])}<br><extra></extra>")
+                                  f"{y_axis.replace('_', ' ').title()}: {fmt_val(sol_in_front['current_y'])}<br>"
+                                  f"{fmt_crowding(sol_in_front['unique_id'])}"
+                                  f"{fmt_origin(sol_in_front)}"
+                                  f"{fmt_represents(sol_in_front)}<extra></extra>")
                     
                     point_data = {
                         'x': sol_in_front['current_x'],
@@ -259,6 +304,65 @@ def register_pareto_plot_callbacks(app):
         for trace in highlight_traces:
             fig.add_trace(trace)
 
+        # D. Soluciones representativas (knee / extremos)
+        decision_styles = {
+            'knees': ('Knee points', 'star', '#e83e8c'),
+            'extremes': ('Extreme points', 'diamond', '#20c997'),
+        }
+        for role in (highlight_options or []):
+            if role not in decision_styles or not role_uids[role]:
+                continue
+            label, symbol, marker_color = decision_styles[role]
+            role_points = []
+            for coord, solutions in coord_to_solutions.items():
+                matches = [s for s in solutions if s['unique_id'] in role_uids[role]]
+                if not matches:
+                    continue
+                names = ', '.join(f"{s['solution_id']} ({s['front_name']})" for s in matches)
+                role_points.append({
+                    'x': coord[0],
+                    'y': coord[1],
+                    'customdata': json.dumps(solutions),
+                    'hover': (f"<b>{label[:-1]}</b><br>{names}<br>"
+                              f"{x_axis.replace('_', ' ').title()}: {fmt_val(coord[0])}<br>"
+                              f"{y_axis.replace('_', ' ').title()}: {fmt_val(coord[1])}<br>"
+                              f"{fmt_crowding(matches[0]['unique_id'])}<extra></extra>")
+                })
+            if role_points:
+                r_df = pd.DataFrame(role_points)
+                fig.add_trace(go.Scatter(
+                    x=r_df['x'],
+                    y=r_df['y'],
+                    mode='markers',
+                    name=label,
+                    customdata=r_df['customdata'],
+                    hovertemplate=r_df['hover'],
+                    marker=dict(symbol=symbol, color=marker_color, size=18, line=dict(color='white', width=1.5)),
+                    selected=dict(marker=dict(opacity=1)),
+                    unselected=dict(marker=dict(opacity=1)),
+                ))
+
+        # E. Superficies de alcance empíricas (EAF) de los frentes visibles
+        eaf_percentages = [EAF_LEVELS[o] for o in (eaf_options or []) if o in EAF_LEVELS]
+        if eaf_custom_level is not None and 0 <= eaf_custom_level <= 100:
+            eaf_percentages.append(float(eaf_custom_level))
+        eaf = front_attainment_surfaces(data_store, x_axis, y_axis, tuple(sorted(set(eaf_percentages)))) if eaf_percentages else None
+        eaf_styles = {0.0: ('#198754', 'solid'), 50.0: ('#343a40', 'dash'), 100.0: ('#dc3545', 'solid')}
+        eaf_names = {p: name for name, p in EAF_LEVELS.items()}
+        for surface in (eaf or {}).get('surfaces', []):
+            line_color, dash_style = eaf_styles.get(surface['percentage'], ('#6f42c1', 'dot'))
+            level_name = eaf_names.get(surface['percentage'], f"{surface['percentage']:g}%")
+            fig.add_trace(go.Scatter(
+                x=surface['x'],
+                y=surface['y'],
+                mode='lines',
+                line_shape='hv',
+                name=f"EAF {level_name} ({surface['k']}/{eaf['runs']} runs)",
+                line=dict(color=line_color, width=2, dash=dash_style),
+                hovertemplate=(f"<b>{surface['percentage']:g}%-attainment surface</b><br>"
+                               f"attained by ≥ {surface['k']} of {eaf['runs']} runs<extra></extra>")
+            ))
+
         # --- 7. Layout Final (CON HERRAMIENTAS ACTIVADAS) ---
         fig.update_layout(
             title=plot_title,
@@ -7,6 +7,8 @@ import pandas as pd
 from collections import defaultdict
 import json
 
+from logic.utils.decision_support import suggested_solutions
+
 
 def register_pareto_selection_callbacks(app):
     
@@ -199,6 +201,56 @@ def register_pareto_selection_callbacks(app):
 
         return current_selection, dash.no_update
 
+    # 1b. Añadir a la selección las soluciones sugeridas (knees / extremos)
+    @app.callback(
+        Output('selected-solutions-store', 'data', allow_duplicate=True),
+        Input('select-suggested-btn', 'n_clicks'),
+        [State('selected-solutions-store', 'data'),
+         State('data-store', 'data'),
+         State('decision-highlight-options', 'value'),
+         State('knee-method-select', 'value'),
+         State('knee-count-input', 'value'),
+         State('x-axis-store', 'data'),
+         State('y-axis-store', 'data')],
+        prevent_initial_call=True
+    )
+    def select_suggested_solutions(n_clicks, current_selection, data_store, highlight_options, knee_method, knee_count, x_axis, y_axis):
+        """Push the knee/extreme points of the visible fronts into the selection store."""
+        if not n_clicks or not data_store or not data_store.get('fronts'):
+            raise PreventUpdate
+
+        # Sin opciones marcadas se sugieren ambos tipos
+        roles = [r for r in (highlight_options or []) if r in ('knees', 'extremes')] or ['knees', 'extremes']
+        suggestions = suggested_solutions(data_store, roles, n_knees=int(knee_count or 1), method=knee_method or 'bulge')
+
+        current_selection = current_selection or []
+        existing_ids = {s['unique_id'] for s in current_selection}
+        new_selections = []
+        for front, sol, _ in suggestions:
+            unique_id = f"{sol['solution_id']}|{front['name']}"
+            if unique_id in existing_ids:
+                continue
+            existing_ids.add(unique_id)
+            sol_data = dict(sol)
+            sol_data['front_name'] = front['name']
+            sol_data['unique_id'] = unique_id
+            sol_data['x'] = sol.get(x_axis)
+            sol_data['y'] = sol.get(y_axis)
+            sol_data['objectives'] = front.get('objectives', [])
+            new_selections.append({
+                'id': sol['solution_id'],
+                'front_name': front['name'],
+                'unique_id': unique_id,
+                'x': sol_data['x'],
+                'y': sol_data['y'],
+                'objectives': sol_data['objectives'],
+                'full_data': sol_data
+            })
+
+        if not new_selections:
+            raise PreventUpdate
+        return current_selection + new_selections
+
     # 2. Callback para habilitar/deshabilitar botones de acción
     @app.callback(
         [Output('add-to-interest-btn', 'disabled'),
@@ -0,0 +1,179 @@
+# logic/callbacks/solution_ranking.py
+# Ranking multi-criterio (suma ponderada, TOPSIS, ASF) de las soluciones visibles en la pestaña Pareto.
+
+from datetime import datetime
+
+from dash import Output, Input, State, html, dash_table, ALL
+from dash.exceptions import PreventUpdate
+import dash_bootstrap_components as dbc
+
+from logic.utils.objectives import get_dominance_objectives
+from logic.utils.ranking import RANKING_METHODS, normalized_weights, rank_solutions
+
+SCORE_LABELS = {
+    'weighted_sum': 'Weighted sum (lower is better)',
+    'topsis': 'Closeness (higher is better)',
+    'asf': 'ASF (lower is better)',
+}
+
+
+def _ranking_inputs(objectives, weight_values, weight_ids, reference_values):
+    """Weights / reference point ordered as the dominance objectives."""
+    weights = {i['index']: v for i, v in zip(weight_ids, weight_values)}
+    references = {i['index']: v for i, v in zip(weight_ids, reference_values)}
+    reference_point = [references.get(obj) for obj in objectives]
+    if all(v is None for v in reference_point):
+        reference_point = None
+    return [weights.get(obj) for obj in objectives], reference_point
+
+
+def register_solution_ranking_callbacks(app):
+
+    # 1. Pesos y punto de referencia por objetivo
+    @app.callback(
+        Output('ranking-controls-container', 'children'),
+        Input('data-store', 'data'),
+        Input('main-tabs', 'active_tab')
+    )
+    def render_ranking_controls(data_store, active_tab):
+        if active_tab != 'pareto-tab':
+            raise PreventUpdate
+
+        objectives = get_dominance_objectives(data_store)
+        if not objectives:
+            return html.Small("Objectives will appear here once a front is loaded.", className="text-muted")
+
+        meta = (data_store or {}).get('objective_meta') or {}
+        rows = [dbc.Row([
+            dbc.Col(html.Small("Objective", className="text-muted fw-bold"), width=4),
+            dbc.Col(html.Small("Weight", className="text-muted fw-bold"), width=4),
+            dbc.Col(html.Small("Reference point (ASF)", className="text-muted fw-bold"), width=4),
+        ], className="g-2 mb-1")]
+        for obj in objectives:
+            direction = (meta.get(obj) or {}).get('direction', 'min')
+            rows.append(dbc.Row([
+                dbc.Col(html.Span([obj, html.Span(f" ({direction})", className="text-muted")], className="small fw-bold"), width=4),
+                dbc.Col(dbc.Input(
+                    id={'type': 'ranking-weight-input', 'index': obj},
+                    type='number', min=0, step=0.1, value=1, debounce=True, size="sm"
+                ), width=4),
+                dbc.Col(dbc.Input(
+                    id={'type': 'ranking-reference-input', 'index': obj},
+                    type='number', debounce=True, size="sm", placeholder="ideal"
+                ), width=4),
+            ], className="g-2 align-items-center mb-1"))
+        return rows
+
+    # 2. Tabla de ranking (se recalcula al vuelo: operaciones vectorizadas sobre la matriz normalizada cacheada)
+    @app.callback(
+        Output('ranking-results-container', 'children'),
+        Input('ranking-method-select', 'value'),
+        Input('ranking-topk-input', 'value'),
+        Input({'type': 'ranking-weight-input', 'index': ALL}, 'value'),
+        Input({'type': 'ranking-reference-input', 'index': ALL}, 'value'),
+        Input('data-store', 'data'),
+        State({'type': 'ranking-weight-input', 'index': ALL}, 'id'),
+        State('main-tabs', 'active_tab')
+    )
+    def update_ranking_table(method, top_k, weight_values, reference_values, data_store, weight_ids, active_tab):
+        if active_tab != 'pareto-tab':
+            raise PreventUpdate
+
+        objectives = get_dominance_objectives(data_store)
+        if not objectives or not weight_ids:
+            return dbc.Alert("Load at least one front to rank its solutions.",
+                             color="light", className="text-center small text-muted border-0 m-0")
+
+        weights, reference_point = _ranking_inputs(objectives, weight_values, weight_ids, reference_values)
+        ranked = rank_solutions(data_store, method, weights, reference_point, top_k=int(top_k or 10))
+        if not ranked:
+            return dbc.Alert("No visible solutions to rank.", color="light", className="small m-0")
+
+        rows = [
+            {
+                'rank': position,
+                'solution_id': sol.get('solution_id', 'N/A'),
+                'front': front['name'],
+                'score': round(score, 6) if score == score else None,
+                **{obj: sol.get(obj) for obj in objectives}
+            }
+            for position, (front, sol, score) in enumerate(ranked, start=1)
+        ]
+        columns = [
+            {'name': '#', 'id': 'rank', 'type': 'numeric'},
+            {'name': 'Solution', 'id': 'solution_id'},
+            {'name': 'Front', 'id': 'front'},
+            {'name': SCORE_LABELS.get(method, 'Score'), 'id': 'score', 'type': 'numeric'},
+        ] + [{'name': obj.replace('_', ' ').title(), 'id': obj, 'type': 'numeric'} for obj in objectives]
+
+        shown_weights = normalized_weights(weights, len(objectives))
+        return html.Div([
+            dash_table.DataTable(
+                id='ranking-table',
+                data=rows,
+                columns=columns,
+                sort_action='native',
+                page_size=15,
+                style_table={'overflowX': 'auto'},
+                style_header={'backgroundColor': '#f8f9fa', 'color': '#333', 'fontWeight': 'bold', 'borderBottom': '2px solid #dee2e6'},
+                style_cell={'textAlign': 'left', 'padding': '8px', 'fontFamily': 'sans-serif', 'fontSize': '0.9rem'},
+                style_data_conditional=[{'if': {'row_index': 'odd'}, 'backgroundColor': '#f8f9fa'}],
+            ),
+            html.Small(
+                f"{RANKING_METHODS.get(method, method)} with normalized weights "
+                + ", ".join(f"{obj}: {w:.2f}" for obj, w in zip(objectives, shown_weights)) + ".",
+                className="text-muted d-block mt-2"
+            )
+        ])
+
+    # 3. Top-k al panel de interés (como conjunto de soluciones)
+    @app.callback(
+        Output('interest-panel-store', 'data', allow_duplicate=True),
+        Input('ranking-to-interest-btn', 'n_clicks'),
+        State('ranking-method-select', 'value'),
+        State('ranking-topk-input', 'value'),
+        State({'type': 'ranking-weight-input', 'index': ALL}, 'value'),
+        State({'type': 'ranking-reference-input', 'index': ALL}, 'value'),
+        State({'type': 'ranking-weight-input', 'index': ALL}, 'id'),
+        State('data-store', 'data'),
+        State('interest-panel-store', 'data'),
+        prevent_initial_call=True
+    )
+    def add_ranking_to_interest_panel(n_clicks, method, top_k, weight_values, reference_values, weight_ids,
+                                      data_store, current_items):
+        objectives = get_dominance_objectives(data_store)
+        if not n_clicks or not objectives or not weight_ids:
+            raise PreventUpdate
+
+        weights, reference_point = _ranking_inputs(objectives, weight_values, weight_ids, reference_values)
+        ranked = rank_solutions(data_store, method, weights, reference_point, top_k=int(top_k or 10))
+        if not ranked:
+            raise PreventUpdate
+
+        solutions = []
+        all_genes = set()
+        for front, sol, score in ranked:
+            item_sol = dict(sol)
+            item_sol['front_name'] = front['name']
+            item_sol['unique_id'] = f"{sol.get('solution_id', 'N/A')}|{front['name']}"
+            item_sol.setdefault('selected_genes', [])
+            solutions.append(item_sol)
+            all_genes.update(item_sol['selected_genes'])
+
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        method_label = RANKING_METHODS.get(method, method)
+        shown_weights = normalized_weights(weights, len(objectives))
+        new_item = {
+            'type': 'solution_set',
+            'id': f"set_{len(current_items or [])}_{timestamp}",
+            'name': f"Top {len(solutions)} ({method_label})",
+            'comment': f"Top {len(solutions)} solutions by {method_label}; weights "
+                       + ", ".join(f"{obj}: {w:.2f}" for obj, w in zip(objectives, shown_weights)) + ".",
+            'tool_origin': 'Multi-Criteria Ranking',
+            'data': {
+                'solutions': solutions,
+                'unique_genes_count': len(all_genes)
+            },
+            'timestamp': timestamp
+        }
+        return (current_items or []) + [new_item]
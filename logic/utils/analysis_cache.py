@@ -0,0 +1,67 @@
+# logic/utils/analysis_cache.py
+"""
+In-process caches for analytic results, keyed by front / data versions.
+
+Every front gets a 'version' stamp when it is created (upload or consolidation);
+the data version of a store is the hash of the versions of its fronts.
+"""
+
+import hashlib
+import threading
+import uuid
+from collections import OrderedDict
+
+
+class ResultCache:
+    """Thread-safe LRU dictionary for computed results."""
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for `key`, computing (and storing) it on a miss."""
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = self.set(key, compute())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def new_front_version():
+    """Version stamp for a newly created front."""
+    return uuid.uuid4().hex
+
+
+def front_version(front):
+    """Version of a front (falls back to id + size for fronts created before versioning)."""
+    return front.get('version') or f"{front.get('id')}:{len(front.get('data', []))}"
+
+
+def data_version(data_store, visible_only=True):
+    """Stable hash of the (visible) fronts currently loaded."""
+    fronts = (data_store or {}).get('fronts', [])
+    if visible_only:
+        fronts = [f for f in fronts if f.get('visible', True)]
+    digest = hashlib.sha1('|'.join(front_version(f) for f in fronts).encode('utf-8'))
+    return digest.hexdigest()[:16]
@@ -0,0 +1,120 @@
+# logic/utils/attainment.py
+"""
+Empirical attainment function (EAF) of several runs in 2 objectives.
+
+Each visible front is one run. In the minimization space, run r attains a point
+z = (x, y) when y >= f_r(x), f_r being the staircase of its non-dominated points
+(minimum y among the points with x_i <= x). The k-attainment surface is the
+boundary of the points attained by at least k runs: g_k(x) = k-th smallest f_r(x).
+
+Sweep: the staircases are evaluated at every distinct x of all runs with a binary
+search (one vectorized searchsorted per run), then sorted across runs; g_k is the
+k-th row. Columns are processed in blocks so memory stays bounded.
+"""
+
+import math
+
+import numpy as np
+
+from logic.utils.analysis_cache import ResultCache, data_version
+from logic.utils.objectives import objective_directions, objective_matrix, to_minimization
+
+EAF_LEVELS = {'best': 0.0, 'median': 50.0, 'worst': 100.0}
+MAX_BLOCK_ELEMENTS = 4_000_000
+
+_eaf_cache = ResultCache(max_entries=32)
+
+
+def run_staircase(points):
+    """Non-dominated staircase of a 2-objective minimization matrix: x increasing, y strictly decreasing."""
+    points = np.asarray(points, dtype=float)
+    points = points[np.all(np.isfinite(points), axis=1)]
+    if points.shape[0] == 0:
+        return np.zeros(0), np.zeros(0)
+    points = points[np.lexsort((points[:, 1], points[:, 0]))]
+    best_before = np.minimum.accumulate(np.r_[np.inf, points[:-1, 1]])
+    keep = points[:, 1] < best_before
+    return points[keep, 0], points[keep, 1]
+
+
+def attainment_level(percentage, n_runs):
+    """Number of runs k of the k%-attainment surface (best = 1, worst = n_runs)."""
+    return min(n_runs, max(1, math.ceil(float(percentage) / 100.0 * n_runs)))
+
+
+def attainment_surfaces(runs, levels):
+    """
+    k-attainment surfaces of a list of (n_i, 2) minimization matrices.
+    Returns {k: (x, y)} with the vertices of each surface (x increasing, y decreasing).
+    """
+    staircases = [run_staircase(run) for run in runs]
+    staircases = [(xs, ys) for xs, ys in staircases if xs.size]
+    levels = sorted({int(k) for k in levels if 1 <= int(k) <= len(staircases)})
+    if not staircases or not levels:
+        return {}
+
+    grid = np.unique(np.concatenate([xs for xs, _ in staircases]))
+    n_runs = len(staircases)
+    surfaces = {k: np.empty(grid.size) for k in levels}
+    chunk = max(1, MAX_BLOCK_ELEMENTS // n_runs)
+    for start in range(0, grid.size, chunk):
+        block = grid[start:start + chunk]
+        values = np.full((n_runs, block.size), np.inf)
+        for r, (xs, ys) in enumerate(staircases):
+            pos = np.searchsorted(xs, block, side='right') - 1
+            valid = pos >= 0
+            values[r, valid] = ys[pos[valid]]
+        values.sort(axis=0)
+        for k in levels:
+            surfaces[k][start:start + chunk] = values[k - 1]
+
+    result = {}
+    for k, ys in surfaces.items():
+        previous = np.r_[np.inf, ys[:-1]]
+        keep = np.isfinite(ys) & (ys < previous)
+        result[k] = (grid[keep], ys[keep])
+    return result
+
+
+def front_attainment_surfaces(data_store, x_objective, y_objective, percentages=(0.0, 50.0, 100.0)):
+    """
+    Attainment surfaces of the visible fronts (one run per front) on two objectives,
+    in the original objective units.
+    Returns {'runs': n, 'surfaces': [{'percentage', 'k', 'x', 'y'}]} or None with fewer than two runs.
+    """
+    fronts = [f for f in (data_store or {}).get('fronts', []) if f.get('visible', True) and f.get('data')]
+    if len(fronts) < 2 or not x_objective or not y_objective:
+        return None
+
+    objectives = [x_objective, y_objective]
+    directions = objective_directions(data_store, objectives)
+    key = (data_version(data_store), tuple(objectives), tuple(directions), tuple(float(p) for p in percentages))
+
+    def compute():
+        signs = np.array([-1.0 if d == 'max' else 1.0 for d in directions])
+        runs = [to_minimization(objective_matrix(f['data'], objectives), directions) for f in fronts]
+        finite = np.vstack([run[np.all(np.isfinite(run), axis=1)] for run in runs])
+        if finite.shape[0] == 0:
+            return None
+
+        levels = {p: attainment_level(p, len(runs)) for p in percentages}
+        surfaces = attainment_surfaces(runs, levels.values())
+        x_end, y_top = finite[:, 0].max(), finite[:, 1].max()
+
+        result = []
+        for percentage, k in levels.items():
+            if k not in surfaces or surfaces[k][0].size == 0:
+                continue
+            xs, ys = surfaces[k]
+            # Extender la escalera hasta los bordes de los datos (vertical al inicio, horizontal al final)
+            xs = np.r_[xs[0], xs, max(x_end, xs[-1])]
+            ys = np.r_[max(y_top, ys[0]), ys, ys[-1]]
+            result.append({
+                'percentage': percentage,
+                'k': k,
+                'x': (xs * signs[0]).tolist(),
+                'y': (ys * signs[1]).tolist(),
+            })
+        return {'runs': len(runs), 'surfaces': result}
+
+    return _eaf_cache.get_or_compute(key, compute)
@@ -6,6 +6,9 @@ import base64
 import os  # <--- 1. Import necesario añadido para limpiar extensiones
 from datetime import datetime
 from logic.utils.data_validation import validate_json_structure, validate_objectives_match
+from logic.utils.dominance import assign_pareto_ranks
+from logic.utils.objectives import DERIVED_FIELDS, build_objective_meta
+from logic.utils.analysis_cache import new_front_version
 
 def validate_and_process_fronts(contents_list, filename_list, current_data):
     """
@@ -61,7 +64,7 @@ def validate_and_process_fronts(contents_list, filename_list, current_data):
         first_solution = data[0]
 
         for key, value in first_solution.items():
-            if key not in ['selected_genes', 'solution_id'] and isinstance(value, (int, float)):
+            if key not in ['selected_genes', 'solution_id', *DERIVED_FIELDS] and isinstance(value, (int, float)):
                 objectives.append(key)
                 explicit_objectives.append(key)
         
@@ -99,6 +102,7 @@ def validate_and_process_fronts(contents_list, filename_list, current_data):
         new_front = {
             "id": f"front_{front_number}_{datetime.now().strftime('%H%M%S')}", # ID interno único sigue usando timestamp
             "name": front_name, # Nombre visible asignado desde el archivo
+            "version": new_front_version(), # Versión de contenido para cachés de análisis
             "data": data,
             "objectives": objectives,
             "visible": True,
@@ -113,6 +117,10 @@ def validate_and_process_fronts(contents_list, filename_list, current_data):
 
     # 5. Generar mensaje de estado y retornar
     if new_fronts_count > 0:
+        # Metadatos de objetivos (dirección y límites) y rango de Pareto global
+        build_objective_meta(updated_data)
+        assign_pareto_ranks(updated_data)
+
         success_msg = f"Successfully loaded {new_fronts_count} front(s). Total fronts: {len(updated_data['fronts'])}"
         if errors:
             success_msg += f" | Errors: {'; '.join(errors)}"
@@ -0,0 +1,164 @@
+# logic/utils/decision_support.py
+"""
+Decision support: representative solutions of each front.
+
+- Crowding distance (NSGA-II), computed for all objectives at once.
+- Knee points: maximum convex bulge (distance below the hyperplane through the
+  extreme points) or expected marginal utility over sampled weight vectors.
+- Extreme points: best solution of the front on each objective.
+
+Everything runs on the normalized minimization space shared by all fronts
+(see logic.utils.objectives), over the non-dominated subset of each front.
+"""
+
+import numpy as np
+
+from logic.utils.analysis_cache import ResultCache, front_version
+from logic.utils.dominance import non_dominated_mask
+from logic.utils.objectives import objective_space
+
+KNEE_METHODS = ('bulge', 'utility')
+UTILITY_SAMPLES = 1000
+UTILITY_CHUNK = 250
+
+_decision_cache = ResultCache(max_entries=128)
+
+
+def crowding_distance(points):
+    """NSGA-II crowding distance of every row (boundary points get +inf)."""
+    points = np.asarray(points, dtype=float)
+    n, m = points.shape if points.ndim == 2 else (0, 0)
+    if n == 0:
+        return np.zeros(0)
+    if n <= 2:
+        return np.full(n, np.inf)
+
+    order = np.argsort(points, axis=0, kind='mergesort')
+    sorted_values = np.take_along_axis(points, order, axis=0)
+    span = sorted_values[-1] - sorted_values[0]
+    span[span == 0] = 1.0
+
+    contributions = np.zeros((n, m))
+    gaps = (sorted_values[2:] - sorted_values[:-2]) / span
+    np.put_along_axis(contributions, order[1:-1], gaps, axis=0)
+    np.put_along_axis(contributions, order[[0, -1]], np.inf, axis=0)
+    return contributions.sum(axis=1)
+
+
+def extreme_points(points):
+    """Index of the best row on each objective (ties broken by the sum of objectives)."""
+    points = np.asarray(points, dtype=float)
+    if points.ndim != 2 or points.shape[0] == 0:
+        return []
+    totals = points.sum(axis=1)
+    extremes = []
+    for j in range(points.shape[1]):
+        candidates = np.flatnonzero(points[:, j] == points[:, j].min())
+        extremes.append(int(candidates[np.argmin(totals[candidates])]))
+    return sorted(set(extremes))
+
+
+def _bulge_scores(points):
+    """Signed distance below the hyperplane through the extreme points (None if degenerate)."""
+    m = points.shape[1]
+    anchors = points[[int(np.argmin(points[:, j])) for j in range(m)]]
+    try:
+        normal = np.linalg.solve(anchors, np.ones(m))
+    except np.linalg.LinAlgError:
+        return None
+    norm = np.linalg.norm(normal)
+    if not np.isfinite(norm) or norm == 0:
+        return None
+    return (1.0 - points @ normal) / norm
+
+
+def _marginal_utility_scores(points, n_samples=UTILITY_SAMPLES, seed=0):
+    """Expected marginal utility of each row over uniformly sampled weight vectors."""
+    n, m = points.shape
+    rng = np.random.default_rng(seed)
+    scores = np.zeros(n)
+    for start in range(0, n_samples, UTILITY_CHUNK):
+        weights = rng.dirichlet(np.ones(m), size=min(UTILITY_CHUNK, n_samples - start))
+        # (pesos x puntos): mejor y segundo mejor recorren filas contiguas
+        utilities = weights @ points.T
+        rows = np.arange(weights.shape[0])
+        best_idx = np.argmin(utilities, axis=1)
+        best_values = utilities[rows, best_idx]
+        utilities[rows, best_idx] = np.inf
+        gain = utilities.min(axis=1) - best_values
+        scores += np.bincount(best_idx, weights=gain, minlength=n)
+    return scores / n_samples
+
+
+def knee_points(points, n_knees=1, method='bulge'):
+    """Indices of the `n_knees` knee points of a normalized, non-dominated set."""
+    points = np.asarray(points, dtype=float)
+    if points.ndim != 2 or points.shape[0] < 3 or points.shape[1] < 2 or n_knees <= 0:
+        return []
+
+    scores = _bulge_scores(points) if method == 'bulge' else None
+    if scores is None:
+        scores = _marginal_utility_scores(points)
+    ranked = np.argsort(-scores, kind='mergesort')
+    ranked = ranked[scores[ranked] > 0]
+    return [int(i) for i in ranked[:n_knees]]
+
+
+def _front_decision_points(matrix, n_knees, method):
+    """Crowding/knees/extremes of one normalized front (indices refer to the front's data list)."""
+    n = matrix.shape[0]
+    crowding = np.full(n, np.nan)
+    finite = np.flatnonzero(np.all(np.isfinite(matrix), axis=1))
+    if finite.size == 0:
+        return {'crowding': crowding.tolist(), 'knees': [], 'extremes': []}
+
+    candidates = finite[non_dominated_mask(matrix[finite])]
+    points = matrix[candidates]
+    crowding[candidates] = crowding_distance(points)
+    return {
+        'crowding': crowding.tolist(),
+        'knees': [int(candidates[i]) for i in knee_points(points, n_knees, method)],
+        'extremes': [int(candidates[i]) for i in extreme_points(points)],
+    }
+
+
+def front_decision_points(data_store, n_knees=1, method='bulge', visible_only=True):
+    """
+    Representative solutions of every (visible) front.
+    Returns {front_id: {'crowding': [...], 'knees': [idx], 'extremes': [idx]}};
+    crowding is NaN for solutions that are dominated within their own front.
+    """
+    fronts = [f for f in (data_store or {}).get('fronts', []) if f.get('visible', True) or not visible_only]
+    space = objective_space(data_store)
+    if not fronts or not space.objectives or space.ideal is None:
+        return {}
+
+    method = method if method in KNEE_METHODS else 'bulge'
+    space_key = space.key[2:] + (tuple(np.round(space.ideal, 12)), tuple(np.round(space.span, 12)))
+    results = {}
+    for front in fronts:
+        key = (front_version(front), space_key, int(n_knees), method)
+        results[front['id']] = _decision_cache.get_or_compute(
+            key, lambda matrix=space.normalized[front['id']]: _front_decision_points(matrix, n_knees, method)
+        )
+    return results
+
+
+def suggested_solutions(data_store, roles=('knees', 'extremes'), n_knees=1, method='bulge'):
+    """
+    Flatten the representative solutions of the visible fronts.
+    Returns a list of (front, solution, [roles]) in front order.
+    """
+    decision = front_decision_points(data_store, n_knees, method)
+    suggestions = []
+    for front in (data_store or {}).get('fronts', []):
+        points = decision.get(front['id'])
+        if not points:
+            continue
+        role_by_index = {}
+        for role in roles:
+            for idx in points.get(role, []):
+                role_by_index.setdefault(idx, []).append(role)
+        for idx in sorted(role_by_index):
+            suggestions.append((front, front['data'][idx], role_by_index[idx]))
+    return suggestions
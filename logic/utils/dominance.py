@@ -0,0 +1,249 @@
+# logic/utils/dominance.py
+"""
+Non-dominated sorting engine.
+
+All functions expect an (n, m) matrix already oriented for minimization
+(see logic.utils.objectives.to_minimization).
+- 2 objectives: O(n log n) sweep (cumulative minimum / binary search per front).
+- M objectives: sort-filter over lexicographically ordered points, checked in
+  vectorized blocks so memory stays bounded.
+- NonDominatedArchive: incremental archive for streaming many fronts; memory is
+  bounded by the archive plus one input chunk.
+"""
+
+from bisect import bisect_right
+
+import numpy as np
+
+from logic.utils.objectives import get_dominance_objectives, objective_directions, objective_matrix, objective_space, to_minimization
+
+# Tamaño de bloque para las comparaciones vectorizadas (filas x filas x objetivos)
+BLOCK_SIZE = 1024
+ARCHIVE_CHUNK = 4096
+STREAM_CHUNK = 2048
+
+
+def _unique_rows(matrix):
+    """Lexicographically sorted unique rows and the inverse index (row -> unique row)."""
+    n = matrix.shape[0]
+    order = np.lexsort(matrix.T[::-1])
+    sorted_rows = matrix[order]
+    is_new = np.ones(n, dtype=bool)
+    if n > 1:
+        is_new[1:] = np.any(sorted_rows[1:] != sorted_rows[:-1], axis=1)
+    group = np.cumsum(is_new) - 1
+    inverse = np.empty(n, dtype=np.int64)
+    inverse[order] = group
+    return sorted_rows[is_new], inverse
+
+
+def weak_dominance_matrix(left, right):
+    """le[i, j] is True when left[i] <= right[j] in every objective."""
+    le = left[:, None, 0] <= right[None, :, 0]
+    for k in range(1, left.shape[1]):
+        le &= left[:, None, k] <= right[None, :, k]
+    return le
+
+
+def _weakly_dominated_by(block, archive):
+    """Boolean per block row: is it weakly dominated by any archive row."""
+    dominated = np.zeros(len(block), dtype=bool)
+    for start in range(0, len(archive), ARCHIVE_CHUNK):
+        chunk = archive[start:start + ARCHIVE_CHUNK]
+        dominated |= weak_dominance_matrix(chunk, block).any(axis=0)
+    return dominated
+
+
+def _sorted_unique_front_mask(points):
+    """Non-dominated mask for unique, lexicographically sorted points."""
+    n, m = points.shape
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+
+    if m == 1:
+        mask = np.zeros(n, dtype=bool)
+        mask[0] = True
+        return mask
+
+    if m == 2:
+        # Un punto sólo puede ser dominado por puntos anteriores en orden lexicográfico
+        mask = np.ones(n, dtype=bool)
+        running_min = np.minimum.accumulate(points[:, 1])
+        mask[1:] = points[1:, 1] < running_min[:-1]
+        return mask
+
+    mask = np.zeros(n, dtype=bool)
+    archive = np.empty((0, m))
+    for start in range(0, n, BLOCK_SIZE):
+        block = points[start:start + BLOCK_SIZE]
+        candidates = np.arange(len(block))
+        if len(archive):
+            candidates = candidates[~_weakly_dominated_by(block, archive)]
+        if candidates.size == 0:
+            continue
+        # Dominancia dentro del bloque (las filas son únicas, así que <= implica dominancia estricta)
+        survivors = block[candidates]
+        within = weak_dominance_matrix(survivors, survivors)
+        np.fill_diagonal(within, False)
+        keep = candidates[~within.any(axis=0)]
+        mask[start + keep] = True
+        archive = np.vstack([archive, block[keep]])
+    return mask
+
+
+def non_dominated_mask(matrix):
+    """Boolean mask of the non-dominated rows of a minimization matrix (duplicates are kept)."""
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.ndim != 2 or matrix.shape[0] == 0:
+        return np.zeros(len(matrix), dtype=bool)
+    unique_points, inverse = _unique_rows(matrix)
+    return _sorted_unique_front_mask(unique_points)[inverse]
+
+
+def non_dominated_ranks(matrix):
+    """Pareto rank of every row (1 = non-dominated). Identical rows share the same rank."""
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.ndim != 2 or matrix.shape[0] == 0:
+        return np.zeros(len(matrix), dtype=np.int64)
+
+    unique_points, inverse = _unique_rows(matrix)
+    n, m = unique_points.shape
+    ranks = np.zeros(n, dtype=np.int64)
+
+    if m == 1:
+        # Con un objetivo cada valor distinto es un nivel nuevo
+        return np.arange(1, n + 1)[inverse]
+
+    if m == 2:
+        # Barrido O(n log n): para cada frente guardamos el menor f2 (el último insertado)
+        second = unique_points[:, 1]
+        front_tails = []
+        for i in range(n):
+            y = second[i]
+            k = bisect_right(front_tails, y)
+            if k == len(front_tails):
+                front_tails.append(y)
+            else:
+                front_tails[k] = y
+            ranks[i] = k + 1
+        return ranks[inverse]
+
+    # M objetivos: pelado sucesivo de frentes reutilizando el filtro ordenado
+    remaining = np.arange(n)
+    level = 1
+    while remaining.size:
+        front = _sorted_unique_front_mask(unique_points[remaining])
+        ranks[remaining[front]] = level
+        remaining = remaining[~front]
+        level += 1
+    return ranks[inverse]
+
+
+class NonDominatedArchive:
+    """
+    Incremental non-dominated archive (minimization). Each point carries a payload
+    (e.g. its provenance); exact duplicates keep the first payload seen.
+    """
+
+    def __init__(self, n_objectives):
+        self.points = np.empty((0, n_objectives))
+        self.payloads = []
+
+    def __len__(self):
+        return len(self.payloads)
+
+    def add(self, points, payloads):
+        """Insert a chunk of points; returns the number of points that entered the archive."""
+        points = np.asarray(points, dtype=float).reshape(-1, self.points.shape[1])
+        finite = np.all(np.isfinite(points), axis=1)
+        points = points[finite]
+        payloads = [p for p, keep in zip(payloads, finite) if keep]
+        if points.shape[0] == 0:
+            return 0
+
+        # 1. Frente del propio bloque (sin duplicados: se conserva la primera aparición)
+        unique_points, inverse = _unique_rows(points)
+        first_index = np.full(unique_points.shape[0], points.shape[0], dtype=np.int64)
+        np.minimum.at(first_index, inverse, np.arange(points.shape[0]))
+        keep = first_index[_sorted_unique_front_mask(unique_points)]
+        keep.sort()
+        candidates = points[keep]
+
+        # 2. Descartar los dominados (o repetidos) por el archivo
+        if len(self.payloads):
+            survivors = ~_weakly_dominated_by(candidates, self.points)
+            keep, candidates = keep[survivors], candidates[survivors]
+            if candidates.shape[0] == 0:
+                return 0
+
+            # 3. Eliminar del archivo lo que dominan los nuevos puntos
+            dominated = np.zeros(len(self.payloads), dtype=bool)
+            for start in range(0, len(self.payloads), ARCHIVE_CHUNK):
+                dominated[start:start + ARCHIVE_CHUNK] = _weakly_dominated_by(self.points[start:start + ARCHIVE_CHUNK], candidates)
+            if dominated.any():
+                self.points = self.points[~dominated]
+                self.payloads = [p for p, d in zip(self.payloads, dominated) if not d]
+
+        self.points = np.vstack([self.points, candidates])
+        self.payloads.extend(payloads[i] for i in keep)
+        return int(candidates.shape[0])
+
+
+def merge_fronts_non_dominated(data_store, fronts=None, chunk_size=STREAM_CHUNK, keep_duplicates=False):
+    """
+    Stream the solutions of `fronts` (default: visible fronts) through a NonDominatedArchive.
+    Returns a list of (front, solution_index) for the merged non-dominated set. With
+    `keep_duplicates`, every solution sharing the objective vector of an archived point is
+    returned (like non_dominated_mask), not only the first one seen.
+    """
+    if fronts is None:
+        fronts = [f for f in (data_store or {}).get('fronts', []) if f.get('visible', True)]
+    objectives = get_dominance_objectives(data_store)
+    if not objectives:
+        return []
+    directions = objective_directions(data_store, objectives)
+
+    def chunks():
+        for front in fronts:
+            solutions = front.get('data', [])
+            for start in range(0, len(solutions), chunk_size):
+                chunk = solutions[start:start + chunk_size]
+                yield front, start, to_minimization(objective_matrix(chunk, objectives), directions)
+
+    archive = NonDominatedArchive(len(objectives))
+    for front, start, oriented in chunks():
+        archive.add(oriented, [(front, start + i) for i in range(len(oriented))])
+    if not keep_duplicates:
+        return archive.payloads
+
+    # Segunda pasada: todas las soluciones cuyo vector coincide con un punto del archivo
+    archived = {tuple(point) for point in archive.points.tolist()}
+    return [(front, start + i) for front, start, oriented in chunks()
+            for i, point in enumerate(oriented.tolist()) if tuple(point) in archived]
+
+
+def assign_pareto_ranks(data_store):
+    """
+    Pool the solutions of every loaded front, rank them by non-domination and
+    store the result in each solution as 'pareto_rank'. Returns the data_store.
+    """
+    if not data_store or not data_store.get('fronts'):
+        return data_store
+
+    space = objective_space(data_store)
+    if not space.objectives:
+        return data_store
+
+    fronts = data_store['fronts']
+    all_solutions = [sol for front in fronts for sol in front.get('data', [])]
+    if not all_solutions:
+        return data_store
+
+    # Matrices orientadas del espacio compartido (mismo orden que all_solutions)
+    oriented = np.vstack([space.oriented[front['id']] for front in fronts])
+    ranks = non_dominated_ranks(oriented)
+
+    for sol, rank in zip(all_solutions, ranks):
+        sol['pareto_rank'] = int(rank)
+
+    return data_store
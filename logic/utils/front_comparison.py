@@ -0,0 +1,118 @@
+# logic/utils/front_comparison.py
+"""
+Pairwise comparison of the loaded fronts.
+
+- Coverage C(A, B) (Zitzler): fraction of the points of B weakly dominated by
+  at least one point of A.
+- Dominance counts: number of points of B strictly dominated by A.
+
+Each front A is reduced to its non-dominated set once, and then the unique points
+of all fronts (sorted on the first objective) are checked against it in one pass:
+- 1-2 objectives: staircase + binary search (O(N log |A|)).
+- M objectives: blocked, vectorized weak-dominance checks; each block is only
+  compared with the prefix of A that can dominate it on the first objective.
+Per-front counts come from np.add.reduceat over the stacked points.
+"""
+
+import numpy as np
+
+from logic.utils.analysis_cache import ResultCache
+from logic.utils.dominance import BLOCK_SIZE, _unique_rows, _weakly_dominated_by, non_dominated_mask
+from logic.utils.objectives import objective_space
+
+_comparison_cache = ResultCache(max_entries=32)
+
+
+def weakly_dominated_by_front(front, points):
+    """
+    Boolean per row of `points`: weakly dominated by some row of the non-dominated `front`.
+    `points` must be sorted on the first objective (e.g. lexicographically sorted unique rows).
+    """
+    n, m = points.shape
+    if front.shape[0] == 0 or n == 0:
+        return np.zeros(n, dtype=bool)
+
+    if m == 1:
+        return points[:, 0] >= front[:, 0].min()
+
+    front = front[np.argsort(front[:, 0], kind='mergesort')]
+    if m == 2:
+        # Escalera: f1 creciente, f2 decreciente -> el último a con a1 <= b1 tiene el menor a2
+        pos = np.searchsorted(front[:, 0], points[:, 0], side='right') - 1
+        dominated = np.zeros(n, dtype=bool)
+        valid = pos >= 0
+        dominated[valid] = front[pos[valid], 1] <= points[valid, 1]
+        return dominated
+
+    # Bloques sobre puntos ordenados por f1: sólo el prefijo de A con a1 <= max(b1) puede dominar
+    dominated = np.zeros(n, dtype=bool)
+    for start in range(0, n, BLOCK_SIZE):
+        block = points[start:start + BLOCK_SIZE]
+        limit = np.searchsorted(front[:, 0], block[-1, 0], side='right')
+        if limit:
+            dominated[start:start + BLOCK_SIZE] = _weakly_dominated_by(block, front[:limit])
+    return dominated
+
+
+def compare_front_matrices(matrices):
+    """
+    Coverage and dominance-count matrices for a list of oriented matrices.
+    Returns (coverage, dominated, sizes); entry [i, j] compares front i against front j.
+    """
+    cleaned = [m[np.all(np.isfinite(m), axis=1)] for m in matrices]
+    sizes = np.array([m.shape[0] for m in cleaned])
+    n_fronts = len(cleaned)
+    coverage = np.full((n_fronts, n_fronts), np.nan)
+    dominated = np.zeros((n_fronts, n_fronts), dtype=np.int64)
+    non_empty = np.flatnonzero(sizes)
+    if non_empty.size == 0:
+        return coverage, dominated, sizes
+    coverage[:, non_empty] = 0.0
+
+    # Todas las comparaciones se hacen sobre las filas únicas (ordenadas) del conjunto apilado
+    stacked = np.vstack([cleaned[j] for j in non_empty])
+    offsets = np.concatenate([[0], np.cumsum(sizes[non_empty])[:-1]])
+    unique_points, inverse = _unique_rows(stacked)
+
+    for pos, i in enumerate(non_empty):
+        rows = inverse[offsets[pos]:offsets[pos] + sizes[i]]
+        front_ids = np.unique(rows[non_dominated_mask(cleaned[i])])
+        weak_unique = weakly_dominated_by_front(unique_points[front_ids], unique_points)
+        # En un conjunto no dominado, un punto igual a uno de A no puede estar dominado estrictamente por A
+        strict_unique = weak_unique.copy()
+        strict_unique[front_ids] = False
+        weak, strict = weak_unique[inverse], strict_unique[inverse]
+        coverage[i, non_empty] = np.add.reduceat(weak.astype(np.int64), offsets) / sizes[non_empty]
+        dominated[i, non_empty] = np.add.reduceat(strict.astype(np.int64), offsets)
+
+    np.fill_diagonal(coverage, np.nan)
+    np.fill_diagonal(dominated, 0)
+    return coverage, dominated, sizes
+
+
+def pairwise_front_comparison(data_store):
+    """
+    Pairwise coverage / dominance counts of the visible fronts (cached per data version).
+    Returns {'names', 'ids', 'sizes', 'coverage', 'dominated'} or None.
+    """
+    fronts = [f for f in (data_store or {}).get('fronts', []) if f.get('visible', True)]
+    if len(fronts) < 2:
+        return None
+    space = objective_space(data_store)
+    if not space.objectives:
+        return None
+
+    # Los nombres no cambian la versión del frente: se incluyen para que un renombrado se refleje
+    key = (space.key, tuple((f['id'], f['name']) for f in fronts))
+
+    def compute():
+        coverage, dominated, sizes = compare_front_matrices([space.oriented[f['id']] for f in fronts])
+        return {
+            'names': [f['name'] for f in fronts],
+            'ids': [f['id'] for f in fronts],
+            'sizes': sizes.tolist(),
+            'coverage': coverage,
+            'dominated': dominated,
+        }
+
+    return _comparison_cache.get_or_compute(key, compute)
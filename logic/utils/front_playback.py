@@ -0,0 +1,93 @@
+# logic/utils/front_playback.py
+"""
+Playback of the loaded fronts as an ordered sequence (generations / checkpoints).
+
+All frames are precomputed on the server in one pass: the points of every front
+on the two plotted objectives (large fronts reduced to their epsilon-box
+representatives), the axis ranges shared by every frame and the per-frame
+indicators (hypervolume in the shared normalized space, size, non-dominated
+count). The callback turns them into a single Plotly figure with frames, so
+playing and scrubbing run in the browser.
+"""
+
+import re
+
+import numpy as np
+
+from logic.utils.analysis_cache import ResultCache
+from logic.utils.dominance import non_dominated_mask
+from logic.utils.front_reduction import thinned_fronts
+from logic.utils.hypervolume import front_hypervolumes
+from logic.utils.objectives import objective_directions, objective_matrix, objective_space, to_minimization
+
+PLAYBACK_ORDERS = ('upload', 'name')
+PLAYBACK_MAX_POINTS = 1000
+AXIS_PADDING = 0.05
+
+_playback_cache = ResultCache(max_entries=16)
+
+
+def natural_key(name):
+    """Sort key that orders 'gen_2' before 'gen_10'."""
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', str(name))]
+
+
+def _axis_range(values):
+    values = values[np.isfinite(values)]
+    if values.size == 0:
+        return None
+    low, high = float(values.min()), float(values.max())
+    pad = (high - low) * AXIS_PADDING or abs(high) * AXIS_PADDING or 1.0
+    return [low - pad, high + pad]
+
+
+def playback_frames(data_store, x_objective, y_objective, order='upload', reference_point=None):
+    """
+    Frames of the loaded fronts (visible or not) in upload order or natural name order.
+    Returns {'frames': [{'front_id', 'name', 'x', 'y', 'size', 'shown', 'non_dominated', 'hv', 'hv_exact'}],
+             'x_range', 'y_range'} or None.
+    """
+    fronts = [f for f in (data_store or {}).get('fronts', []) if f.get('data')]
+    if not fronts or not x_objective or not y_objective:
+        return None
+    if order == 'name':
+        fronts = sorted(fronts, key=lambda f: natural_key(f['name']))
+    # Espacio compartido (versión, sentidos y límites del usuario), sentidos de los ejes y nombres (etiquetas/orden)
+    directions = objective_directions(data_store, [x_objective, y_objective])
+    key = (objective_space(data_store).key, x_objective, y_objective, tuple(directions), order,
+           tuple(reference_point) if reference_point else None, tuple(f['name'] for f in fronts))
+
+    def compute():
+        # Todos los frentes cuentan como visibles para la reducción a representantes
+        all_visible = {**data_store, 'fronts': [{**f, 'visible': True} for f in data_store.get('fronts', [])]}
+        shown_fronts = {f['id']: f for f in thinned_fronts(all_visible, PLAYBACK_MAX_POINTS)}
+        hv_by_front = front_hypervolumes(data_store, reference_point)
+
+        frames, all_x, all_y = [], [], []
+        for front in fronts:
+            shown = objective_matrix(shown_fronts[front['id']]['data'], [x_objective, y_objective]).reshape(-1, 2)
+            oriented = to_minimization(objective_matrix(front['data'], [x_objective, y_objective]), directions).reshape(-1, 2)
+            finite = np.all(np.isfinite(oriented), axis=1)
+            non_dominated = int(non_dominated_mask(oriented[finite]).sum()) if finite.any() else 0
+            hv = hv_by_front.get(front['id']) or {}
+            frames.append({
+                'front_id': front['id'],
+                'name': front['name'],
+                'x': shown[:, 0].tolist(),
+                'y': shown[:, 1].tolist(),
+                'size': len(front['data']),
+                'shown': int(shown.shape[0]),
+                'non_dominated': non_dominated,
+                'hv': hv.get('hv'),
+                'hv_exact': hv.get('exact', True),
+            })
+            all_x.append(shown[:, 0])
+            all_y.append(shown[:, 1])
+
+        return {
+            'frames': frames,
+            'x_range': _axis_range(np.concatenate(all_x)),
+            'y_range': _axis_range(np.concatenate(all_y)),
+        }
+
+    return _playback_cache.get_or_compute(key, compute)
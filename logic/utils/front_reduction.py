@@ -0,0 +1,266 @@
+# logic/utils/front_reduction.py
+"""
+Reduction of fronts to representative solutions.
+
+Every reduction labels the solutions of a front with a group id and keeps one
+representative per group. Representatives carry the ids of the solutions they
+stand for ('represents') and how many they are ('represented_count'); reducing
+an already reduced front merges those lists, so the original ids are never lost.
+
+- collapse_near_duplicates: groups = near-duplicate gene subsets (MinHash/LSH).
+- thin_fronts: groups = epsilon-boxes of the normalized objective space. Only
+  non-dominated boxes keep a representative (the point closest to the box
+  corner); solutions of dominated boxes are attributed to the nearest kept box
+  that dominates them. A target size is reached by bisection on epsilon (each
+  step is one vectorized pass: floor, unique rows, non-dominated boxes).
+"""
+
+import copy
+
+import numpy as np
+
+from logic.utils.analysis_cache import ResultCache, front_version, new_front_version
+from logic.utils.dominance import _unique_rows, assign_pareto_ranks, non_dominated_mask, weak_dominance_matrix
+from logic.utils.gene_sets import incidence_matrix
+from logic.utils.near_duplicates import DEFAULT_THRESHOLD, near_duplicate_labels
+from logic.utils.objectives import build_objective_meta, objective_space
+
+# Bisección de epsilon (espacio normalizado [0, 1]) y tamaño de bloque para asignar cajas dominadas
+EPSILON_RANGE = (1e-6, 1.5)
+EPSILON_ITERATIONS = 30
+MAX_BLOCK_ELEMENTS = 4_000_000
+REPORT_MAX_POINTS = 500
+
+_reduction_cache = ResultCache(max_entries=64)
+
+
+def group_representatives(labels, priority=None):
+    """
+    Representative row of each group: lowest `priority` (e.g. Pareto rank), ties -> first row.
+    Returns an array indexed by label.
+    """
+    labels = np.asarray(labels, dtype=np.int64)
+    n = labels.size
+    priority = np.zeros(n) if priority is None else np.asarray(priority, dtype=float)
+    order = np.lexsort((np.arange(n), priority, labels))
+    first = np.r_[True, labels[order][1:] != labels[order][:-1]]
+    representatives = np.empty(labels.max() + 1 if n else 0, dtype=np.int64)
+    representatives[labels[order][first]] = order[first]
+    return representatives
+
+
+def _pareto_priority(solutions):
+    return np.array([s.get('pareto_rank') if isinstance(s.get('pareto_rank'), (int, float)) else np.inf
+                     for s in solutions], dtype=float)
+
+
+def represented_ids(solution):
+    """Ids of the original solutions a (possibly reduced) solution stands for."""
+    return list(solution.get('represents') or [solution.get('solution_id', 'N/A')])
+
+
+def reduced_front_data(solutions, labels, representatives):
+    """Representative solutions (copies, in original order) with their 'represents' bookkeeping."""
+    members = {}
+    for idx, label in enumerate(labels):
+        members.setdefault(int(label), []).extend(represented_ids(solutions[idx]))
+
+    reduced = []
+    for idx in np.sort(representatives):
+        sol = dict(solutions[idx])
+        sol['represents'] = members[int(labels[idx])]
+        sol['represented_count'] = len(sol['represents'])
+        reduced.append(sol)
+    return reduced
+
+
+def duplicate_labels(front, threshold=DEFAULT_THRESHOLD):
+    """Near-duplicate cluster label of each solution of a front (cached per front version)."""
+    key = ('duplicates', front_version(front), round(float(threshold), 6))
+
+    def compute():
+        matrix, _ = incidence_matrix([s.get('selected_genes') or [] for s in front.get('data', [])])
+        return near_duplicate_labels(matrix, threshold)
+
+    return _reduction_cache.get_or_compute(key, compute)
+
+
+def near_duplicate_summary(data_store, threshold=DEFAULT_THRESHOLD):
+    """Per visible front: {'front', 'solutions', 'clusters', 'duplicate_clusters', 'removable'}."""
+    summary = []
+    for front in (data_store or {}).get('fronts', []):
+        if not front.get('visible', True) or not front.get('data'):
+            continue
+        labels = duplicate_labels(front, threshold)
+        counts = np.bincount(labels)
+        summary.append({
+            'front': front['name'],
+            'solutions': int(labels.size),
+            'clusters': int(counts.size),
+            'duplicate_clusters': int((counts > 1).sum()),
+            'removable': int(labels.size - counts.size),
+        })
+    return summary
+
+
+def _replace_front_data(data_store, reducer):
+    """Apply `reducer(front) -> new data | None` to the visible fronts, keeping a restore snapshot."""
+    reduced_fronts, changed = [], []
+    for front in data_store.get('fronts', []):
+        new_data = reducer(front) if front.get('visible', True) and front.get('data') else None
+        if new_data is None or len(new_data) == len(front['data']):
+            reduced_fronts.append(front)
+            continue
+        changed.append((front['name'], len(front['data']), len(new_data)))
+        reduced_fronts.append({**front, 'data': new_data, 'version': new_front_version()})
+
+    if not changed:
+        return data_store, []
+
+    updated_data = data_store.copy()
+    updated_data.setdefault('fronts_history', []).append(copy.deepcopy(data_store.get('fronts', [])))
+    updated_data['fronts'] = reduced_fronts
+    build_objective_meta(updated_data)
+    assign_pareto_ranks(updated_data)
+    return updated_data, changed
+
+
+def collapse_near_duplicates(data_store, threshold=DEFAULT_THRESHOLD):
+    """
+    Replace every visible front by one representative per near-duplicate cluster
+    (best Pareto rank of the cluster). Returns (updated_store, [(front, before, after)]).
+    """
+    def reducer(front):
+        labels = duplicate_labels(front, threshold)
+        representatives = group_representatives(labels, _pareto_priority(front['data']))
+        return reduced_front_data(front['data'], labels, representatives)
+
+    return _replace_front_data(data_store, reducer)
+
+
+def _epsilon_boxes(points, epsilon):
+    """Unique boxes, row -> box index and the non-dominated box mask for one epsilon."""
+    boxes, inverse = _unique_rows(np.floor(points / epsilon))
+    return boxes, inverse, non_dominated_mask(boxes)
+
+
+def epsilon_box_thinning(points, epsilon):
+    """
+    Epsilon-box reduction of a finite, normalized minimization matrix.
+    Returns (labels, representatives): each row's group and the representative row of each group.
+    """
+    boxes, inverse, kept = _epsilon_boxes(points, epsilon)
+    kept_ids = np.flatnonzero(kept)
+    box_label = np.empty(len(boxes), dtype=np.int64)
+    box_label[kept_ids] = np.arange(kept_ids.size)
+
+    # Cajas dominadas -> caja conservada más cercana (L1 en celdas) entre las que la dominan
+    dominated_ids = np.flatnonzero(~kept)
+    kept_boxes = boxes[kept_ids]
+    chunk = max(1, MAX_BLOCK_ELEMENTS // max(kept_ids.size * points.shape[1], 1))
+    for start in range(0, dominated_ids.size, chunk):
+        block = boxes[dominated_ids[start:start + chunk]]
+        dominates = weak_dominance_matrix(kept_boxes, block)
+        distance = np.abs(kept_boxes[:, None, :] - block[None, :, :]).sum(axis=2)
+        distance[~dominates] = np.inf
+        box_label[dominated_ids[start:start + chunk]] = np.argmin(distance, axis=0)
+
+    labels = box_label[inverse]
+    # Representante: el punto de la caja conservada más cercano a su esquina inferior
+    in_kept = kept[inverse]
+    corner_distance = np.linalg.norm(points - np.floor(points / epsilon) * epsilon, axis=1)
+    candidates = np.flatnonzero(in_kept)
+    order = candidates[np.lexsort((corner_distance[candidates], labels[candidates]))]
+    first = np.r_[True, labels[order][1:] != labels[order][:-1]]
+    representatives = np.empty(kept_ids.size, dtype=np.int64)
+    representatives[labels[order][first]] = order[first]
+    return labels, representatives
+
+
+def epsilon_for_target(points, target_size):
+    """Smallest epsilon (bisection in log scale) whose non-dominated boxes are at most `target_size`."""
+    low, high = np.log(EPSILON_RANGE[0]), np.log(EPSILON_RANGE[1])
+    if _epsilon_boxes(points, np.exp(low))[2].sum() <= target_size:
+        return float(np.exp(low))
+    for _ in range(EPSILON_ITERATIONS):
+        middle = (low + high) / 2
+        count = _epsilon_boxes(points, np.exp(middle))[2].sum()
+        if count == target_size:
+            return float(np.exp(middle))
+        if count < target_size:
+            high = middle
+        else:
+            low = middle
+    return float(np.exp(high))
+
+
+def thin_points(points, target_size=None, epsilon=None):
+    """
+    Thin a normalized minimization matrix to `target_size` representatives or to a fixed `epsilon` grid.
+    Rows with non-finite objectives are kept as their own group.
+    Returns (labels, representatives, epsilon).
+    """
+    points = np.asarray(points, dtype=float)
+    finite = np.all(np.isfinite(points), axis=1)
+    finite_rows = np.flatnonzero(finite)
+    other_rows = np.flatnonzero(~finite)
+    if finite_rows.size == 0:
+        return np.arange(len(points)), np.arange(len(points)), None
+
+    if epsilon is None:
+        target = max(1, int(target_size) - other_rows.size) if target_size else finite_rows.size
+        epsilon = epsilon_for_target(points[finite_rows], target)
+    finite_labels, finite_representatives = epsilon_box_thinning(points[finite_rows], float(epsilon))
+
+    labels = np.empty(len(points), dtype=np.int64)
+    labels[finite_rows] = finite_labels
+    labels[other_rows] = finite_representatives.size + np.arange(other_rows.size)
+    representatives = np.concatenate([finite_rows[finite_representatives], other_rows])
+    return labels, representatives, float(epsilon)
+
+
+def _thinning_groups(data_store, front, target_size=None, epsilon=None):
+    """(labels, representatives, epsilon) of a front in the shared normalized space (cached)."""
+    space = objective_space(data_store)
+    if not space.objectives or space.ideal is None or front['id'] not in space.normalized:
+        return None
+    space_key = space.key[2:] + (tuple(np.round(space.ideal, 12)), tuple(np.round(space.span, 12)))
+    key = ('thinning', front_version(front), space_key, target_size, epsilon)
+    return _reduction_cache.get_or_compute(
+        key, lambda: thin_points(space.normalized[front['id']], target_size, epsilon)
+    )
+
+
+def thin_fronts(data_store, target_size=None, epsilon=None):
+    """
+    Replace every visible front by its epsilon-box representatives (target size or fixed epsilon).
+    Returns (updated_store, [(front, before, after)]).
+    """
+    def reducer(front):
+        if epsilon is None and (not target_size or len(front['data']) <= target_size):
+            return None
+        groups = _thinning_groups(data_store, front, target_size, epsilon)
+        if groups is None:
+            return None
+        labels, representatives, _ = groups
+        return reduced_front_data(front['data'], labels, representatives)
+
+    return _replace_front_data(data_store, reducer)
+
+
+def thinned_fronts(data_store, max_points=REPORT_MAX_POINTS):
+    """
+    Copies of the fronts where every visible front above `max_points` solutions is
+    replaced by its epsilon-box representatives (for plots and reports; the store is not modified).
+    """
+    fronts = []
+    for front in (data_store or {}).get('fronts', []):
+        groups = None
+        if front.get('visible', True) and len(front.get('data', [])) > max_points:
+            groups = _thinning_groups(data_store, front, max_points)
+        if groups is None:
+            fronts.append(front)
+            continue
+        labels, representatives, _ = groups
+        fronts.append({**front, 'data': reduced_front_data(front['data'], labels, representatives)})
+    return fronts
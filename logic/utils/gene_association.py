@@ -0,0 +1,129 @@
+# logic/utils/gene_association.py
+"""
+Association between the presence of each gene and an objective.
+
+For every gene the visible solutions split in two groups: the ones selecting
+the gene and the rest. Both groups are compared on one objective for all genes
+at once, with sparse products of the solution x gene incidence matrix X
+(logic.utils.gene_sets):
+
+    group sizes   n1 = Xᵀ1                 Welch t-test   Xᵀy, Xᵀy²  (means, variances)
+    rank sums     R1 = Xᵀ rank(y)          Mann-Whitney U with tie-corrected normal approximation
+
+Effect sizes are Hedges' g (t-test) and the rank-biserial correlation
+(Mann-Whitney). P-values are Benjamini-Hochberg corrected. Results are cached per
+data version, objective and test.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr, stdtr
+from scipy.stats import rankdata
+
+from logic.utils.analysis_cache import ResultCache
+from logic.utils.gene_sets import gene_incidence
+from logic.utils.objectives import objective_directions, objective_matrix
+from logic.utils.statistical_tests import benjamini_hochberg
+
+ASSOCIATION_TESTS = ('mannwhitney', 'welch')
+MIN_GROUP_SIZE = 2
+
+_association_cache = ResultCache(max_entries=16)
+
+
+def objective_values(data_store, incidence, objective):
+    """Objective value of every incidence row (NaN when missing or non-numeric)."""
+    fronts = {f['id']: f for f in (data_store or {}).get('fronts', [])}
+    solutions = [fronts[incidence.front_ids[i]]['data'][pos] for i, pos in zip(incidence.front_index, incidence.positions)]
+    return objective_matrix(solutions, [objective])[:, 0]
+
+
+def _welch(n1, n0, sum1, sumsq1, total, total_sq):
+    """Welch t statistic, two-sided p-value and Hedges' g for every gene."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean1, mean0 = sum1 / n1, (total - sum1) / n0
+        var1 = np.maximum(sumsq1 - n1 * mean1 ** 2, 0) / (n1 - 1)
+        var0 = np.maximum((total_sq - sumsq1) - n0 * mean0 ** 2, 0) / (n0 - 1)
+        se2 = var1 / n1 + var0 / n0
+        t = (mean1 - mean0) / np.sqrt(se2)
+        df = se2 ** 2 / ((var1 / n1) ** 2 / (n1 - 1) + (var0 / n0) ** 2 / (n0 - 1))
+        p_value = 2 * stdtr(df, -np.abs(t))
+        pooled = np.sqrt(((n1 - 1) * var1 + (n0 - 1) * var0) / (n1 + n0 - 2))
+        correction = 1 - 3 / (4 * (n1 + n0) - 9)
+        effect = (mean1 - mean0) / pooled * correction
+    # Varianza nula en ambos grupos: sin evidencia si las medias coinciden
+    constant = se2 == 0
+    t[constant], p_value[constant] = 0.0, np.where(mean1[constant] == mean0[constant], 1.0, 0.0)
+    effect[constant & (mean1 == mean0)] = 0.0
+    effect[~np.isfinite(effect)] = np.nan
+    return mean1, mean0, t, p_value, effect
+
+
+def _mann_whitney(n1, n0, rank_sum1, tie_term, n):
+    """Mann-Whitney U (of the gene group), two-sided normal-approximation p-value and rank-biserial r."""
+    u1 = rank_sum1 - n1 * (n1 + 1) / 2
+    mean_u = n1 * n0 / 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sigma = np.sqrt(n1 * n0 / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+        # Corrección de continuidad hacia la media
+        z = (u1 - mean_u - 0.5 * np.sign(u1 - mean_u)) / sigma
+        p_value = np.where(sigma > 0, 2 * ndtr(-np.abs(z)), 1.0)
+        effect = 2 * u1 / (n1 * n0) - 1
+    return u1, np.where(sigma > 0, z, 0.0), np.minimum(p_value, 1.0), effect
+
+
+def gene_association(data_store, objective, test='mannwhitney'):
+    """
+    Per-gene association of presence with `objective` over the visible solutions.
+    Returns a DataFrame (gene, n_with, n_without, mean_with, mean_without, difference, effect,
+    statistic, p_value, q_value, better_with_gene), ordered by p-value, or None if there is nothing
+    to test. `better_with_gene` follows the objective direction (min/max). Genes with fewer than
+    MIN_GROUP_SIZE solutions on either side get NaN statistics.
+    """
+    test = test if test in ASSOCIATION_TESTS else 'mannwhitney'
+    incidence = gene_incidence(data_store)
+    if incidence.matrix.shape[1] == 0 or not objective:
+        return None
+    # better_with_gene depende del sentido del objetivo (editable en Objective Settings): parte de la clave
+    direction = objective_directions(data_store, [objective])[0]
+
+    def compute():
+        y = objective_values(data_store, incidence, objective)
+        valid = ~np.isnan(y)
+        if valid.sum() < 2 * MIN_GROUP_SIZE:
+            return None
+        matrix, y = incidence.matrix[valid], y[valid]
+        n = y.size
+        n1 = np.asarray(matrix.sum(axis=0)).ravel().astype(np.float64)
+        n0 = n - n1
+
+        mean1, mean0, t, p_welch, hedges = _welch(n1, n0, matrix.T @ y, matrix.T @ (y * y), y.sum(), (y * y).sum())
+        if test == 'welch':
+            statistic, p_value, effect = t, p_welch, hedges
+        else:
+            ranks = rankdata(y)
+            _, tie_sizes = np.unique(y, return_counts=True)
+            tie_term = float((tie_sizes ** 3 - tie_sizes).sum())
+            _, statistic, p_value, effect = _mann_whitney(n1, n0, matrix.T @ ranks, tie_term, n)
+
+        testable = (n1 >= MIN_GROUP_SIZE) & (n0 >= MIN_GROUP_SIZE)
+        statistic = np.where(testable, statistic, np.nan)
+        p_value = np.where(testable, p_value, np.nan)
+        effect = np.where(testable, effect, np.nan)
+        maximize = direction == 'max'
+        difference = mean1 - mean0
+
+        result = pd.DataFrame({
+            'gene': np.asarray(incidence.genes, dtype=object),
+            'n_with': n1.astype(np.int64), 'n_without': n0.astype(np.int64),
+            'mean_with': mean1, 'mean_without': mean0, 'difference': difference,
+            'effect': effect, 'statistic': statistic, 'p_value': p_value,
+            'q_value': benjamini_hochberg(p_value),
+            'better_with_gene': np.where(np.isnan(difference) | (difference == 0), None,
+                                         np.where((difference > 0) == maximize, 'yes', 'no')),
+        })
+        result = result[n1 > 0]
+        order = np.lexsort((-np.abs(result['effect'].fillna(0).to_numpy()), result['p_value'].fillna(2).to_numpy()))
+        return result.iloc[order].reset_index(drop=True)
+
+    return _association_cache.get_or_compute((incidence.matrix_key, objective, direction, test), compute)
@@ -0,0 +1,137 @@
+# logic/utils/gene_cooccurrence.py
+"""
+Gene co-occurrence across the visible solutions.
+
+The co-occurrence counts are the off-diagonal entries of XᵀX, where X is the
+sparse solution x gene incidence matrix (logic.utils.gene_sets). The product is
+computed one block of gene columns at a time, so memory stays bounded by
+MAX_BLOCK_ENTRIES even for large vocabularies. From every block only the
+candidate pairs (the best TOP_PAIR_POOL by count, lift and PMI) survive. Any
+top-k with k <= TOP_PAIR_POOL is therefore exact. Results are cached per data
+version and minimum count.
+
+    lift(i, j) = n * c_ij / (c_i * c_j)        PMI(i, j) = log2 lift(i, j)
+"""
+
+import numpy as np
+import pandas as pd
+
+from logic.utils.analysis_cache import ResultCache
+from logic.utils.gene_sets import gene_incidence
+
+PAIR_METRICS = ('count', 'lift', 'pmi')
+MAX_BLOCK_ENTRIES = 20_000_000
+TOP_PAIR_POOL = 2000
+LAYOUT_ITERATIONS = 150
+
+_pairs_cache = ResultCache(max_entries=16)
+
+
+def _top_indices(values, k):
+    """Indices of the k largest values (unordered)."""
+    if values.size <= k:
+        return np.arange(values.size)
+    return np.argpartition(-values, k - 1)[:k]
+
+
+def _pair_frame(rows, cols, counts, gene_counts, n_solutions):
+    counts = counts.astype(np.float64)
+    lift = n_solutions * counts / (gene_counts[rows] * gene_counts[cols])
+    return pd.DataFrame({'a': rows, 'b': cols, 'count': counts.astype(np.int64), 'lift': lift, 'pmi': np.log2(lift)})
+
+
+def _keep_candidates(frame):
+    """Union of the top TOP_PAIR_POOL pairs by every metric."""
+    keep = np.unique(np.concatenate([_top_indices(frame[m].to_numpy(), TOP_PAIR_POOL) for m in PAIR_METRICS]))
+    return frame.iloc[keep]
+
+
+def cooccurrence_pairs(data_store, min_count=2):
+    """
+    Candidate gene pairs that co-occur in at least `min_count` visible solutions. The result is a
+    DataFrame with columns gene_a, gene_b, count, support, lift and pmi, or None when there is
+    nothing to pair. `support` is the fraction of solutions that contain both genes.
+    """
+    incidence = gene_incidence(data_store)
+    matrix = incidence.matrix
+    n_solutions, n_genes = matrix.shape
+    if n_solutions == 0 or n_genes < 2:
+        return None
+    min_count = max(1, int(min_count or 1))
+
+    def compute():
+        gene_counts = np.bincount(matrix.indices, minlength=n_genes).astype(np.float64)
+        by_column = matrix.tocsc()
+        block = int(np.clip(MAX_BLOCK_ENTRIES // n_genes, 1, n_genes))
+        candidates = []
+        for start in range(0, n_genes, block):
+            stop = min(start + block, n_genes)
+            # Bloque de filas [start, stop) de XᵀX (solo el triángulo superior)
+            product = (by_column[:, start:stop].T @ matrix).tocoo()
+            rows = product.row.astype(np.int64) + start
+            keep = (product.col > rows) & (product.data >= min_count)
+            if not keep.any():
+                continue
+            frame = _pair_frame(rows[keep], product.col[keep].astype(np.int64), np.rint(product.data[keep]),
+                                gene_counts, n_solutions)
+            candidates.append(_keep_candidates(frame))
+        if not candidates:
+            return None
+
+        pairs = _keep_candidates(pd.concat(candidates, ignore_index=True))
+        genes = np.asarray(incidence.genes, dtype=object)
+        result = pd.DataFrame({
+            'gene_a': genes[pairs['a'].to_numpy()],
+            'gene_b': genes[pairs['b'].to_numpy()],
+            'count': pairs['count'].to_numpy(),
+            'support': pairs['count'].to_numpy() / n_solutions,
+            'lift': pairs['lift'].to_numpy(),
+            'pmi': pairs['pmi'].to_numpy(),
+        })
+        return result.sort_values(['count', 'lift', 'gene_a', 'gene_b'], ascending=[False, False, True, True],
+                                  ignore_index=True)
+
+    return _pairs_cache.get_or_compute((incidence.matrix_key, min_count), compute)
+
+
+def top_pairs(pairs, metric='count', k=30):
+    """The k best pairs by `metric` (ties broken by count, then by gene names)."""
+    if pairs is None or pairs.empty:
+        return pairs
+    metric = metric if metric in PAIR_METRICS else 'count'
+    return pairs.sort_values([metric, 'count', 'gene_a', 'gene_b'], ascending=[False, False, True, True],
+                             kind='stable').head(int(k)).reset_index(drop=True)
+
+
+def network_layout(n_nodes, edges, weights=None, iterations=LAYOUT_ITERATIONS, seed=0):
+    """
+    Force-directed (Fruchterman-Reingold) 2D positions of a small graph, all-pairs vectorized.
+    `edges` is an (m, 2) int array; heavier `weights` pull their endpoints closer.
+    """
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(-1, 1, size=(n_nodes, 2))
+    if n_nodes < 2:
+        return np.zeros((n_nodes, 2))
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    weights = np.ones(len(edges)) if weights is None else np.asarray(weights, dtype=float)
+    weights = weights / weights.max() if weights.size and weights.max() > 0 else weights
+    optimal = np.sqrt(4.0 / n_nodes)
+    temperature = 0.1
+
+    for _ in range(iterations):
+        x, y = positions[:, 0], positions[:, 1]
+        dx, dy = x[:, None] - x[None, :], y[:, None] - y[None, :]
+        # Repulsión entre todos los pares, atracción a lo largo de las aristas
+        repulsion = optimal ** 2 / np.maximum(dx * dx + dy * dy, 1e-6)
+        displacement = np.column_stack([(dx * repulsion).sum(axis=1), (dy * repulsion).sum(axis=1)])
+        edge_delta = positions[edges[:, 0]] - positions[edges[:, 1]]
+        edge_distance = np.maximum(np.hypot(edge_delta[:, 0], edge_delta[:, 1]), 1e-3)
+        pull = edge_delta * (edge_distance * (0.5 + weights) / optimal)[:, None]
+        np.add.at(displacement, edges[:, 0], -pull)
+        np.add.at(displacement, edges[:, 1], pull)
+
+        length = np.maximum(np.hypot(displacement[:, 0], displacement[:, 1]), 1e-9)
+        positions += displacement / length[:, None] * np.minimum(length, temperature)[:, None]
+        temperature *= 0.97
+    positions -= positions.mean(axis=0)
+    return positions / max(np.abs(positions).max(), 1e-9)
@@ -0,0 +1,80 @@
+# logic/utils/gene_cutoff.py
+"""
+Gene frequency as a function of an objective cutoff.
+
+The visible solutions are sorted once by the objective: ascending to keep the
+solutions at or below a cutoff (e.g. `num_genes` <= k), descending to keep the
+ones at or above it (e.g. accuracy >= t). Every distinct objective value is a
+cutoff; the solutions sharing a value form one group. A sparse product (group
+indicator x incidence matrix of logic.utils.gene_sets) counts every gene per
+group, and one cumulative sum over the groups yields the counts of all genes at
+all cutoffs:
+
+    counts[c, g] = number of solutions up to cutoff c selecting gene g
+    frequency    = counts / sizes[c]
+
+With more than MAX_CUTOFFS distinct values, neighbouring values are merged so the
+cutoffs stay evenly spread over the solutions. Curves are cached per data version,
+objective and direction; the chart only slices columns of the result.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+from scipy import sparse
+
+from logic.utils.analysis_cache import ResultCache
+from logic.utils.gene_association import objective_values
+from logic.utils.gene_sets import gene_incidence
+
+CUTOFF_DIRECTIONS = ('below', 'above')
+MAX_CUTOFFS = 300
+
+FrequencyCurves = namedtuple('FrequencyCurves', ['key', 'objective', 'direction', 'cutoffs', 'sizes', 'counts', 'genes'])
+
+_curves_cache = ResultCache(max_entries=16)
+
+
+def frequency_curves(data_store, objective, direction='below'):
+    """
+    Cumulative gene counts of the visible solutions at every cutoff of `objective`, or None without
+    genes or numeric values. `cutoffs` and `sizes` (solutions kept) are increasing-inclusion arrays
+    of length C; `counts` is a dense (C, genes) int32 array following the sorted vocabulary `genes`.
+    Solutions without a value for the objective are left out.
+    """
+    direction = direction if direction in CUTOFF_DIRECTIONS else 'below'
+    incidence = gene_incidence(data_store)
+    if incidence.matrix.shape[1] == 0 or not objective:
+        return None
+
+    def compute():
+        y = objective_values(data_store, incidence, objective)
+        valid = np.flatnonzero(~np.isnan(y))
+        if valid.size == 0:
+            return None
+        values = y[valid]
+        order = valid[np.argsort(-values if direction == 'above' else values, kind='stable')]
+        ordered = y[order]
+
+        # Fin (exclusivo) de cada grupo de valores iguales; se agrupan si hay demasiados
+        ends = np.append(np.flatnonzero(ordered[1:] != ordered[:-1]) + 1, ordered.size)
+        if ends.size > MAX_CUTOFFS:
+            ends = ends[np.unique(np.linspace(0, ends.size - 1, MAX_CUTOFFS).round().astype(np.int64))]
+        group = np.searchsorted(ends, np.arange(ordered.size), side='right')
+
+        indicator = sparse.csr_matrix((np.ones(order.size, dtype=np.float32), (group, order)),
+                                      shape=(ends.size, incidence.matrix.shape[0]))
+        per_group = (indicator @ incidence.matrix).toarray()
+        counts = np.cumsum(np.rint(per_group).astype(np.int32), axis=0, dtype=np.int32)
+        return FrequencyCurves(incidence.matrix_key, objective, direction, ordered[ends - 1], ends, counts, incidence.genes)
+
+    return _curves_cache.get_or_compute((incidence.matrix_key, objective, direction), compute)
+
+
+def curve_genes(curves, genes):
+    """(genes found, (C, k) frequency array) for the requested genes, in the requested order."""
+    positions = np.searchsorted(curves.genes, genes)
+    positions = np.minimum(positions, len(curves.genes) - 1)
+    found = [i for i, gene in enumerate(genes) if curves.genes[positions[i]] == gene]
+    columns = positions[found]
+    return [genes[i] for i in found], curves.counts[:, columns] / curves.sizes[:, None]
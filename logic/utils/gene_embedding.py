@@ -0,0 +1,142 @@
+# logic/utils/gene_embedding.py
+"""
+2D map of the solutions in gene space.
+
+PCA of the sparse solution x gene incidence matrix: the two leading singular
+vectors of the column-centered matrix X - 1·μᵀ are found with a truncated SVD
+(ARPACK) on a LinearOperator, so the centered matrix is never densified.
+
+The embedding covers every loaded solution (hidden fronts included) and is
+computed once per data version in a background worker thread. Its status and
+result live in the shared job store (logic.utils.job_store), so whichever server
+process answers a poll of `embedding_status(key)` sees the same job, and no other
+process computes it again.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from scipy.sparse.linalg import LinearOperator, svds
+
+from logic.utils.analysis_cache import data_version
+from logic.utils.gene_sets import gene_incidence
+from logic.utils.job_store import JobStore
+
+DENSE_SVD_MAX_ELEMENTS = 2_000_000
+
+_jobs = JobStore('gene-embedding', max_local_results=4)
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gene-embedding')
+_futures = {}
+_futures_lock = threading.Lock()
+
+
+def _orient(components):
+    """Deterministic sign: the largest |loading| of each component is positive."""
+    signs = np.sign(components[np.argmax(np.abs(components), axis=0), np.arange(components.shape[1])])
+    return np.where(signs == 0, 1.0, signs)
+
+
+def sparse_pca(matrix, n_components=2):
+    """
+    PCA scores of a sparse matrix without densifying its centered version.
+    Returns (scores (n, n_components), explained variance ratio per component).
+    """
+    n, g = matrix.shape
+    scores = np.zeros((n, n_components))
+    explained = np.zeros(n_components)
+    if n < 2 or g == 0:
+        return scores, explained
+
+    matrix = matrix.astype(np.float64)
+    mean = np.asarray(matrix.mean(axis=0)).ravel()
+    total_variance = float(np.asarray(matrix.multiply(matrix).sum(axis=0)).ravel().sum() / n - mean @ mean)
+    k = min(n_components, n - 1, g)
+
+    if n * g <= DENSE_SVD_MAX_ELEMENTS or k >= min(n, g) - 1:
+        centered = matrix.toarray() - mean
+        u, s, vt = np.linalg.svd(centered, full_matrices=False)
+        u, s, vt = u[:, :k], s[:k], vt[:k]
+    else:
+        centered = LinearOperator(
+            (n, g),
+            matvec=lambda v: matrix @ np.ravel(v) - (mean @ np.ravel(v)),
+            rmatvec=lambda u: matrix.T @ np.ravel(u) - mean * np.ravel(u).sum(),
+            dtype=np.float64
+        )
+        v0 = np.random.default_rng(0).standard_normal(min(n, g))
+        u, s, vt = svds(centered, k=k, v0=v0)
+        order = np.argsort(-s)
+        u, s, vt = u[:, order], s[order], vt[order]
+
+    signs = _orient(vt.T)
+    scores[:, :k] = u * s * signs
+    if total_variance > 0:
+        explained[:k] = (s ** 2 / n) / total_variance
+    return scores, explained
+
+
+def embedding_key(data_store):
+    """Job key of the embedding of the loaded data (JSON-safe, kept by the UI)."""
+    return data_version(data_store, visible_only=False)
+
+
+def gene_embedding(data_store):
+    """
+    2D PCA embedding of every loaded solution (computed on every call; the background job stores it).
+    Returns {'key', 'coordinates' (n, 2), 'explained' [pc1, pc2]}, rows in gene_incidence(visible_only=False) order.
+    """
+    incidence = gene_incidence(data_store, visible_only=False)
+    coordinates, explained = sparse_pca(incidence.matrix, 2)
+    return {'key': embedding_key(data_store), 'coordinates': coordinates, 'explained': explained.tolist()}
+
+
+def _run_job(data_store, key, token):
+    """Background job: computes the embedding unless it was cancelled while queued, and stores it."""
+    try:
+        if not _jobs.progress(key, token, 0):
+            return None
+        result = gene_embedding(data_store)
+    except Exception as error:
+        _jobs.fail(key, token, error)
+        raise
+    finally:
+        with _futures_lock:
+            _futures.pop(key, None)
+    _jobs.finish(key, token, result)
+    return result
+
+
+def schedule_gene_embedding(data_store):
+    """
+    Start computing the embedding of this data version in the background and return its job key.
+    No-op when it is already stored or being computed in any server process.
+    """
+    key = embedding_key(data_store)
+    if not (data_store or {}).get('fronts'):
+        return key
+    token = _jobs.claim(key)
+    if token is not None:
+        with _futures_lock:
+            _futures[key] = _executor.submit(_run_job, data_store, key, token)
+    return key
+
+
+def cancel_gene_embedding(key):
+    """Cancel the embedding of a data version that is no longer shown (a queued job never starts)."""
+    if not key:
+        return
+    _jobs.cancel(key)
+    with _futures_lock:
+        future = _futures.pop(key, None)
+    if future is not None:
+        future.cancel()
+
+
+def embedding_status(key):
+    """
+    ('ready', embedding) | ('running', None) | ('failed', error message) |
+    ('idle', None) when no job with this key is stored or running (never scheduled, cancelled or lost).
+    """
+    status, payload = _jobs.status(key)
+    return status, (None if status == 'running' else payload)
@@ -0,0 +1,155 @@
+# logic/utils/gene_frequency.py
+"""
+Gene frequencies of the loaded solutions, shared by every gene view and report.
+
+Counts come from one bincount over the interned gene ids of the incidence matrix
+(logic.utils.gene_sets), so a gene repeated inside one solution counts once.
+Results are cached per data version and visible-front set; the Genes tab, the
+frequency detail, the gene-group modal, the session summary and the TXT / PDF
+reports all read the same arrays.
+
+Per-front counts are one sparse product (front indicator x incidence matrix);
+the differential analysis of two fronts (or a front against the rest) tests
+every gene at once with a two-proportion z-test and BH-FDR correction.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from logic.utils.analysis_cache import ResultCache
+from logic.utils.gene_sets import gene_incidence
+from logic.utils.statistical_tests import benjamini_hochberg, two_proportion_z_test
+
+GeneFrequency = namedtuple('GeneFrequency', ['key', 'genes', 'counts', 'percentages', 'total_solutions', 'order'])
+FrontFrequency = namedtuple('FrontFrequency', ['key', 'genes', 'front_ids', 'front_names', 'sizes', 'counts'])
+
+REST_OF_FRONTS = '__rest__'
+LOG2_PSEUDOCOUNT = 0.5
+
+_frequency_cache = ResultCache(max_entries=8)
+_differential_cache = ResultCache(max_entries=32)
+
+
+def gene_frequencies(data_store, visible_only=True):
+    """
+    Per-gene solution counts of the (visible) fronts.
+    `genes`/`counts`/`percentages` follow the sorted vocabulary; `order` lists them by
+    descending count (ties by gene name).
+    """
+    incidence = gene_incidence(data_store, visible_only=visible_only)
+
+    def compute():
+        matrix = incidence.matrix
+        counts = np.bincount(matrix.indices, minlength=matrix.shape[1]).astype(np.int64)
+        total = int(matrix.shape[0])
+        percentages = np.round(counts / total * 100, 1) if total else np.zeros(counts.size)
+        # El vocabulario ya está ordenado: un orden estable por conteo deja los empates alfabéticos
+        order = np.argsort(-counts, kind='stable')
+        for array in (counts, percentages, order):
+            array.setflags(write=False)
+        return GeneFrequency(incidence.matrix_key, incidence.genes, counts, percentages, total, order)
+
+    return _frequency_cache.get_or_compute(incidence.matrix_key, compute)
+
+
+def frequency_series(frequency):
+    """Counts as a pd.Series indexed by gene, in descending order (like value_counts)."""
+    return pd.Series(frequency.counts[frequency.order], index=pd.Index(frequency.genes[frequency.order], dtype=object))
+
+
+def conserved_genes(frequency):
+    """Sorted genes present in every solution."""
+    if frequency.total_solutions == 0:
+        return []
+    return [str(g) for g in frequency.genes[frequency.counts == frequency.total_solutions]]
+
+
+def top_genes(frequency, n=15):
+    """[(gene, count)] of the `n` most frequent genes."""
+    top = frequency.order[:n]
+    return [(str(g), int(c)) for g, c in zip(frequency.genes[top], frequency.counts[top])]
+
+
+def variable_genes_mask(frequency):
+    """Genes present in some but not all solutions."""
+    return (frequency.counts > 0) & (frequency.counts < frequency.total_solutions)
+
+
+def percentage_groups(frequency):
+    """{percentage: number of genes} of the variable genes, sorted by percentage."""
+    values, sizes = np.unique(frequency.percentages[variable_genes_mask(frequency)], return_counts=True)
+    return {float(p): int(s) for p, s in zip(values, sizes)}
+
+
+def genes_at_percentage(frequency, percentage):
+    """[(gene, count)] of the variable genes at a (rounded) percentage, by descending count then name."""
+    mask = variable_genes_mask(frequency) & np.isclose(frequency.percentages, float(percentage))
+    selected = frequency.order[mask[frequency.order]]
+    return [(str(g), int(c)) for g, c in zip(frequency.genes[selected], frequency.counts[selected])]
+
+
+def front_frequencies(data_store):
+    """Per-front gene counts of the visible fronts: `counts` is a dense (fronts x genes) int array."""
+    incidence = gene_incidence(data_store)
+
+    def compute():
+        n_fronts, n_rows = len(incidence.front_ids), incidence.matrix.shape[0]
+        indicator = sparse.csr_matrix(
+            (np.ones(n_rows, dtype=np.float32), (incidence.front_index, np.arange(n_rows))), shape=(n_fronts, n_rows)
+        )
+        counts = np.rint((indicator @ incidence.matrix).toarray()).astype(np.int64)
+        sizes = np.bincount(incidence.front_index, minlength=n_fronts).astype(np.int64)
+        return FrontFrequency(incidence.key, incidence.genes, list(incidence.front_ids), list(incidence.front_names),
+                              sizes, counts)
+
+    return _frequency_cache.get_or_compute(('fronts', incidence.key), compute)
+
+
+def differential_frequency(front_frequency, front_a, front_b=REST_OF_FRONTS):
+    """
+    Gene-by-gene comparison of front `front_a` against `front_b` (a front id, or REST_OF_FRONTS for
+    all other visible fronts pooled). Returns a DataFrame with one row per gene present in either side:
+    gene, count_a, freq_a, count_b, freq_b, difference, log2_ratio, z, p_value, q_value — ordered by
+    p-value, then by absolute difference. None when a side is missing or empty.
+    """
+    if front_a not in front_frequency.front_ids or front_a == front_b:
+        return None
+    a = front_frequency.front_ids.index(front_a)
+    if front_b == REST_OF_FRONTS:
+        others = [i for i in range(len(front_frequency.front_ids)) if i != a]
+    elif front_b in front_frequency.front_ids:
+        others = [front_frequency.front_ids.index(front_b)]
+    else:
+        return None
+    if not others:
+        return None
+
+    def compute():
+        count_a = front_frequency.counts[a]
+        count_b = front_frequency.counts[others].sum(axis=0)
+        n_a, n_b = int(front_frequency.sizes[a]), int(front_frequency.sizes[others].sum())
+        present = np.flatnonzero((count_a + count_b) > 0)
+        count_a, count_b = count_a[present], count_b[present]
+
+        freq_a = count_a / n_a if n_a else np.zeros(present.size)
+        freq_b = count_b / n_b if n_b else np.zeros(present.size)
+        z, p_value = two_proportion_z_test(count_a, n_a, count_b, n_b)
+        # Pseudoconteo: genes ausentes en un lado dan un log2 finito
+        log2_ratio = np.log2(((count_a + LOG2_PSEUDOCOUNT) / (n_a + 2 * LOG2_PSEUDOCOUNT)) /
+                             ((count_b + LOG2_PSEUDOCOUNT) / (n_b + 2 * LOG2_PSEUDOCOUNT)))
+        result = pd.DataFrame({
+            'gene': np.asarray(front_frequency.genes[present], dtype=object),
+            'count_a': count_a, 'freq_a': freq_a,
+            'count_b': count_b, 'freq_b': freq_b,
+            'difference': freq_a - freq_b,
+            'log2_ratio': log2_ratio,
+            'z': z, 'p_value': p_value, 'q_value': benjamini_hochberg(p_value),
+        })
+        order = np.lexsort((-np.abs(result['difference'].to_numpy()), result['p_value'].to_numpy()))
+        return result.iloc[order].reset_index(drop=True)
+
+    key = (front_frequency.key, front_a, front_b)
+    return _differential_cache.get_or_compute(key, compute)
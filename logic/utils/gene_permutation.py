@@ -0,0 +1,237 @@
+# logic/utils/gene_permutation.py
+"""
+Permutation test for the selection frequency of every gene.
+
+Null model: every solution keeps its subset size (its number of distinct
+genes) but draws its genes uniformly at random from the vocabulary of the
+visible fronts. A permutation is one such random reassignment of all
+solutions; the empirical p-value of a gene is
+
+    p = (1 + #{permutations whose count of the gene >= observed count}) / (1 + permutations)
+
+Permutations are simulated in batches: the random subsets of many permutations
+are drawn at once (duplicate draws inside a subset are redrawn until none are
+left), and the counts of every gene come from a single bincount. Batches are
+spread across a process pool (forkserver/spawn workers: forking a threaded
+server process could deadlock them); a background thread coordinates them.
+Status, progress and results live in the shared job store (logic.utils.job_store)
+keyed by data version and number of permutations, so any server process can
+answer the polls and a test runs only once.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+from logic.utils.gene_frequency import gene_frequencies
+from logic.utils.gene_sets import gene_incidence
+from logic.utils.job_store import JobStore
+from logic.utils.statistical_tests import benjamini_hochberg
+
+DEFAULT_PERMUTATIONS = 1000
+MAX_PERMUTATIONS = 20000
+DRAWS_PER_BATCH = 2_000_000
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+MIN_TASKS_PER_JOB = 4 * MAX_WORKERS
+DRAWS_PER_TASK = 4 * DRAWS_PER_BATCH
+
+_POOL_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn')
+
+_jobs = JobStore('gene-permutation')
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gene-permutation')
+_futures = {}
+_futures_lock = threading.Lock()
+
+
+class PermutationCancelled(Exception):
+    """Raised inside a job that was superseded by a newer one."""
+
+
+def _draw_counts(sizes, n_genes, n_permutations, rng):
+    """(n_permutations, n_genes) gene counts of `n_permutations` random reassignments preserving `sizes`."""
+    sizes = np.asarray(sizes, dtype=np.int64)
+    n_rows = sizes.size
+    # Subconjuntos densos (> mitad del vocabulario): se sortea el complemento
+    dense = sizes * 2 > n_genes
+    draw_sizes = np.where(dense, n_genes - sizes, sizes)
+
+    rows = np.tile(np.repeat(np.arange(n_rows), draw_sizes), n_permutations)
+    permutation = np.repeat(np.arange(n_permutations), draw_sizes.sum())
+    # Una fila por (permutación, solución): un gen repetido en la misma fila se vuelve a sortear
+    slot = (permutation * n_rows + rows) * n_genes
+    genes = rng.integers(0, n_genes, rows.size)
+    while True:
+        keys = slot + genes
+        order = np.argsort(keys)
+        keys = keys[order]
+        repeated = order[1:][keys[1:] == keys[:-1]]
+        if repeated.size == 0:
+            break
+        genes[repeated] = rng.integers(0, n_genes, repeated.size)
+
+    signs = np.where(dense[rows], -1, 1)
+    counts = np.bincount(permutation * n_genes + genes, weights=signs, minlength=n_permutations * n_genes)
+    counts = counts.reshape(n_permutations, n_genes) + dense.sum()
+    return np.rint(counts).astype(np.int64)
+
+
+def permutation_exceedances(sizes, n_genes, observed, n_permutations, seed):
+    """Per gene, how many of `n_permutations` random reassignments reach the observed count (process-pool task)."""
+    rng = np.random.default_rng(seed)
+    sizes = np.asarray(sizes, dtype=np.int64)
+    observed = np.asarray(observed, dtype=np.int64)
+    batch = max(1, int(DRAWS_PER_BATCH // max(int(np.minimum(sizes, n_genes - sizes).sum()), 1)))
+    exceed = np.zeros(n_genes, dtype=np.int64)
+    done = 0
+    while done < n_permutations:
+        current = min(batch, n_permutations - done)
+        exceed += (_draw_counts(sizes, n_genes, current, rng) >= observed).sum(axis=0)
+        done += current
+    return exceed
+
+
+def _run_test(key, sizes, observed, genes, n_permutations, progress):
+    """Spread the permutations over the process pool and assemble the result table."""
+    n_genes = len(genes)
+    # Tareas cortas (≈ DRAWS_PER_TASK sorteos): progreso fino y cancelación sin esperar bloques largos
+    draws = max(int(np.minimum(sizes, n_genes - sizes).sum()), 1)
+    n_tasks = max(MIN_TASKS_PER_JOB, -(-n_permutations * draws // DRAWS_PER_TASK))
+    chunks = [len(part) for part in np.array_split(np.arange(n_permutations), min(n_tasks, n_permutations))]
+    # Semilla reproducible por versión de datos y número de permutaciones
+    seeds = np.random.SeedSequence(int(hashlib.sha256(repr(key).encode()).hexdigest()[:16], 16)).spawn(len(chunks))
+    exceed = np.zeros(n_genes, dtype=np.int64)
+    done = 0
+    try:
+        with ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=_POOL_CONTEXT) as pool:
+            futures = {pool.submit(permutation_exceedances, sizes, n_genes, observed, size, seed): size
+                       for size, seed in zip(chunks, seeds)}
+            for future in as_completed(futures):
+                exceed += future.result()
+                done += futures[future]
+                try:
+                    progress(done)
+                except PermutationCancelled:
+                    # Trabajo cancelado: se descartan los bloques pendientes (los que corren terminan solos)
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+    except (OSError, BrokenProcessPool):
+        # Sin procesos disponibles (p.ej. entornos restringidos): se ejecuta en este hilo
+        exceed[:] = 0
+        done = 0
+        for size, seed in zip(chunks, seeds):
+            exceed += permutation_exceedances(sizes, n_genes, observed, size, seed)
+            done += size
+            progress(done)
+
+    expected = sizes.sum() / n_genes
+    p_value = (1 + exceed) / (1 + n_permutations)
+    result = pd.DataFrame({
+        'gene': np.asarray(genes, dtype=object),
+        'count': observed,
+        'frequency': observed / sizes.size,
+        'expected': np.full(n_genes, expected / sizes.size),
+        'fold': observed / expected,
+        'exceedances': exceed,
+        'p_value': p_value,
+        'q_value': benjamini_hochberg(p_value),
+    })
+    order = np.lexsort((result['gene'].to_numpy(), -result['count'].to_numpy(), result['p_value'].to_numpy()))
+    return result.iloc[order].reset_index(drop=True)
+
+
+def clip_permutations(n_permutations):
+    """Number of permutations requested, bounded to [1, MAX_PERMUTATIONS]."""
+    return int(np.clip(n_permutations or DEFAULT_PERMUTATIONS, 1, MAX_PERMUTATIONS))
+
+
+def permutation_job_key(data_store, n_permutations=DEFAULT_PERMUTATIONS):
+    """JSON-safe key of the test of the visible fronts with `n_permutations` (what the UI keeps in its store)."""
+    return f"{gene_incidence(data_store).matrix_key[0]}:{clip_permutations(n_permutations)}"
+
+
+def permutation_test(data_store, n_permutations=DEFAULT_PERMUTATIONS, progress=None):
+    """
+    Empirical enrichment p-value of the frequency of every visible gene. Returns a DataFrame (gene, count,
+    frequency, expected, fold, exceedances, p_value, q_value) ordered by p-value, or None without genes.
+    `expected` is the frequency every gene has on average under the null. `progress(done)` is called as
+    permutations finish and may raise PermutationCancelled to stop the test. Not cached: the background
+    jobs keep their results in the shared job store.
+    """
+    n_permutations = clip_permutations(n_permutations)
+    incidence = gene_incidence(data_store)
+    if incidence.matrix.shape[0] == 0 or incidence.matrix.shape[1] == 0:
+        return None
+    frequency = gene_frequencies(data_store)
+    # gene_frequencies e incidence comparten el vocabulario ordenado
+    observed = np.asarray(frequency.counts, dtype=np.int64)
+    return _run_test(permutation_job_key(data_store, n_permutations), incidence.sizes.astype(np.int64), observed,
+                     incidence.genes, n_permutations, progress or (lambda done: None))
+
+
+def _run_job(data_store, n_permutations, key, token):
+    """Background job: runs the test and publishes progress and result in the shared job store."""
+    def progress(done):
+        if not _jobs.progress(key, token, done):
+            raise PermutationCancelled(key)
+
+    try:
+        progress(0)
+        result = permutation_test(data_store, n_permutations, progress)
+    except PermutationCancelled:
+        return None
+    except Exception as error:
+        _jobs.fail(key, token, error)
+        raise
+    finally:
+        with _futures_lock:
+            _futures.pop(key, None)
+    _jobs.finish(key, token, result)
+    return result
+
+
+def schedule_permutation_test(data_store, n_permutations=DEFAULT_PERMUTATIONS):
+    """
+    Start the test of this data version in the background and return its job key. No-op when the
+    result is already stored or the same job is running in any server process.
+    """
+    n_permutations = clip_permutations(n_permutations)
+    key = permutation_job_key(data_store, n_permutations)
+    if not (data_store or {}).get('fronts'):
+        return key
+    token = _jobs.claim(key, n_permutations)
+    if token is not None:
+        with _futures_lock:
+            _futures[key] = _executor.submit(_run_job, data_store, n_permutations, key, token)
+    return key
+
+
+def cancel_permutation_test(key):
+    """Cancel a job that is no longer shown (it stops at its next progress report, in whichever process)."""
+    if not key:
+        return
+    _jobs.cancel(key)
+    with _futures_lock:
+        future = _futures.pop(key, None)
+    if future is not None:
+        future.cancel()
+
+
+def job_status(key):
+    """
+    ('ready', result) | ('running', fraction of permutations done) | ('failed', error message) |
+    ('idle', None) when no job with this key was started (or it was cancelled).
+    """
+    return _jobs.status(key)
+
+
+def permutation_status(data_store, n_permutations=DEFAULT_PERMUTATIONS):
+    """job_status of the test of the current data version."""
+    return job_status(permutation_job_key(data_store, n_permutations))
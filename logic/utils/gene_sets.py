@@ -0,0 +1,87 @@
+# logic/utils/gene_sets.py
+"""
+Sparse solution x gene incidence matrix of the loaded fronts.
+
+Gene names are interned once (pd.factorize) and every solution becomes a row of
+a CSR matrix with 1 for each selected gene. Row order follows the fronts and,
+inside each front, its 'data' list; `front_index`/`positions` map rows back.
+The matrix is cached per data version and shared by every gene-set analytic.
+Front names are not part of the data version (renaming a front keeps it), so
+`front_names`/`unique_ids` are rebuilt from the live fronts on every call:
+`matrix_key` identifies the content only, while `key` also covers the names and
+is the one to use for results that carry front labels.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from logic.utils.analysis_cache import ResultCache, data_version
+
+GeneIncidence = namedtuple(
+    'GeneIncidence',
+    ['key', 'matrix_key', 'matrix', 'genes', 'sizes', 'front_ids', 'front_names', 'front_index', 'positions',
+     'solution_ids', 'unique_ids']
+)
+
+_incidence_cache = ResultCache(max_entries=8)
+_labels_cache = ResultCache(max_entries=16)
+
+
+def incidence_matrix(gene_lists):
+    """
+    CSR incidence matrix (float32, 0/1) of a list of gene lists and the sorted gene vocabulary.
+    Repeated genes inside one solution are counted once.
+    """
+    lengths = np.fromiter((len(genes) for genes in gene_lists), dtype=np.int64, count=len(gene_lists))
+    flat = [gene for genes in gene_lists for gene in genes]
+    if not flat:
+        return sparse.csr_matrix((len(gene_lists), 0), dtype=np.float32), np.array([], dtype=object)
+
+    codes, genes = pd.factorize(pd.Index(flat, dtype=object), sort=True)
+    rows = np.repeat(np.arange(len(gene_lists)), lengths)
+    matrix = sparse.csr_matrix(
+        (np.ones(len(codes), dtype=np.float32), (rows, codes)), shape=(len(gene_lists), len(genes))
+    )
+    matrix.sum_duplicates()
+    matrix.data[:] = 1.0
+    return matrix, np.asarray(genes, dtype=object)
+
+
+def gene_incidence(data_store, visible_only=True):
+    """Incidence matrix of the (visible) fronts, cached per data version; names come from the live fronts."""
+    fronts = [f for f in (data_store or {}).get('fronts', []) if f.get('visible', True) or not visible_only]
+    matrix_key = (data_version(data_store, visible_only=visible_only), visible_only)
+
+    def compute():
+        gene_lists, front_index, positions, solution_ids = [], [], [], []
+        for i, front in enumerate(fronts):
+            for pos, sol in enumerate(front.get('data', [])):
+                gene_lists.append(sol.get('selected_genes') or [])
+                front_index.append(i)
+                positions.append(pos)
+                solution_ids.append(sol.get('solution_id', 'N/A'))
+        matrix, genes = incidence_matrix(gene_lists)
+        return GeneIncidence(
+            key=None,
+            matrix_key=matrix_key,
+            matrix=matrix,
+            genes=genes,
+            sizes=np.asarray(matrix.sum(axis=1)).ravel(),
+            front_ids=[f['id'] for f in fronts],
+            front_names=None,
+            front_index=np.asarray(front_index, dtype=np.int64),
+            positions=np.asarray(positions, dtype=np.int64),
+            solution_ids=solution_ids,
+            unique_ids=None,
+        )
+
+    incidence = _incidence_cache.get_or_compute(matrix_key, compute)
+    front_names = tuple(f.get('name') for f in fronts)
+    key = matrix_key + (front_names,)
+    unique_ids = _labels_cache.get_or_compute(key, lambda: [
+        f"{sid}|{front_names[i]}" for sid, i in zip(incidence.solution_ids, incidence.front_index.tolist())
+    ])
+    return incidence._replace(key=key, front_names=list(front_names), unique_ids=unique_ids)
@@ -0,0 +1,163 @@
+# logic/utils/gene_similarity.py
+"""
+Decision-space similarity between solutions (gene sets).
+
+- Jaccard:  |A ∩ B| / |A ∪ B|
+- Overlap:  |A ∩ B| / min(|A|, |B|)
+
+Intersections come from sparse products of the incidence matrix
+(logic.utils.gene_sets): one row against all rows for a lookup, or row blocks of
+X·Xᵀ (bounded in memory) for the full matrix / nearest neighbours.
+The heatmap view clusters a bounded subset with average-linkage on 1 - similarity.
+"""
+
+import numpy as np
+from scipy.cluster.hierarchy import leaves_list, linkage
+from scipy.spatial.distance import squareform
+
+from logic.utils.analysis_cache import ResultCache
+from logic.utils.gene_sets import gene_incidence
+
+SIMILARITY_METRICS = ('jaccard', 'overlap')
+MAX_BLOCK_ELEMENTS = 8_000_000
+HEATMAP_MAX_SOLUTIONS = 150
+
+_similarity_cache = ResultCache(max_entries=32)
+
+
+def similarity_from_intersection(intersection, sizes_a, sizes_b, metric='jaccard'):
+    """Similarity block (float32) from intersection counts (rows: sizes_a, columns: sizes_b). Two empty sets -> 1."""
+    intersection = np.asarray(intersection, dtype=np.float32)
+    sizes_a = np.asarray(sizes_a, dtype=np.float32)[:, None]
+    sizes_b = np.asarray(sizes_b, dtype=np.float32)[None, :]
+    if metric == 'overlap':
+        denominator = np.minimum(sizes_a, sizes_b)
+    else:
+        denominator = sizes_a + sizes_b
+        denominator -= intersection
+    # Los denominadores nulos sólo aparecen entre conjuntos vacíos (idénticos)
+    empty = denominator == 0
+    denominator[empty] = 1.0
+    similarity = np.divide(intersection, denominator, out=denominator)
+    similarity[empty] = 1.0
+    return similarity
+
+
+def similarity_blocks(matrix, sizes, metric='jaccard', rows=None, max_block_elements=MAX_BLOCK_ELEMENTS):
+    """
+    Yield (row_indices, block) with the similarity of `rows` (default: all) against every row.
+    Each block holds at most ~max_block_elements values.
+    """
+    n = matrix.shape[0]
+    rows = np.arange(n) if rows is None else np.asarray(rows, dtype=np.int64)
+    chunk = max(1, max_block_elements // max(n, 1))
+    transposed = matrix.T.tocsc()
+    for start in range(0, rows.size, chunk):
+        block_rows = rows[start:start + chunk]
+        intersection = (matrix[block_rows] @ transposed).toarray()
+        yield block_rows, similarity_from_intersection(intersection, sizes[block_rows], sizes, metric)
+
+
+def similarity_submatrix(matrix, sizes, rows, metric='jaccard'):
+    """Dense similarity matrix between the given rows."""
+    rows = np.asarray(rows, dtype=np.int64)
+    sub = matrix[rows]
+    intersection = (sub @ sub.T).toarray()
+    return similarity_from_intersection(intersection, sizes[rows], sizes[rows], metric)
+
+
+def nearest_neighbours(matrix, sizes, k=5, metric='jaccard', rows=None):
+    """
+    Top-k most similar rows (excluding the row itself) for `rows` (default: all).
+    Returns (indices, scores), both (len(rows), k) ordered by decreasing similarity.
+    """
+    n = matrix.shape[0]
+    rows = np.arange(n) if rows is None else np.asarray(rows, dtype=np.int64)
+    k = max(0, min(int(k), n - 1))
+    indices = np.zeros((rows.size, k), dtype=np.int64)
+    scores = np.zeros((rows.size, k), dtype=np.float32)
+    if k == 0:
+        return indices, scores
+
+    offset = 0
+    for block_rows, block in similarity_blocks(matrix, sizes, metric, rows):
+        block[np.arange(block_rows.size), block_rows] = -np.inf
+        top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(block, top, axis=1)
+        order = np.lexsort((top, -top_scores), axis=1)
+        end = offset + block_rows.size
+        indices[offset:end] = np.take_along_axis(top, order, axis=1)
+        scores[offset:end] = np.take_along_axis(top_scores, order, axis=1)
+        offset = end
+    return indices, scores
+
+
+def clustered_order(similarity):
+    """Leaf order of an average-linkage clustering on 1 - similarity."""
+    n = similarity.shape[0]
+    if n < 3:
+        return np.arange(n)
+    distance = np.clip(1.0 - similarity, 0.0, None)
+    np.fill_diagonal(distance, 0.0)
+    distance = (distance + distance.T) / 2
+    return leaves_list(linkage(squareform(distance, checks=False), method='average'))
+
+
+def _candidate_rows(incidence, front_id=None):
+    if front_id is None or front_id == 'all':
+        return np.arange(incidence.matrix.shape[0])
+    if front_id not in incidence.front_ids:
+        return np.zeros(0, dtype=np.int64)
+    return np.flatnonzero(incidence.front_index == incidence.front_ids.index(front_id))
+
+
+def clustered_similarity(data_store, front_id=None, metric='jaccard', max_solutions=HEATMAP_MAX_SOLUTIONS):
+    """
+    Clustered similarity heatmap data for the visible solutions (optionally one front).
+    Above `max_solutions`, an evenly spaced sample of the rows is used.
+    Returns {'rows', 'labels', 'similarity', 'total'} (rows/labels in clustered order) or None.
+    """
+    incidence = gene_incidence(data_store)
+    candidates = _candidate_rows(incidence, front_id)
+    if candidates.size < 2:
+        return None
+    metric = metric if metric in SIMILARITY_METRICS else 'jaccard'
+    key = (incidence.key, front_id, metric, int(max_solutions))
+
+    def compute():
+        rows = candidates
+        if rows.size > max_solutions:
+            rows = rows[np.unique(np.linspace(0, rows.size - 1, max_solutions).round().astype(np.int64))]
+        similarity = similarity_submatrix(incidence.matrix, incidence.sizes, rows, metric)
+        order = clustered_order(similarity)
+        rows = rows[order]
+        return {
+            'rows': rows,
+            'labels': [incidence.unique_ids[r] for r in rows],
+            'similarity': similarity[np.ix_(order, order)],
+            'total': int(candidates.size),
+        }
+
+    return _similarity_cache.get_or_compute(key, compute)
+
+
+def similar_solutions(data_store, unique_id, k=10, metric='jaccard'):
+    """
+    The k visible solutions whose gene sets are most similar to `unique_id`.
+    Returns [(row, similarity, shared_genes)] ordered by decreasing similarity.
+    """
+    incidence = gene_incidence(data_store)
+    try:
+        row = incidence.unique_ids.index(unique_id)
+    except ValueError:
+        return []
+    metric = metric if metric in SIMILARITY_METRICS else 'jaccard'
+    key = (incidence.key, 'lookup', row, int(k), metric)
+
+    def compute():
+        indices, scores = nearest_neighbours(incidence.matrix, incidence.sizes, k, metric, rows=[row])
+        shared = incidence.matrix[indices[0]] @ incidence.matrix[row].T
+        shared = np.asarray(shared.todense()).ravel()
+        return [(int(i), float(s), int(c)) for i, s, c in zip(indices[0], scores[0], shared)]
+
+    return _similarity_cache.get_or_compute(key, compute)
@@ -0,0 +1,118 @@
+# logic/utils/gene_stability.py
+"""
+Feature-selection stability of the gene subsets of a front (and of all visible
+fronts pooled).
+
+Every index averages a pairwise similarity over all pairs of solutions. The
+pairwise overlaps |A ∩ B| come from X·Xᵀ of the solution x gene incidence matrix
+(logic.utils.gene_sets). The product is computed one block of solutions at a
+time, so memory stays bounded by MAX_BLOCK_ENTRIES.
+
+    Jaccard stability   mean |A ∩ B| / |A ∪ B|
+    Kuncheva index      mean (r - k_a k_b / n) / (min(k_a, k_b) - k_a k_b / n)
+
+r = |A ∩ B|, k = subset sizes, n = gene vocabulary of the visible fronts. The
+Kuncheva index is corrected for chance: 0 is the overlap expected between random
+subsets of the same sizes and 1 is identical subsets. For equal sizes it is
+Kuncheva's original (rn - k²) / (k(n - k)). The selection-probability curve of a
+front is the fraction of its solutions that select each gene, in decreasing
+order. Results are cached per data version.
+"""
+
+import numpy as np
+
+from logic.utils.analysis_cache import ResultCache
+from logic.utils.gene_sets import gene_incidence
+
+MAX_BLOCK_ENTRIES = 5_000_000
+POOLED_LABEL = 'All visible fronts'
+
+_stability_cache = ResultCache(max_entries=8)
+
+
+def pairwise_stability(matrix, n_features):
+    """(Jaccard stability, Kuncheva index, number of pairs) of the rows of a 0/1 CSR matrix."""
+    n = matrix.shape[0]
+    if n < 2:
+        return np.nan, np.nan, 0
+    sizes = np.asarray(matrix.sum(axis=1)).ravel()
+    transposed = matrix.T.tocsc()
+    block = int(np.clip(MAX_BLOCK_ENTRIES // n, 1, n))
+    jaccard_sum = kuncheva_sum = 0.0
+    jaccard_pairs = kuncheva_pairs = 0
+
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        overlap = (matrix[start:stop] @ transposed).toarray()
+        # Solo pares i < j del bloque
+        local = np.arange(stop - start)[:, None]
+        upper = np.arange(n)[None, :] > (local + start)
+        r = overlap[upper]
+        k_a = np.broadcast_to(sizes[start:stop, None], overlap.shape)[upper]
+        k_b = np.broadcast_to(sizes[None, :], overlap.shape)[upper]
+
+        union = k_a + k_b - r
+        jaccard = union > 0
+        jaccard_sum += float((r[jaccard] / union[jaccard]).sum())
+        jaccard_pairs += int(jaccard.sum())
+
+        expected = k_a * k_b / n_features
+        denominator = np.minimum(k_a, k_b) - expected
+        defined = denominator > 1e-12
+        kuncheva_sum += float(((r - expected)[defined] / denominator[defined]).sum())
+        kuncheva_pairs += int(defined.sum())
+
+    total_pairs = n * (n - 1) // 2
+    jaccard = jaccard_sum / jaccard_pairs if jaccard_pairs else np.nan
+    kuncheva = kuncheva_sum / kuncheva_pairs if kuncheva_pairs else np.nan
+    return jaccard, kuncheva, total_pairs
+
+
+def selection_probabilities(matrix):
+    """Fraction of the rows selecting each gene, in decreasing order (zeros dropped)."""
+    if matrix.shape[0] == 0:
+        return np.array([])
+    probabilities = np.bincount(matrix.indices, minlength=matrix.shape[1]) / matrix.shape[0]
+    probabilities = probabilities[probabilities > 0]
+    return -np.sort(-probabilities)
+
+
+def stability_indices(data_store):
+    """
+    Stability of every visible front and of all of them pooled (pooled row first).
+    Returns {'rows': [{'front', 'solutions', 'mean_size', 'genes', 'core_genes', 'jaccard', 'kuncheva'}],
+             'curves': {front name: decreasing selection probabilities}} or None.
+    `core_genes` counts genes selected by at least half of the solutions.
+    """
+    incidence = gene_incidence(data_store)
+    matrix = incidence.matrix
+    if matrix.shape[0] == 0 or matrix.shape[1] == 0:
+        return None
+
+    def compute():
+        n_features = matrix.shape[1]
+        groups = [(POOLED_LABEL, np.arange(matrix.shape[0]))] if len(incidence.front_ids) > 1 else []
+        groups += [(name, np.flatnonzero(incidence.front_index == i)) for i, name in enumerate(incidence.front_names)]
+
+        rows, curves = [], {}
+        for label, members in groups:
+            subset = matrix[members]
+            jaccard, kuncheva, _ = pairwise_stability(subset, n_features)
+            curve = selection_probabilities(subset)
+            curves[label] = curve
+            rows.append({
+                'front': label,
+                'solutions': int(members.size),
+                'mean_size': float(incidence.sizes[members].mean()) if members.size else np.nan,
+                'genes': int(curve.size),
+                'core_genes': int((curve >= 0.5).sum()),
+                'jaccard': jaccard,
+                'kuncheva': kuncheva,
+            })
+        return {'rows': rows, 'curves': curves}
+
+    return _stability_cache.get_or_compute(incidence.key, compute)
+
+
+def format_stability(value):
+    return "n/a" if value is None or not np.isfinite(value) else f"{value:.3f}"
@@ -0,0 +1,188 @@
+# logic/utils/genes_table.py
+"""
+Backend of the detailed (solution, gene) table of the Genes tab.
+
+The long format (one row per solution and selected gene) is never built: a
+"pair" is a non-zero of the sparse solution x gene incidence matrix
+(logic.utils.gene_sets), addressed by its CSR position. Every pair knows its
+solution row (`pair_rows`) and gene code (`pair_genes`); solution-level columns
+(front, ids, objectives) live once per solution in `solutions`.
+
+Filters and sort keys (logic.utils.table_query) are evaluated on the small base
+arrays (one value per solution or per gene) and gathered onto the pairs; the
+filtered and sorted pair indices are cached, so a page only materializes the
+`page_size` records the table displays. The metric chart (histogram or category
+counts) and its summary figures are binned from per-solution / per-gene weights
+and cached per (data version, filter, metric), so the browser never sends rows.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from logic.utils.analysis_cache import ResultCache
+from logic.utils.gene_sets import gene_incidence
+from logic.utils.table_query import query_mask, sort_order
+
+GenesTable = namedtuple('GenesTable', ['key', 'incidence', 'solutions', 'objectives', 'pair_rows', 'pair_genes'])
+MetricDistribution = namedtuple(
+    'MetricDistribution',
+    ['kind', 'labels', 'counts', 'bin_edges', 'n_categories', 'total_rows', 'unique_solutions', 'unique_genes']
+)
+
+SOLUTION_COLUMNS = ('front_name', 'unique_solution_id', 'solution_id')
+HISTOGRAM_BINS = 20
+
+_table_cache = ResultCache(max_entries=8)
+_query_cache = ResultCache(max_entries=64)
+
+
+def genes_table(data_store):
+    """Pair index of the visible fronts plus their solution-level table (cached per data version)."""
+    incidence = gene_incidence(data_store)
+    if incidence.matrix.nnz == 0:
+        return None
+
+    def compute():
+        fronts = {f['id']: f for f in (data_store or {}).get('fronts', [])}
+        objectives = list((data_store or {}).get('explicit_objectives', []))
+        solutions = pd.DataFrame({
+            'front_name': [incidence.front_names[i] for i in incidence.front_index],
+            'unique_solution_id': [f"{incidence.front_names[i]} - {sid}"
+                                   for i, sid in zip(incidence.front_index, incidence.solution_ids)],
+            'solution_id': incidence.solution_ids,
+        })
+        for objective in objectives:
+            solutions[objective] = [
+                fronts[incidence.front_ids[i]]['data'][pos].get(objective)
+                for i, pos in zip(incidence.front_index, incidence.positions)
+            ]
+        matrix = incidence.matrix
+        pair_rows = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+        return GenesTable(incidence.key, incidence, solutions, objectives, pair_rows, matrix.indices.astype(np.int64))
+
+    return _table_cache.get_or_compute(incidence.key, compute)
+
+
+def is_numeric_column(table, column):
+    return column in table.solutions.columns and column not in SOLUTION_COLUMNS and \
+        pd.api.types.is_numeric_dtype(table.solutions[column])
+
+
+def _base_values(table, column):
+    """(values per base item, index of the base item of every pair)."""
+    if column == 'gene':
+        return np.asarray(table.incidence.genes, dtype=object), table.pair_genes
+    return table.solutions[column].to_numpy(), table.pair_rows
+
+
+def column_values(table, column, pairs):
+    """Long-format values of `column` for the given pairs."""
+    values, index = _base_values(table, column)
+    return values[index[pairs]]
+
+
+def _resolver(table, pairs=None):
+    """Column resolver for logic.utils.table_query over all pairs (or a subset)."""
+    def resolve(column):
+        if column != 'gene' and column not in table.solutions.columns:
+            return None
+        values, index = _base_values(table, column)
+        return values, (index if pairs is None else index[pairs]), is_numeric_column(table, column)
+    return resolve
+
+
+def filter_pairs(table, front_name='all', filter_query=''):
+    """
+    Pair indices matching the front selector and a DataTable `filter_query` (cached, so the
+    table page, the summary, the histogram and the graph actions share one evaluation).
+    """
+    key = ('filter', table.key, front_name or 'all', (filter_query or '').strip())
+
+    def compute():
+        mask = query_mask(filter_query, table.pair_rows.size, _resolver(table))
+        if front_name and front_name != 'all':
+            mask &= (table.solutions['front_name'].to_numpy() == front_name)[table.pair_rows]
+        pairs = np.flatnonzero(mask)
+        pairs.setflags(write=False)
+        return pairs
+
+    return _query_cache.get_or_compute(key, compute)
+
+
+def sorted_pairs(table, front_name='all', filter_query='', sort_by=None):
+    """Filtered pairs in `sort_by` order (cached: paging does not sort again)."""
+    pairs = filter_pairs(table, front_name, filter_query)
+    sort_key = tuple((e.get('column_id'), e.get('direction')) for e in (sort_by or []))
+    if not sort_key:
+        return pairs
+    key = ('sort', table.key, front_name or 'all', (filter_query or '').strip(), sort_key)
+
+    def compute():
+        order = sort_order(sort_by, _resolver(table, pairs))
+        result = pairs if order is None else pairs[order]
+        result.setflags(write=False)
+        return result
+
+    return _query_cache.get_or_compute(key, compute)
+
+
+def page_records(table, pairs):
+    """Long-format records (dicts) of the given pairs, e.g. one table page."""
+    rows = table.pair_rows[pairs]
+    page = table.solutions.iloc[rows].reset_index(drop=True)
+    page.insert(3, 'gene', np.asarray(table.incidence.genes, dtype=object)[table.pair_genes[pairs]])
+    return page.astype(object).where(page.notna(), None).to_dict('records')
+
+
+def genes_of_pairs(table, pairs):
+    """Sorted distinct genes of the given pairs."""
+    return [str(g) for g in np.asarray(table.incidence.genes, dtype=object)[np.unique(table.pair_genes[pairs])]]
+
+
+def category_counts(table, column, pairs):
+    """Long-format row count per value of a categorical column (descending, like value_counts)."""
+    values, index = _base_values(table, column)
+    per_item = np.bincount(index[pairs], minlength=len(values))
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object).astype(str))
+    counts = pd.Series(np.bincount(codes, weights=per_item, minlength=len(uniques)).astype(np.int64), index=uniques)
+    counts = counts[counts > 0]
+    return counts.iloc[np.argsort(-counts.to_numpy(), kind='stable')]
+
+
+def metric_distribution(table, front_name='all', filter_query='', metric='gene', bins=HISTOGRAM_BINS):
+    """
+    Chart data of the filtered pairs (cached per data version, filter and metric):
+    kind 'categorical' -> labels/counts in descending order; kind 'numeric' -> the non-empty bins
+    of a `bins`-bin histogram (labels, counts, bin_edges as [start, end] pairs); kind 'empty' otherwise.
+    Also carries the summary figures (rows, distinct solutions and genes).
+    """
+    key = ('distribution', table.key, front_name or 'all', (filter_query or '').strip(), metric, bins)
+
+    def compute():
+        pairs = filter_pairs(table, front_name, filter_query)
+        # Pesos por solución / gen: el histograma no necesita expandir los valores a cada par
+        per_solution = np.bincount(table.pair_rows[pairs], minlength=len(table.solutions))
+        per_gene = np.bincount(table.pair_genes[pairs], minlength=len(table.incidence.genes))
+        summary = (int(pairs.size), int(np.count_nonzero(per_solution)), int(np.count_nonzero(per_gene)))
+        if pairs.size == 0 or (metric != 'gene' and metric not in table.solutions.columns):
+            return MetricDistribution('empty', [], np.array([], dtype=np.int64), np.empty((0, 2)), 0, *summary)
+
+        if not is_numeric_column(table, metric):
+            counts = category_counts(table, metric, pairs)
+            return MetricDistribution('categorical', [str(v) for v in counts.index], counts.to_numpy(),
+                                      np.empty((0, 2)), len(counts), *summary)
+
+        values = table.solutions[metric].to_numpy(dtype=float)
+        valid = (per_solution > 0) & ~np.isnan(values)
+        if not valid.any():
+            return MetricDistribution('empty', [], np.array([], dtype=np.int64), np.empty((0, 2)), 0, *summary)
+        counts, edges = np.histogram(values[valid], bins=bins, weights=per_solution[valid])
+        counts = np.rint(counts).astype(np.int64)
+        filled = np.flatnonzero(counts)
+        bin_edges = np.column_stack([edges[filled], edges[filled + 1]])
+        labels = [f"{start:.3g} - {end:.3g}" for start, end in bin_edges]
+        return MetricDistribution('numeric', labels, counts[filled], bin_edges, len(filled), *summary)
+
+    return _query_cache.get_or_compute(key, compute)
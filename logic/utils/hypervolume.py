@@ -0,0 +1,215 @@
+# logic/utils/hypervolume.py
+"""
+Hypervolume indicator.
+
+- 2 objectives: O(n log n) sweep over the sorted staircase.
+- 3 objectives: exact z-sweep keeping an incremental 2D staircase (HV3D style),
+  stored in sorted chunks so the sweep stays O(n log n) amortized.
+- 4+ objectives: Monte-Carlo estimate inside the [ideal, reference] box.
+
+Points are minimization-oriented; only points strictly better than the
+reference point in every objective contribute.
+"""
+
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+from logic.utils.analysis_cache import ResultCache, front_version
+from logic.utils.dominance import non_dominated_mask, weak_dominance_matrix
+from logic.utils.objectives import normalize_raw, objective_space
+
+# Margen del punto de referencia por defecto (espacio normalizado: 1 + margen)
+DEFAULT_REFERENCE_OFFSET = 0.1
+MC_SAMPLES = 200000
+MC_CHUNK = 2048
+# Tamaño de bloque de la escalera 2D del barrido 3D
+STAIRCASE_CHUNK = 256
+
+_hv_cache = ResultCache(max_entries=256)
+
+
+def _prepare(points, reference, filter_dominated=True):
+    points = np.asarray(points, dtype=float)
+    reference = np.asarray(reference, dtype=float)
+    if points.ndim != 2 or points.shape[0] == 0:
+        return points[:0], reference
+    inside = np.all(points < reference, axis=1)
+    points = points[inside]
+    if points.shape[0] == 0 or not filter_dominated:
+        return points, reference
+    return points[non_dominated_mask(points)], reference
+
+
+def hypervolume_2d(points, reference):
+    """Exact 2D hypervolume by sweeping the staircase sorted on the first objective."""
+    points, reference = _prepare(points, reference)
+    if points.shape[0] == 0:
+        return 0.0
+    points = np.unique(points, axis=0)
+    order = np.argsort(points[:, 0], kind='mergesort')
+    xs = points[order, 0]
+    ys = points[order, 1]
+    next_x = np.append(xs[1:], reference[0])
+    return float(np.sum((next_x - xs) * (reference[1] - ys)))
+
+
+class _Staircase:
+    """
+    2D staircase (x increasing, y decreasing) split in sorted chunks of up to 2 * STAIRCASE_CHUNK points,
+    so locating, inserting and removing points costs O(log n + chunk) instead of O(n) list shifts.
+    """
+
+    def __init__(self, ref_x, ref_y):
+        self.ref_x, self.ref_y = ref_x, ref_y
+        self.xs, self.ys, self.heads = [], [], []
+
+    def _next_x(self, c, j):
+        if j + 1 < len(self.xs[c]):
+            return self.xs[c][j + 1]
+        return self.xs[c + 1][0] if c + 1 < len(self.xs) else self.ref_x
+
+    def add(self, px, py):
+        """Insert (px, py) and return the 2D area it adds (0 if it is dominated by the staircase)."""
+        if not self.xs:
+            self.xs, self.ys, self.heads = [[px]], [[py]], [px]
+            return (self.ref_x - px) * (self.ref_y - py)
+
+        c = max(bisect_right(self.heads, px) - 1, 0)
+        i = bisect_left(self.xs[c], px)
+        if i == len(self.xs[c]) and c + 1 < len(self.xs):
+            c, i = c + 1, 0
+        if i > 0:
+            upper = self.ys[c][i - 1]
+        else:
+            upper = self.ys[c - 1][-1] if c > 0 else self.ref_y
+        # ¿Está dominado en 2D por la escalera actual?
+        if upper <= py or (i < len(self.xs[c]) and self.xs[c][i] == px and self.ys[c][i] <= py):
+            return 0.0
+
+        # Área nueva: franja hasta el primer punto no dominado por p, más los escalones que p domina
+        boundary = self.xs[c][i] if i < len(self.xs[c]) else self._next_x(c, i - 1)
+        added = (boundary - px) * (upper - py)
+        end_c, end_j = c, i
+        while end_c < len(self.xs):
+            chunk_x, chunk_y = self.xs[end_c], self.ys[end_c]
+            while end_j < len(chunk_x) and chunk_y[end_j] >= py:
+                added += (self._next_x(end_c, end_j) - chunk_x[end_j]) * (chunk_y[end_j] - py)
+                end_j += 1
+            if end_j < len(chunk_x):
+                break
+            end_c, end_j = end_c + 1, 0
+
+        if end_c == c:
+            self.xs[c][i:end_j] = [px]
+            self.ys[c][i:end_j] = [py]
+        else:
+            self.xs[c][i:] = [px]
+            self.ys[c][i:] = [py]
+            if end_c < len(self.xs):
+                del self.xs[end_c][:end_j], self.ys[end_c][:end_j]
+                self.heads[end_c] = self.xs[end_c][0]
+            del self.xs[c + 1:end_c], self.ys[c + 1:end_c], self.heads[c + 1:end_c]
+        self.heads[c] = self.xs[c][0]
+
+        if len(self.xs[c]) > 2 * STAIRCASE_CHUNK:
+            self.xs[c:c + 1] = [self.xs[c][:STAIRCASE_CHUNK], self.xs[c][STAIRCASE_CHUNK:]]
+            self.ys[c:c + 1] = [self.ys[c][:STAIRCASE_CHUNK], self.ys[c][STAIRCASE_CHUNK:]]
+            self.heads[c:c + 1] = [self.xs[c][0], self.xs[c + 1][0]]
+        return added
+
+
+def hypervolume_3d(points, reference):
+    """Exact 3D hypervolume: sweep on z keeping the dominated 2D area up to date (O(n log n) amortized)."""
+    # Los puntos dominados no añaden área a la escalera: no hace falta el filtro O(n²) previo
+    points, reference = _prepare(points, reference, filter_dominated=False)
+    if points.shape[0] == 0:
+        return 0.0
+    points = points[np.argsort(points[:, 2], kind='mergesort')]
+    ref_x, ref_y, ref_z = (float(v) for v in reference)
+
+    staircase = _Staircase(ref_x, ref_y)
+    next_z = np.append(points[1:, 2], ref_z).tolist()
+    area = 0.0
+    volume = 0.0
+    for (px, py, pz), upper_z in zip(points.tolist(), next_z):
+        area += staircase.add(px, py)
+        volume += area * (upper_z - pz)
+    return float(volume)
+
+
+def hypervolume_monte_carlo(points, reference, n_samples=MC_SAMPLES, seed=0):
+    """Monte-Carlo hypervolume estimate for any number of objectives."""
+    points, reference = _prepare(points, reference)
+    if points.shape[0] == 0:
+        return 0.0
+    lower = points.min(axis=0)
+    box_volume = float(np.prod(reference - lower))
+    if box_volume <= 0:
+        return 0.0
+
+    rng = np.random.default_rng(seed)
+    hits = 0
+    for start in range(0, n_samples, MC_CHUNK):
+        size = min(MC_CHUNK, n_samples - start)
+        samples = lower + rng.random((size, points.shape[1])) * (reference - lower)
+        hits += int(weak_dominance_matrix(points, samples).any(axis=0).sum())
+    return box_volume * hits / n_samples
+
+
+def hypervolume(points, reference):
+    """Dispatch to the exact (2D/3D) or estimated (4D+) algorithm. Returns (value, is_exact)."""
+    points = np.asarray(points, dtype=float)
+    m = points.shape[1] if points.ndim == 2 else 0
+    if m == 1:
+        best = points[:, 0].min() if points.shape[0] else reference[0]
+        return float(max(0.0, reference[0] - best)), True
+    if m == 2:
+        return hypervolume_2d(points, reference), True
+    if m == 3:
+        return hypervolume_3d(points, reference), True
+    return hypervolume_monte_carlo(points, reference), False
+
+
+def parse_reference_point(text, n_objectives):
+    """Parse a comma-separated reference point. Returns a list of floats or None."""
+    if not text or not str(text).strip():
+        return None
+    try:
+        values = [float(v) for v in str(text).replace(';', ',').split(',') if v.strip()]
+    except ValueError:
+        return None
+    return values if len(values) == n_objectives else None
+
+
+def front_hypervolumes(data_store, reference_point=None):
+    """
+    Hypervolume of every loaded front in the normalized objective space shared by all
+    fronts (ideal -> 0, nadir -> 1). `reference_point` is given in raw objective units;
+    when omitted, 1 + DEFAULT_REFERENCE_OFFSET is used on every normalized axis.
+    Returns {front_id: {'hv': float, 'exact': bool}}.
+    """
+    fronts = (data_store or {}).get('fronts', [])
+    space = objective_space(data_store)
+    if not fronts or not space.objectives or space.ideal is None:
+        return {}
+
+    if reference_point is not None:
+        reference = normalize_raw(space, [reference_point])[0]
+    else:
+        reference = np.full(len(space.objectives), 1.0 + DEFAULT_REFERENCE_OFFSET)
+
+    space_key = space.key[2:] + (tuple(np.round(space.ideal, 12)), tuple(np.round(space.span, 12)))
+    reference_key = tuple(np.round(reference, 12))
+    results = {}
+    for front in fronts:
+        key = (front_version(front), space_key, reference_key)
+
+        def compute(matrix=space.normalized[front['id']]):
+            if not matrix.size:
+                return {'hv': 0.0, 'exact': True}
+            value, exact = hypervolume(matrix, reference)
+            return {'hv': value, 'exact': exact}
+
+        results[front['id']] = _hv_cache.get_or_compute(key, compute)
+    return results
@@ -0,0 +1,126 @@
+# logic/utils/job_store.py
+"""
+State of background jobs shared by every server process.
+
+Under gunicorn (several worker processes) the request that starts a job and the
+requests that poll it usually reach different processes, so the status, progress
+and result of a job live in a diskcache directory that every process opens
+(BIOPARETO_JOB_DIR, by default `biopareto-jobs` in the temporary directory):
+
+    (kind, 'status', key) -> {'state': 'running'|'failed', 'token', 'done', 'total', 'error', 'heartbeat'}
+    (kind, 'result', key) -> result of the job (pickled)
+
+A job is claimed atomically, so one data version is computed by one process
+only. The claim returns a token: cancelling (or re-claiming a stale job) changes
+the status entry and the old runner notices on its next progress report. A
+'running' job without progress for `stale_after` seconds belonged to a process
+that died and may be claimed again.
+"""
+
+import os
+import tempfile
+import time
+import uuid
+
+import diskcache
+
+from logic.utils.analysis_cache import ResultCache
+
+JOB_STORE_DIR = os.environ.get('BIOPARETO_JOB_DIR') or os.path.join(tempfile.gettempdir(), 'biopareto-jobs')
+JOB_STORE_SIZE_LIMIT = 512 * 2 ** 20
+RESULT_TTL = 24 * 3600
+STALE_AFTER = 600
+
+_store = diskcache.Cache(JOB_STORE_DIR, size_limit=JOB_STORE_SIZE_LIMIT)
+_MISSING = object()
+
+
+class JobStore:
+    """Status, progress and results of one kind of background job, readable from any process."""
+
+    def __init__(self, kind, max_local_results=8, stale_after=STALE_AFTER):
+        self.kind = kind
+        self.stale_after = stale_after
+        # Copia local de los resultados ya leídos (evita deserializarlos en cada consulta)
+        self._local = ResultCache(max_entries=max_local_results)
+
+    def _status_key(self, key):
+        return (self.kind, 'status', key)
+
+    def _result_key(self, key):
+        return (self.kind, 'result', key)
+
+    def _live(self, status):
+        return status['state'] == 'running' and time.time() - status['heartbeat'] < self.stale_after
+
+    def result(self, key, default=None):
+        """Result of a finished job (default when there is none)."""
+        value = self._local.get(key, _MISSING)
+        if value is _MISSING:
+            value = _store.get(self._result_key(key), _MISSING)
+            if value is _MISSING:
+                return default
+            self._local.set(key, value)
+        return value
+
+    def claim(self, key, total=1):
+        """Mark the job as running and return its token, or None if it is finished or running elsewhere."""
+        with _store.transact():
+            if self._result_key(key) in _store:
+                return None
+            status = _store.get(self._status_key(key))
+            if status is not None and self._live(status):
+                return None
+            token = uuid.uuid4().hex
+            _store.set(self._status_key(key), {'state': 'running', 'token': token, 'done': 0, 'total': total,
+                                               'error': None, 'heartbeat': time.time()}, expire=RESULT_TTL)
+        return token
+
+    def progress(self, key, token, done):
+        """Record progress of the runner holding `token`; False when the job was cancelled or taken over."""
+        with _store.transact():
+            status = _store.get(self._status_key(key))
+            if status is None or status['token'] != token or status['state'] != 'running':
+                return False
+            _store.set(self._status_key(key), {**status, 'done': done, 'heartbeat': time.time()}, expire=RESULT_TTL)
+        return True
+
+    def finish(self, key, token, result):
+        """Store the result of the runner holding `token` (ignored if the job was cancelled meanwhile)."""
+        with _store.transact():
+            status = _store.get(self._status_key(key))
+            if status is None or status['token'] != token:
+                return
+            _store.set(self._result_key(key), result, expire=RESULT_TTL)
+            _store.delete(self._status_key(key))
+        self._local.set(key, result)
+
+    def fail(self, key, token, error):
+        with _store.transact():
+            status = _store.get(self._status_key(key))
+            if status is None or status['token'] != token:
+                return
+            _store.set(self._status_key(key), {**status, 'state': 'failed', 'error': str(error)}, expire=RESULT_TTL)
+
+    def cancel(self, key):
+        """Stop a running job (its runner stops at the next progress report); finished results are kept."""
+        _store.delete(self._status_key(key))
+
+    def status(self, key):
+        """
+        ('ready', result) | ('running', fraction done) | ('failed', error message) |
+        ('idle', None) when the job was never started, was cancelled or its process died.
+        """
+        result = self.result(key, _MISSING)
+        if result is not _MISSING:
+            return 'ready', result
+        status = _store.get(self._status_key(key))
+        if status is None:
+            # El trabajo pudo terminar entre las dos lecturas
+            result = self.result(key, _MISSING)
+            return ('ready', result) if result is not _MISSING else ('idle', None)
+        if status['state'] == 'failed':
+            return 'failed', status['error']
+        if not self._live(status):
+            return 'idle', None
+        return 'running', status['done'] / max(status['total'], 1)
@@ -0,0 +1,122 @@
+# logic/utils/near_duplicates.py
+"""
+Near-duplicate gene subsets with MinHash + LSH.
+
+1. MinHash signatures: for every permutation h(x) = (a·x + b) mod p over the
+   interned gene ids, the signature of a solution is min h over its genes
+   (np.minimum.reduceat over the CSR rows, a few permutations at a time).
+2. LSH banding: the signature is split into `bands` bands of `rows` values;
+   solutions whose band values coincide land in the same bucket. (bands, rows)
+   is chosen so the S-curve 1 - (1 - s^rows)^bands switches near the threshold.
+3. Candidate pairs are only formed inside buckets (each member with the bucket
+   leader and with its neighbour in bucket order), so the work is O(n · bands)
+   instead of O(n²). Candidates are verified with the exact Jaccard similarity and
+   duplicate clusters are the connected components of the verified pairs.
+"""
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+MINHASH_PERMUTATIONS = 128
+PERMUTATION_CHUNK = 16
+DEFAULT_THRESHOLD = 0.9
+FALSE_POSITIVE_WEIGHT = 0.1
+_PRIME = 4294967311  # primo > 2^32
+_trapezoid = getattr(np, 'trapezoid', None) or np.trapz  # numpy < 2.0 solo tiene trapz
+
+
+def minhash_signatures(matrix, n_permutations=MINHASH_PERMUTATIONS, seed=0):
+    """(n, n_permutations) int64 MinHash signatures of the rows of a CSR incidence matrix (empty rows -> p)."""
+    n, n_genes = matrix.shape
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _PRIME, size=n_permutations, dtype=np.int64)
+    b = rng.integers(0, _PRIME, size=n_permutations, dtype=np.int64)
+
+    signatures = np.full((n, n_permutations), _PRIME, dtype=np.int64)
+    lengths = np.diff(matrix.indptr)
+    non_empty = np.flatnonzero(lengths)
+    if non_empty.size == 0:
+        return signatures
+
+    starts = matrix.indptr[:-1][non_empty]
+    gene_ids = np.arange(n_genes, dtype=np.int64)
+    for start in range(0, n_permutations, PERMUTATION_CHUNK):
+        stop = min(start + PERMUTATION_CHUNK, n_permutations)
+        hashed = (a[start:stop, None] * gene_ids[None, :] + b[start:stop, None]) % _PRIME
+        values = hashed[:, matrix.indices]
+        signatures[non_empty, start:stop] = np.minimum.reduceat(values, starts, axis=1).T
+    return signatures
+
+
+def lsh_parameters(threshold, n_permutations=MINHASH_PERMUTATIONS):
+    """
+    (bands, rows) minimizing the weighted false positive / false negative areas of the LSH S-curve.
+    False negatives weigh more: false positives are removed later by the exact check.
+    """
+    s = np.linspace(0.0, 1.0, 201)
+    best, best_error = (n_permutations, 1), np.inf
+    for rows in range(1, n_permutations + 1):
+        bands = n_permutations // rows
+        probability = 1.0 - (1.0 - s ** rows) ** bands
+        false_positive = _trapezoid(np.where(s < threshold, probability, 0.0), s)
+        false_negative = _trapezoid(np.where(s >= threshold, 1.0 - probability, 0.0), s)
+        error = FALSE_POSITIVE_WEIGHT * false_positive + (1.0 - FALSE_POSITIVE_WEIGHT) * false_negative
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+def _bucket_pairs(band):
+    """Candidate pairs of one band: bucket leader + consecutive members of each bucket."""
+    _, bucket = np.unique(band, axis=0, return_inverse=True)
+    order = np.argsort(bucket.ravel(), kind='stable')
+    sorted_bucket = bucket.ravel()[order]
+    same = sorted_bucket[1:] == sorted_bucket[:-1]
+    if not same.any():
+        return np.zeros((0, 2), dtype=np.int64)
+
+    first = np.r_[True, ~same]
+    leaders = order[first][np.cumsum(first) - 1]
+    chain = np.c_[order[:-1][same], order[1:][same]]
+    star = np.c_[leaders[~first], order[~first]]
+    return np.vstack([chain, star])
+
+
+def jaccard_pairs(matrix, sizes, pairs):
+    """Exact Jaccard similarity of the row pairs (two empty sets -> 1)."""
+    if len(pairs) == 0:
+        return np.zeros(0)
+    intersection = np.asarray(matrix[pairs[:, 0]].multiply(matrix[pairs[:, 1]]).sum(axis=1)).ravel()
+    union = sizes[pairs[:, 0]] + sizes[pairs[:, 1]] - intersection
+    return np.divide(intersection, union, out=np.ones(len(pairs)), where=union > 0)
+
+
+def near_duplicate_labels(matrix, threshold=DEFAULT_THRESHOLD, n_permutations=MINHASH_PERMUTATIONS, seed=0):
+    """
+    Cluster label of every row: rows linked by verified Jaccard >= threshold share a label.
+    Labels are 0..k-1 numbered by first appearance.
+    """
+    n = matrix.shape[0]
+    if n < 2:
+        return np.zeros(n, dtype=np.int64)
+
+    sizes = np.diff(matrix.indptr).astype(float)
+    signatures = minhash_signatures(matrix, n_permutations, seed)
+    bands, rows = lsh_parameters(threshold, n_permutations)
+
+    candidates = [_bucket_pairs(signatures[:, i * rows:(i + 1) * rows]) for i in range(bands)]
+    pairs = np.vstack(candidates)
+    if pairs.size:
+        pairs = np.sort(pairs, axis=1)
+        pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+        pairs = np.unique(pairs, axis=0)
+        pairs = pairs[jaccard_pairs(matrix, sizes, pairs) >= threshold - 1e-12]
+
+    graph = coo_matrix((np.ones(len(pairs)), (pairs[:, 0], pairs[:, 1])), shape=(n, n))
+    _, labels = connected_components(graph, directed=False)
+    # Renumerar por orden de aparición
+    _, first_index, inverse = np.unique(labels, return_index=True, return_inverse=True)
+    rank = np.empty_like(first_index)
+    rank[np.argsort(first_index, kind='stable')] = np.arange(first_index.size)
+    return rank[inverse]
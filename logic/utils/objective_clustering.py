@@ -0,0 +1,178 @@
+# logic/utils/objective_clustering.py
+"""
+Clustering of the visible solutions in the normalized objective space.
+
+- 'kmeans': mini-batch k-means (Sculley 2010) with k-means++ seeding on a sample;
+  every batch is assigned in one vectorized distance computation and centers move
+  to the running mean of their assigned points.
+- 'grid': regular grid with `k` cells per objective (occupied cells are clusters).
+
+Each cluster reports its size, its centroid (normalized and in objective units)
+and a gene-frequency profile computed with one sparse product Lᵀ·X between the
+cluster indicator matrix and the solution x gene incidence matrix.
+"""
+
+import numpy as np
+from scipy import sparse
+
+from logic.utils.analysis_cache import ResultCache
+from logic.utils.dominance import _unique_rows
+from logic.utils.gene_sets import gene_incidence
+from logic.utils.objectives import objective_space
+
+CLUSTER_METHODS = ('kmeans', 'grid')
+BATCH_SIZE = 1024
+MAX_ITERATIONS = 100
+SEED_SAMPLE = 10000
+ASSIGN_CHUNK = 65536
+TOP_GENES = 10
+
+_cluster_cache = ResultCache(max_entries=32)
+
+
+def _squared_distances(points, centers):
+    return (np.einsum('ij,ij->i', points, points)[:, None] - 2 * points @ centers.T
+            + np.einsum('ij,ij->i', centers, centers)[None, :])
+
+
+def assign_clusters(points, centers):
+    """Nearest center of every row (chunked)."""
+    labels = np.empty(points.shape[0], dtype=np.int64)
+    for start in range(0, points.shape[0], ASSIGN_CHUNK):
+        labels[start:start + ASSIGN_CHUNK] = np.argmin(_squared_distances(points[start:start + ASSIGN_CHUNK], centers), axis=1)
+    return labels
+
+
+def _kmeans_plus_plus(points, k, rng):
+    centers = [points[rng.integers(points.shape[0])]]
+    closest = ((points - centers[0]) ** 2).sum(axis=1)
+    for _ in range(1, k):
+        total = closest.sum()
+        if total <= 0:
+            break
+        centers.append(points[rng.choice(points.shape[0], p=closest / total)])
+        closest = np.minimum(closest, ((points - centers[-1]) ** 2).sum(axis=1))
+    return np.array(centers)
+
+
+def minibatch_kmeans(points, k, batch_size=BATCH_SIZE, max_iterations=MAX_ITERATIONS, seed=0):
+    """Mini-batch k-means on a finite matrix. Returns (labels, centers)."""
+    n = points.shape[0]
+    rng = np.random.default_rng(seed)
+    sample = points if n <= SEED_SAMPLE else points[rng.choice(n, SEED_SAMPLE, replace=False)]
+    centers = _kmeans_plus_plus(np.unique(sample, axis=0), min(k, n), rng)
+    counts = np.zeros(centers.shape[0])
+
+    if n > batch_size:
+        for _ in range(max_iterations):
+            batch = points[rng.integers(0, n, batch_size)]
+            nearest = np.argmin(_squared_distances(batch, centers), axis=1)
+            batch_counts = np.bincount(nearest, minlength=centers.shape[0])
+            sums = np.zeros_like(centers)
+            np.add.at(sums, nearest, batch)
+            counts += batch_counts
+            moved = batch_counts > 0
+            # Media acumulada: c <- c + (suma_lote - n_lote·c) / n_total
+            shift = (sums[moved] - batch_counts[moved, None] * centers[moved]) / counts[moved, None]
+            centers[moved] += shift
+            if np.abs(shift).max() < 1e-6:
+                break
+    else:
+        # Pocos puntos: k-means clásico (Lloyd) sobre todo el conjunto
+        for _ in range(max_iterations):
+            labels = assign_clusters(points, centers)
+            sums = np.zeros_like(centers)
+            np.add.at(sums, labels, points)
+            sizes = np.bincount(labels, minlength=centers.shape[0])
+            new_centers = np.where(sizes[:, None] > 0, sums / np.maximum(sizes, 1)[:, None], centers)
+            if np.allclose(new_centers, centers):
+                break
+            centers = new_centers
+
+    labels = assign_clusters(points, centers)
+    return _compact(labels, centers)
+
+
+def grid_clusters(points, cells_per_objective):
+    """Occupied cells of a regular grid over [0, 1]^m. Returns (labels, centers = cell means)."""
+    cells = np.clip(np.floor(points * cells_per_objective), 0, cells_per_objective - 1)
+    _, labels = _unique_rows(cells)
+    sums = np.zeros((labels.max() + 1, points.shape[1]))
+    np.add.at(sums, labels, points)
+    return labels, sums / np.bincount(labels)[:, None]
+
+
+def _compact(labels, centers):
+    """Drop empty clusters and renumber by decreasing size."""
+    sizes = np.bincount(labels, minlength=centers.shape[0])
+    order = np.argsort(-sizes, kind='stable')
+    order = order[sizes[order] > 0]
+    remap = np.full(centers.shape[0], -1)
+    remap[order] = np.arange(order.size)
+    return remap[labels], centers[order]
+
+
+def gene_profiles(incidence_matrix, labels, n_clusters):
+    """(n_clusters, n_genes) dense frequency of each gene inside each cluster."""
+    valid = labels >= 0
+    indicator = sparse.csr_matrix(
+        (np.ones(valid.sum()), (labels[valid], np.flatnonzero(valid))),
+        shape=(n_clusters, incidence_matrix.shape[0])
+    )
+    counts = np.asarray((indicator @ incidence_matrix).todense())
+    sizes = np.bincount(labels[valid], minlength=n_clusters)
+    return counts / np.maximum(sizes, 1)[:, None]
+
+
+def cluster_solutions(data_store, method='kmeans', k=6):
+    """
+    Cluster the visible solutions in the shared normalized objective space (cached).
+    Returns {'objectives', 'labels' (per visible row, -1 = missing objectives), 'rows' [(front_id, index)],
+             'clusters': [{'cluster', 'size', 'centroid', 'centroid_raw', 'top_genes'}]} or None.
+    """
+    space = objective_space(data_store)
+    fronts = [f for f in (data_store or {}).get('fronts', []) if f.get('visible', True) and f.get('data')]
+    if not fronts or not space.objectives or space.ideal is None:
+        return None
+    method = method if method in CLUSTER_METHODS else 'kmeans'
+    k = max(1, int(k or 1))
+    key = (space.key, tuple(f['id'] for f in fronts), method, k)
+
+    def compute():
+        points = np.vstack([space.normalized[f['id']] for f in fronts])
+        rows = [(f['id'], i) for f in fronts for i in range(len(f['data']))]
+        finite = np.all(np.isfinite(points), axis=1)
+        labels = np.full(points.shape[0], -1, dtype=np.int64)
+        if not finite.any():
+            return None
+        if method == 'grid':
+            finite_labels, centers = grid_clusters(points[finite], k)
+            finite_labels, centers = _compact(finite_labels, centers)
+        else:
+            finite_labels, centers = minibatch_kmeans(points[finite], k)
+        labels[finite] = finite_labels
+
+        incidence = gene_incidence(data_store)
+        profiles = gene_profiles(incidence.matrix, labels, centers.shape[0])
+        global_frequency = np.asarray(incidence.matrix.mean(axis=0)).ravel()
+        signs = np.array([-1.0 if d == 'max' else 1.0 for d in space.directions])
+        sizes = np.bincount(labels[labels >= 0], minlength=centers.shape[0])
+
+        clusters = []
+        for c in range(centers.shape[0]):
+            top = np.argsort(-profiles[c], kind='stable')[:TOP_GENES]
+            top = top[profiles[c, top] > 0]
+            clusters.append({
+                'cluster': c,
+                'size': int(sizes[c]),
+                'centroid': centers[c].tolist(),
+                'centroid_raw': ((space.ideal + centers[c] * space.span) * signs).tolist(),
+                'top_genes': [
+                    {'gene': str(incidence.genes[g]), 'frequency': float(profiles[c, g]),
+                     'lift': float(profiles[c, g] / global_frequency[g]) if global_frequency[g] > 0 else None}
+                    for g in top
+                ],
+            })
+        return {'objectives': list(space.objectives), 'labels': labels, 'rows': rows, 'clusters': clusters}
+
+    return _cluster_cache.get_or_compute(key, compute)
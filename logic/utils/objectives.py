@@ -0,0 +1,184 @@
+# logic/utils/objectives.py
+"""
+Objective helpers: direction metadata, objective matrix extraction and the
+shared normalized objective space.
+
+Per-objective metadata lives in data_store['objective_meta']:
+    {objective: {'direction': 'min'|'max', 'direction_source': 'inferred'|'user',
+                 'data_bounds': [lo, hi] | None, 'user_bounds': [lo|None, hi|None] | None}}
+Every analytic (dominance, indicators, knee detection, ...) reads the normalized
+matrices from objective_space(), which is cached per data version.
+"""
+
+import numbers
+from collections import namedtuple
+
+import numpy as np
+
+from logic.utils.analysis_cache import ResultCache, data_version
+
+# Campos numéricos calculados por la app (no son objetivos del archivo)
+DERIVED_FIELDS = ('pareto_rank', 'represented_count')
+
+# Palabras clave que indican un objetivo a maximizar (accuracy, auc, ...). Sin 'f1' a secas: f1, f2, ...
+# son nombres genéricos de objetivos (a minimizar por defecto), no el F1-score
+MAXIMIZE_HINTS = ('accuracy', 'auc', 'precision', 'recall', 'f1_score', 'f1score', 'fscore', 'sensitivity',
+                  'specificity', 'score', 'fitness')
+
+# Palabras clave que fuerzan minimización aunque contengan una pista de maximización (p.ej. "1-Auc")
+MINIMIZE_HINTS = ('error', 'loss', 'ratio', 'num_', 'cost', 'size')
+
+
+def _normalize_key(name):
+    return str(name).lower().replace('-', '_').replace(' ', '_')
+
+
+def infer_direction(objective_name):
+    """Infer 'min' or 'max' for an objective from its name (defaults to 'min')."""
+    key = _normalize_key(objective_name)
+    if key.startswith('1_') or any(hint in key for hint in MINIMIZE_HINTS):
+        return 'min'
+    if any(hint in key for hint in MAXIMIZE_HINTS):
+        return 'max'
+    return 'min'
+
+
+def resolve_directions(objectives, overrides=None):
+    """Return the list of directions for `objectives`, honouring explicit overrides."""
+    overrides = overrides or {}
+    return [overrides.get(obj) or infer_direction(obj) for obj in objectives]
+
+
+def objective_directions(data_store, objectives=None):
+    """Directions stored in the objective metadata (inferred for objectives without metadata)."""
+    meta = (data_store or {}).get('objective_meta') or {}
+    objectives = objectives if objectives is not None else get_dominance_objectives(data_store)
+    return resolve_directions(objectives, {obj: m.get('direction') for obj, m in meta.items()})
+
+
+def get_dominance_objectives(data_store):
+    """Objectives used for dominance: explicit ones from the file, else the main objectives."""
+    if not data_store:
+        return []
+    return list(data_store.get('explicit_objectives') or data_store.get('main_objectives') or [])
+
+
+def objective_matrix(solutions, objectives):
+    """Build an (n, m) float matrix from solution dicts. Missing/non-numeric values become NaN."""
+    matrix = np.full((len(solutions), len(objectives)), np.nan, dtype=float)
+    for j, obj in enumerate(objectives):
+        column = [sol.get(obj) for sol in solutions]
+        matrix[:, j] = [v if isinstance(v, numbers.Real) and not isinstance(v, bool) else np.nan for v in column]
+    return matrix
+
+
+def to_minimization(matrix, directions):
+    """Orient a raw objective matrix so every column is minimized (NaN -> +inf)."""
+    signs = np.array([-1.0 if d == 'max' else 1.0 for d in directions])
+    oriented = np.asarray(matrix, dtype=float) * signs
+    oriented[np.isnan(oriented)] = np.inf
+    return oriented
+
+
+def build_objective_meta(data_store):
+    """
+    (Re)build the per-objective metadata of a data_store in place: user-set directions and
+    bounds are kept, the rest is inferred; data bounds are recomputed over all loaded fronts.
+    """
+    if not data_store:
+        return data_store
+    objectives = list(dict.fromkeys((data_store.get('main_objectives') or []) + (data_store.get('explicit_objectives') or [])))
+    previous = data_store.get('objective_meta') or {}
+    all_solutions = [sol for front in data_store.get('fronts', []) for sol in front.get('data', [])]
+    matrix = objective_matrix(all_solutions, objectives)
+
+    meta = {}
+    for j, obj in enumerate(objectives):
+        prev = previous.get(obj) or {}
+        user_set = prev.get('direction_source') == 'user' and prev.get('direction') in ('min', 'max')
+        column = matrix[:, j]
+        column = column[np.isfinite(column)]
+        meta[obj] = {
+            'direction': prev['direction'] if user_set else infer_direction(obj),
+            'direction_source': 'user' if user_set else 'inferred',
+            'data_bounds': [float(column.min()), float(column.max())] if column.size else None,
+            'user_bounds': prev.get('user_bounds'),
+        }
+    data_store['objective_meta'] = meta
+    return data_store
+
+
+def shared_bounds(matrices):
+    """Ideal point and (non-zero) span over a collection of oriented matrices."""
+    stacked = [m for m in matrices if m.size]
+    if not stacked:
+        return None, None
+    finite = np.vstack(stacked)
+    finite = np.where(np.isfinite(finite), finite, np.nan)
+    ideal = np.nanmin(finite, axis=0)
+    nadir = np.nanmax(finite, axis=0)
+    span = np.where(nadir - ideal > 0, nadir - ideal, 1.0)
+    return np.nan_to_num(ideal), np.nan_to_num(span, nan=1.0)
+
+
+def normalize(oriented, ideal, span):
+    """Map an oriented matrix to the shared normalized space (ideal -> 0, nadir -> 1)."""
+    return (oriented - ideal) / span
+
+
+def _oriented_user_bounds(meta, objectives, directions):
+    """User bounds mapped to the minimization space as (ideal, nadir) arrays (NaN where unset)."""
+    ideal = np.full(len(objectives), np.nan)
+    nadir = np.full(len(objectives), np.nan)
+    for j, (obj, direction) in enumerate(zip(objectives, directions)):
+        lower, upper = ((meta.get(obj) or {}).get('user_bounds') or [None, None])[:2]
+        best, worst = (upper, lower) if direction == 'max' else (lower, upper)
+        sign = -1.0 if direction == 'max' else 1.0
+        if best is not None:
+            ideal[j] = sign * best
+        if worst is not None:
+            nadir[j] = sign * worst
+    return ideal, nadir
+
+
+ObjectiveSpace = namedtuple('ObjectiveSpace', ['key', 'objectives', 'directions', 'ideal', 'span', 'oriented', 'normalized'])
+
+_space_cache = ResultCache(max_entries=16)
+
+
+def objective_space(data_store):
+    """
+    Shared normalized objective space of every loaded front (cached per data version,
+    directions and user bounds). `oriented` / `normalized` map front_id -> read-only matrix.
+    """
+    objectives = get_dominance_objectives(data_store)
+    directions = objective_directions(data_store, objectives)
+    fronts = (data_store or {}).get('fronts', [])
+    meta = (data_store or {}).get('objective_meta') or {}
+    user_bounds = tuple(tuple((meta.get(obj) or {}).get('user_bounds') or ()) for obj in objectives)
+    key = (data_version(data_store, visible_only=False), tuple(f['id'] for f in fronts),
+           tuple(objectives), tuple(directions), user_bounds)
+
+    def compute():
+        oriented = {
+            f['id']: to_minimization(objective_matrix(f.get('data', []), objectives), directions).reshape(-1, len(objectives))
+            for f in fronts
+        } if objectives else {}
+        ideal, span = shared_bounds(oriented.values())
+        normalized = {}
+        if ideal is not None:
+            user_ideal, user_nadir = _oriented_user_bounds(meta, objectives, directions)
+            nadir = np.where(np.isnan(user_nadir), ideal + span, user_nadir)
+            ideal = np.where(np.isnan(user_ideal), ideal, user_ideal)
+            span = np.where(nadir - ideal > 0, nadir - ideal, 1.0)
+            normalized = {front_id: normalize(matrix, ideal, span) for front_id, matrix in oriented.items()}
+        for matrix in list(oriented.values()) + list(normalized.values()):
+            matrix.setflags(write=False)
+        return ObjectiveSpace(key, objectives, directions, ideal, span, oriented, normalized)
+
+    return _space_cache.get_or_compute(key, compute)
+
+
+def normalize_raw(space, raw_matrix):
+    """Orient and normalize raw objective values (rows ordered as space.objectives)."""
+    return normalize(to_minimization(np.asarray(raw_matrix, dtype=float), space.directions), space.ideal, space.span)
@@ -0,0 +1,178 @@
+# logic/utils/quality_indicators.py
+"""
+Batch quality indicators of every loaded front against a reference set.
+
+All fronts are stacked into one matrix (contiguous segments per front), so each
+indicator is computed with a single pass of chunked pairwise-distance kernels
+plus per-segment reductions (np.minimum.reduceat / np.add.reduceat). The chunk
+size bounds the size of every temporary distance block.
+
+Indicators (minimization, normalized objective space):
+- GD:      mean distance from each front point to its nearest reference point.
+- IGD:     mean distance from each reference point to its nearest front point.
+- IGD+:    IGD with the dominance-compliant distance sqrt(sum(max(a - r, 0)^2)).
+- Spread:  generalized spread (Zhou et al.), lower is more uniform/extensive.
+- Epsilon: additive epsilon indicator I_eps+(A, R).
+"""
+
+import numpy as np
+
+from logic.utils.dominance import non_dominated_mask
+from logic.utils.hypervolume import front_hypervolumes
+from logic.utils.objectives import normalize_raw, objective_matrix, objective_space
+
+# Máximo de celdas (filas x columnas x objetivos) por bloque de distancias
+MAX_BLOCK_ELEMENTS = 4_000_000
+
+INDICATOR_COLUMNS = ['hv', 'igd', 'igd_plus', 'gd', 'spread', 'epsilon']
+INDICATOR_LABELS = {
+    'hv': 'HV', 'igd': 'IGD', 'igd_plus': 'IGD+', 'gd': 'GD', 'spread': 'Spread', 'epsilon': 'Eps+'
+}
+
+
+def _rows_per_block(n_columns, n_objectives):
+    return max(1, MAX_BLOCK_ELEMENTS // max(1, n_columns * n_objectives))
+
+
+def _euclidean_block(left, right):
+    diff = left[:, None, :] - right[None, :, :]
+    return np.sqrt(np.einsum('ijk,ijk->ij', diff, diff))
+
+
+def _igd_plus_block(reference, points):
+    diff = np.maximum(points[None, :, :] - reference[:, None, :], 0.0)
+    return np.sqrt(np.einsum('ijk,ijk->ij', diff, diff))
+
+
+def _epsilon_block(reference, points):
+    return np.max(points[None, :, :] - reference[:, None, :], axis=2)
+
+
+def _reference_to_fronts(reference, stacked, offsets, kernel):
+    """(|R|, n_fronts) matrix: min over each front's segment of kernel(reference, points)."""
+    result = np.empty((reference.shape[0], len(offsets)))
+    step = _rows_per_block(stacked.shape[0], stacked.shape[1])
+    for start in range(0, reference.shape[0], step):
+        block = kernel(reference[start:start + step], stacked)
+        result[start:start + step] = np.minimum.reduceat(block, offsets, axis=1)
+    return result
+
+
+def _points_to_reference(stacked, reference):
+    """Distance from every stacked point to its nearest reference point."""
+    distances = np.empty(stacked.shape[0])
+    step = _rows_per_block(reference.shape[0], stacked.shape[1])
+    for start in range(0, stacked.shape[0], step):
+        distances[start:start + step] = _euclidean_block(stacked[start:start + step], reference).min(axis=1)
+    return distances
+
+
+def _nearest_neighbour_distances(points):
+    """Distance from each point to its nearest other point of the same set."""
+    n = points.shape[0]
+    if n < 2:
+        return np.zeros(n)
+    distances = np.empty(n)
+    step = _rows_per_block(n, points.shape[1])
+    for start in range(0, n, step):
+        block = _euclidean_block(points[start:start + step], points)
+        rows = np.arange(block.shape[0])
+        block[rows, start + rows] = np.inf
+        distances[start:start + step] = block.min(axis=1)
+    return distances
+
+
+def _generalized_spread(points, extremes):
+    if points.shape[0] < 2:
+        return np.nan
+    d_extremes = _euclidean_block(extremes, points).min(axis=1).sum()
+    nn = _nearest_neighbour_distances(points)
+    mean_nn = nn.mean()
+    denominator = d_extremes + points.shape[0] * mean_nn
+    if denominator == 0:
+        return 0.0
+    return float((d_extremes + np.abs(nn - mean_nn).sum()) / denominator)
+
+
+def batch_indicators(front_matrices, reference):
+    """
+    Distance-based indicators for a list of normalized, minimization-oriented front
+    matrices against the reference set. Returns a list of dicts (one per front).
+    """
+    reference = np.asarray(reference, dtype=float)
+    cleaned = [m[np.all(np.isfinite(m), axis=1)] if m.size else m for m in front_matrices]
+    results = [dict.fromkeys(['igd', 'igd_plus', 'gd', 'spread', 'epsilon'], np.nan) for _ in cleaned]
+    non_empty = [i for i, m in enumerate(cleaned) if m.shape[0]]
+    if not non_empty or reference.shape[0] == 0:
+        return results
+
+    stacked = np.vstack([cleaned[i] for i in non_empty])
+    sizes = np.array([cleaned[i].shape[0] for i in non_empty])
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+
+    # Referencia -> frentes (IGD, IGD+, epsilon) en un solo barrido por kernel
+    igd = _reference_to_fronts(reference, stacked, offsets, _euclidean_block).mean(axis=0)
+    igd_plus = _reference_to_fronts(reference, stacked, offsets, _igd_plus_block).mean(axis=0)
+    epsilon = _reference_to_fronts(reference, stacked, offsets, _epsilon_block).max(axis=0)
+
+    # Frentes -> referencia (GD)
+    gd = np.add.reduceat(_points_to_reference(stacked, reference), offsets) / sizes
+
+    extremes = reference[np.argmin(reference, axis=0)]
+    for pos, idx in enumerate(non_empty):
+        results[idx] = {
+            'igd': float(igd[pos]),
+            'igd_plus': float(igd_plus[pos]),
+            'gd': float(gd[pos]),
+            'spread': _generalized_spread(cleaned[idx], extremes),
+            'epsilon': float(epsilon[pos]),
+        }
+    return results
+
+
+def reference_front_matrix(reference_solutions, space):
+    """Normalized matrix of an uploaded reference front (list of solution dicts)."""
+    matrix = normalize_raw(space, objective_matrix(reference_solutions or [], space.objectives))
+    return matrix[np.all(np.isfinite(matrix), axis=1)]
+
+
+def compute_front_indicators(data_store, reference_solutions=None, reference_point=None):
+    """
+    Indicator table for every loaded front. The reference set is the uploaded reference
+    front when given, otherwise the merged non-dominated set of all loaded fronts.
+    Returns (rows, reference_label).
+    """
+    fronts = (data_store or {}).get('fronts', [])
+    space = objective_space(data_store)
+    if not fronts or not space.objectives or space.ideal is None:
+        return [], None
+
+    normalized = [space.normalized[f['id']] for f in fronts]
+    uploaded = reference_front_matrix(reference_solutions, space) if reference_solutions else None
+
+    if uploaded is not None and uploaded.size:
+        reference = uploaded
+        reference_label = f"Uploaded reference front ({uploaded.shape[0]} points)"
+    else:
+        merged = np.vstack([m for m in normalized if m.size])
+        merged = merged[np.all(np.isfinite(merged), axis=1)]
+        reference = np.unique(merged[non_dominated_mask(merged)], axis=0)
+        reference_label = f"Merged non-dominated set ({reference.shape[0]} points)"
+
+    indicators = batch_indicators(normalized, reference)
+    hypervolumes = front_hypervolumes(data_store, reference_point)
+
+    rows = []
+    for front, values in zip(fronts, indicators):
+        row = {'front': front.get('name', front['id']), 'size': len(front.get('data', []))}
+        row['hv'] = hypervolumes.get(front['id'], {}).get('hv', np.nan)
+        row.update(values)
+        rows.append(row)
+    return rows, reference_label
+
+
+def format_indicator(value, digits=4):
+    """Pretty-print an indicator value (NaN -> 'N/A')."""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return 'N/A'
+    return f"{value:.{digits}f}"
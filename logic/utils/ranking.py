@@ -0,0 +1,119 @@
+# logic/utils/ranking.py
+"""
+Multi-criteria ranking of the visible solutions.
+
+All methods work on the normalized minimization matrix shared by the fronts
+(logic.utils.objectives.objective_space), so weights are comparable across
+objectives whatever their units or direction:
+- weighted sum:  s = P·w                                  (lower is better)
+- TOPSIS:        c = d⁻ / (d⁺ + d⁻), weighted Euclidean distances to the
+                 ideal (column minima) and anti-ideal (column maxima)  (higher is better)
+- ASF:           s = max_j w_j (p_j - z_j) + ρ Σ_j w_j (p_j - z_j), z = reference point (lower is better)
+Solutions with missing objectives are ranked last.
+"""
+
+import numpy as np
+
+from logic.utils.analysis_cache import ResultCache
+from logic.utils.objectives import normalize_raw, objective_space
+
+RANKING_METHODS = {
+    'weighted_sum': 'Weighted sum',
+    'topsis': 'TOPSIS',
+    'asf': 'Achievement scalarizing (ASF)',
+}
+ASF_AUGMENTATION = 1e-4
+
+_ranking_cache = ResultCache(max_entries=16)
+
+
+def normalized_weights(weights, n_objectives):
+    """Non-negative weights summing to 1 (equal weights when missing or all zero)."""
+    w = np.array([float(v) if v is not None else 1.0 for v in (weights or [])][:n_objectives], dtype=float)
+    if w.size < n_objectives:
+        w = np.r_[w, np.ones(n_objectives - w.size)]
+    w = np.clip(np.nan_to_num(w, nan=0.0), 0.0, None)
+    return w / w.sum() if w.sum() > 0 else np.full(n_objectives, 1.0 / n_objectives)
+
+
+def weighted_sum_scores(points, weights):
+    return points @ weights
+
+
+def topsis_scores(points, weights):
+    finite = np.all(np.isfinite(points), axis=1)
+    scores = np.full(points.shape[0], np.nan)
+    if not finite.any():
+        return scores
+    weighted = points[finite] * weights
+    ideal, anti_ideal = weighted.min(axis=0), weighted.max(axis=0)
+    d_best = np.linalg.norm(weighted - ideal, axis=1)
+    d_worst = np.linalg.norm(weighted - anti_ideal, axis=1)
+    total = d_best + d_worst
+    scores[finite] = np.divide(d_worst, total, out=np.ones_like(total), where=total > 0)
+    return scores
+
+
+def asf_scores(points, weights, reference=None):
+    reference = np.zeros(points.shape[1]) if reference is None else reference
+    deviation = (points - reference) * weights
+    return deviation.max(axis=1) + ASF_AUGMENTATION * deviation.sum(axis=1)
+
+
+def rank_points(points, method='weighted_sum', weights=None, reference=None):
+    """
+    Scores and ranking order of a normalized minimization matrix.
+    Returns (scores, order): order lists row indices from best to worst.
+    """
+    points = np.asarray(points, dtype=float)
+    weights = normalized_weights(weights, points.shape[1])
+    if method == 'topsis':
+        scores = topsis_scores(points, weights)
+        key = -scores
+    elif method == 'asf':
+        scores = asf_scores(points, weights, reference)
+        key = scores
+    else:
+        scores = weighted_sum_scores(points, weights)
+        key = scores
+    key = np.where(np.isfinite(key), key, np.inf)
+    return scores, np.argsort(key, kind='stable')
+
+
+def _stacked_space(data_store):
+    """Normalized matrix of the visible fronts and row -> (front_id, index), cached per objective space."""
+    space = objective_space(data_store)
+    fronts = [f for f in (data_store or {}).get('fronts', []) if f.get('visible', True) and f.get('data')]
+    key = (space.key, tuple(f['id'] for f in fronts))
+
+    def compute():
+        if not fronts or not space.objectives or space.ideal is None:
+            return None
+        matrices = [space.normalized[f['id']] for f in fronts]
+        rows = [(f['id'], i) for f in fronts for i in range(len(f['data']))]
+        return np.vstack(matrices), rows
+
+    return space, _ranking_cache.get_or_compute(key, compute)
+
+
+def rank_solutions(data_store, method='weighted_sum', weights=None, reference_point=None, top_k=None):
+    """
+    Rank the visible solutions. `weights` and `reference_point` follow the dominance objectives;
+    the reference point is given in raw objective units (None entries -> ideal).
+    Returns [(front, solution, score)] from best to worst (limited to top_k).
+    """
+    space, stacked = _stacked_space(data_store)
+    if stacked is None:
+        return []
+    points, rows = stacked
+
+    reference = None
+    if method == 'asf' and reference_point is not None:
+        raw = np.array([[np.nan if v is None else float(v) for v in reference_point]], dtype=float)
+        reference = np.nan_to_num(normalize_raw(space, raw)[0], nan=0.0, posinf=0.0, neginf=0.0)
+
+    scores, order = rank_points(points, method, weights, reference)
+    if top_k:
+        order = order[:int(top_k)]
+    fronts = {f['id']: f for f in data_store.get('fronts', [])}
+    return [(fronts[rows[i][0]], fronts[rows[i][0]]['data'][rows[i][1]], float(scores[i])) for i in order]
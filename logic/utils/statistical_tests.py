@@ -0,0 +1,40 @@
+# logic/utils/statistical_tests.py
+"""
+Vectorized hypothesis tests used by the gene analytics: every function takes
+arrays (one entry per gene / test) and returns arrays, so thousands of genes are
+tested in a single numpy pass.
+"""
+
+import numpy as np
+from scipy.special import ndtr
+
+
+def benjamini_hochberg(p_values):
+    """Benjamini-Hochberg adjusted p-values (FDR q-values); NaN entries stay NaN."""
+    p_values = np.asarray(p_values, dtype=float)
+    q_values = np.full(p_values.shape, np.nan)
+    valid = np.flatnonzero(~np.isnan(p_values))
+    if valid.size == 0:
+        return q_values
+    order = valid[np.argsort(p_values[valid], kind='stable')]
+    ranked = p_values[order] * valid.size / np.arange(1, valid.size + 1)
+    # Mínimo acumulado desde el final: q-values monótonos
+    q_values[order] = np.minimum(np.minimum.accumulate(ranked[::-1])[::-1], 1.0)
+    return q_values
+
+
+def two_proportion_z_test(successes_a, n_a, successes_b, n_b):
+    """
+    Two-sided pooled two-proportion z-test of successes_a / n_a vs successes_b / n_b.
+    Returns (z, p_value); genes with no variance (pooled proportion 0 or 1) get z = 0, p = 1.
+    """
+    successes_a = np.asarray(successes_a, dtype=float)
+    successes_b = np.asarray(successes_b, dtype=float)
+    if n_a == 0 or n_b == 0:
+        return np.zeros(successes_a.shape), np.ones(successes_a.shape)
+    pooled = (successes_a + successes_b) / (n_a + n_b)
+    standard_error = np.sqrt(pooled * (1 - pooled) * (1 / n_a + 1 / n_b))
+    difference = successes_a / n_a - successes_b / n_b
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = np.where(standard_error > 0, difference / standard_error, 0.0)
+    return z, 2 * ndtr(-np.abs(z))
@@ -0,0 +1,201 @@
+# logic/utils/table_query.py
+"""
+DataTable `filter_query` / `sort_by` evaluated as vectorized array operations.
+
+Supported filter grammar (what the DataTable filter row emits, plus OR groups):
+    term  := {column} op value | {column} is blank|nil|num|str
+    op    := = != > < >= <= eq ne gt lt ge le contains datestartswith
+             (optional 's' / 'i' prefix: case-sensitive / case-insensitive)
+    query := term (&& term)* (|| term (&& term)*)*
+Values may be quoted ("a b", 'a b', `a b`). Numeric columns compare as floats;
+a numeric comparison against a non-numeric value matches nothing.
+
+Terms are evaluated on base arrays (one value per distinct item, e.g. one per
+solution or per gene) through a resolver, then gathered onto the table rows.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+RELATIONAL_OPERATORS = {'=': 'eq', '!=': 'ne', '>': 'gt', '<': 'lt', '>=': 'ge', '<=': 'le',
+                        'eq': 'eq', 'ne': 'ne', 'gt': 'gt', 'lt': 'lt', 'ge': 'ge', 'le': 'le'}
+TEXT_OPERATORS = ('contains', 'datestartswith')
+UNARY_OPERATORS = ('blank', 'nil', 'num', 'str')
+
+_TERM = re.compile(
+    r'^\s*\{(?P<col>[^}]+)\}\s+'
+    r'(?:is\s+(?P<unary>\w+)|(?P<op>[^\s"\'`]+)\s*(?P<value>"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|`[^`]*`|.*?))\s*$'
+)
+
+
+def _unquote(value):
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'", '`'):
+        return re.sub(r'\\(.)', r'\1', value[1:-1])
+    return value
+
+
+def parse_term(text):
+    """'{col} op value' -> {'column', 'op', 'value', 'case'} or None when not understood."""
+    match = _TERM.match(text)
+    if not match:
+        return None
+    column = match.group('col')
+    if match.group('unary'):
+        unary = match.group('unary').lower()
+        return {'column': column, 'op': f"is_{unary}", 'value': None, 'case': None} if unary in UNARY_OPERATORS else None
+
+    operator, case = match.group('op').lower(), None
+    if operator not in RELATIONAL_OPERATORS and operator not in TEXT_OPERATORS and operator[:1] in ('s', 'i'):
+        case, operator = ('insensitive' if operator[0] == 'i' else 'sensitive'), operator[1:]
+    operator = RELATIONAL_OPERATORS.get(operator, operator)
+    if operator not in RELATIONAL_OPERATORS.values() and operator not in TEXT_OPERATORS:
+        return None
+    return {'column': column, 'op': operator, 'value': _unquote(match.group('value') or ''), 'case': case}
+
+
+def parse_filter_query(query):
+    """OR-groups of AND-terms. Unparseable terms are dropped (as the DataTable does)."""
+    groups = []
+    for group in re.split(r'\s+\|\|\s+', query or ''):
+        terms = [parse_term(part) for part in re.split(r'\s+&&\s+', group) if part.strip()]
+        terms = [t for t in terms if t]
+        if terms:
+            groups.append(terms)
+    return groups
+
+
+def term_mask(values, numeric, term):
+    """Boolean mask of one term over a base array."""
+    values = np.asarray(values, dtype=object if not numeric else float)
+    operator, value = term['op'], term['value']
+    missing = pd.isna(values)
+
+    if operator == 'is_blank' or operator == 'is_nil':
+        return missing | (values == '') if not numeric else missing
+    if operator == 'is_num':
+        return ~missing if numeric else np.array([isinstance(v, (int, float)) and not isinstance(v, bool) for v in values], dtype=bool)
+    if operator == 'is_str':
+        return np.zeros(values.size, dtype=bool) if numeric else np.array([isinstance(v, str) for v in values], dtype=bool)
+
+    if operator in TEXT_OPERATORS:
+        text = pd.Series(values, dtype=object).astype(str)
+        pattern = value
+        if term['case'] == 'insensitive':
+            text, pattern = text.str.lower(), value.lower()
+        result = text.str.contains(pattern, regex=False) if operator == 'contains' else text.str.startswith(pattern)
+        return result.to_numpy() & ~missing
+
+    if numeric:
+        try:
+            target = float(value)
+        except ValueError:
+            return np.zeros(values.size, dtype=bool)
+        compared = values
+    else:
+        compared = pd.Series(values, dtype=object).astype(str).to_numpy()
+        target = value
+        if term['case'] == 'insensitive':
+            compared, target = np.char.lower(compared.astype(str)), value.lower()
+    with np.errstate(invalid='ignore'):
+        result = {
+            'eq': lambda: compared == target,
+            'ne': lambda: compared != target,
+            'gt': lambda: compared > target,
+            'lt': lambda: compared < target,
+            'ge': lambda: compared >= target,
+            'le': lambda: compared <= target,
+        }[operator]()
+    result = np.asarray(result, dtype=bool)
+    return result if operator == 'ne' else result & ~missing
+
+
+def query_mask(query, n_rows, resolve):
+    """
+    Row mask of a filter query. `resolve(column)` returns (base_values, row -> base index, is_numeric)
+    or None for unknown columns (their terms are ignored).
+    """
+    groups = parse_filter_query(query)
+    if not groups:
+        return np.ones(n_rows, dtype=bool)
+    base_masks = {}
+    mask = np.zeros(n_rows, dtype=bool)
+    for terms in groups:
+        group_mask = np.ones(n_rows, dtype=bool)
+        for term in terms:
+            resolved = resolve(term['column'])
+            if resolved is None:
+                continue
+            values, index, numeric = resolved
+            # El término se evalúa una vez sobre la base y se reparte a las filas
+            key = (term['column'], term['op'], term['value'], term['case'])
+            if key not in base_masks:
+                base_masks[key] = term_mask(values, numeric, term)
+            group_mask &= base_masks[key][index]
+        mask |= group_mask
+    return mask
+
+
+def sort_key(values, numeric, descending=False):
+    """(key, missing) arrays for np.lexsort: missing values go last in both directions."""
+    if numeric:
+        key = np.asarray(values, dtype=float)
+    else:
+        series = pd.Series(values, dtype=object)
+        codes, _ = pd.factorize(series.astype(str), sort=True)
+        key = codes.astype(float)
+        key[series.isna().to_numpy()] = np.nan
+    missing = np.isnan(key)
+    return np.where(missing, 0.0, -key if descending else key), missing
+
+
+def sort_order(sort_by, resolve):
+    """Stable row order for a DataTable `sort_by` list (first entry has priority), or None if nothing applies."""
+    keys = []
+    for entry in reversed(sort_by or []):
+        resolved = resolve(entry.get('column_id'))
+        if resolved is None:
+            continue
+        values, index, numeric = resolved
+        key, missing = sort_key(values, numeric, entry.get('direction') == 'desc')
+        keys.extend([key[index], missing[index]])
+    if not keys:
+        return None
+    return np.lexsort(keys)
+
+
+def frame_resolver(frame, rows=None):
+    """Resolver over the columns of a DataFrame (one base item per row), optionally restricted to `rows`."""
+    index = np.arange(len(frame)) if rows is None else np.asarray(rows)
+
+    def resolve(column):
+        if column not in frame.columns:
+            return None
+        return frame[column].to_numpy(), index, pd.api.types.is_numeric_dtype(frame[column])
+    return resolve
+
+
+def paging_restarted(triggered, table_id):
+    """True when a DataTable callback was fired by anything but paging/sorting of `table_id` (back to page 0)."""
+    return any(t['prop_id'].split('.')[0] != table_id or t['prop_id'].endswith('filter_query')
+               for t in triggered or [])
+
+
+def frame_page(result, columns, filter_query, sort_by, page_current, page_size, restart=False):
+    """
+    One page of a DataFrame shown in a server-side DataTable: filter, sort and paginate `result`.
+    Returns (records of `columns` with NaN -> None, page_count, page_current); `restart` goes back to
+    the first page and an out-of-range page is clamped to the last one.
+    """
+    rows = np.flatnonzero(query_mask(filter_query, len(result), frame_resolver(result)))
+    order = sort_order(sort_by, frame_resolver(result, rows))
+    if order is not None:
+        rows = rows[order]
+
+    page_size = int(page_size or 15)
+    page_count = max(1, -(-rows.size // page_size))
+    page_current = 0 if restart else min(int(page_current or 0), page_count - 1)
+    start = page_current * page_size
+    page = result.iloc[rows[start:start + page_size]][list(columns)]
+    return page.astype(object).where(page.notna(), None).to_dict('records'), page_count, page_current
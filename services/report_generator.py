@@ -21,7 +21,11 @@ from reportlab.lib.enums import TA_LEFT, TA_CENTER
 # Imports para Matplotlib Plots (asume que ya están instalados)
 import matplotlib.pyplot as plt
 import plotly.graph_objects as go
-from collections import Counter
+
+from logic.utils.front_reduction import REPORT_MAX_POINTS, thinned_fronts
+from logic.utils.gene_frequency import conserved_genes, gene_frequencies, top_genes
+from logic.utils.gene_stability import format_stability, stability_indices
+from logic.utils.quality_indicators import INDICATOR_COLUMNS, INDICATOR_LABELS, compute_front_indicators, format_indicator
 try:
     from matplotlib_venn import venn2, venn3
 except ImportError:
@@ -101,20 +105,13 @@ def create_pareto_plot_for_pdf(fronts_data, objectives):
     return buffer
 
 
-def create_genes_frequency_chart_for_pdf(all_solutions_list):
-    """Create genes frequency chart using Matplotlib, saved as PNG in a buffer."""
-    if not all_solutions_list:
-        return None
-
-    # Get gene frequency
-    all_genes_list = [gene for solution in all_solutions_list for gene in solution.get('selected_genes', [])]
-    gene_counts_dict = Counter(all_genes_list)
-    
-    if not gene_counts_dict:
+def create_genes_frequency_chart_for_pdf(frequency):
+    """Create genes frequency chart (from a GeneFrequency) using Matplotlib, saved as PNG in a buffer."""
+    if frequency.total_solutions == 0:
         return None
 
     # Get top 15 genes
-    top_genes_list = sorted(gene_counts_dict.items(), key=lambda x: x[1], reverse=True)[:15]
+    top_genes_list = top_genes(frequency, 15)
 
     if not top_genes_list:
         return None
@@ -128,7 +125,7 @@ def create_genes_frequency_chart_for_pdf(all_solutions_list):
 
     # Add value labels on bars
     for i, (gene, count) in enumerate(top_genes_list):
-        percentage = (count / len(all_solutions_list)) * 100 if len(all_solutions_list) > 0 else 0
+        percentage = (count / frequency.total_solutions) * 100
         y_pos = top_genes_series.index.get_loc(gene)
         ax.text(count + (top_genes_series.values.max() * 0.01), y_pos, f"{count} ({percentage:.1f}%)",
                 va='center', ha='left', fontsize=9)
@@ -151,9 +148,11 @@ def create_genes_frequency_chart_for_pdf(all_solutions_list):
 
 # --- 2. Generación del Reporte PDF ---
 
-def generate_pdf_report(data_store, enrichment_data, title="BioPareto Analysis Report"):
+def generate_pdf_report(data_store, enrichment_data, title="BioPareto Analysis Report",
+                        reference_solutions=None, reference_point=None):
     """
     Generates a full PDF report incorporating plots and data.
+    `reference_solutions` (uploaded reference front) and `reference_point` (HV) are optional.
     """
     print("[PDF] generate_pdf_report: start")
     buffer = BytesIO()
@@ -238,6 +237,27 @@ def generate_pdf_report(data_store, enrichment_data, title="BioPareto Analysis R
         story.append(table)
         story.append(Spacer(1, 0.3*inch))
 
+        # Indicadores de calidad por frente
+        try:
+            indicator_rows, reference_label = compute_front_indicators(data_store, reference_solutions, reference_point)
+        except Exception as e:
+            logger.error(f"Error computing quality indicators for PDF: {e}")
+            indicator_rows, reference_label = [], None
+
+        if indicator_rows:
+            indicator_content = [['Front', 'Size'] + [INDICATOR_LABELS[c] for c in INDICATOR_COLUMNS]]
+            for row in indicator_rows:
+                indicator_content.append([row['front'], row['size']] + [format_indicator(row[c]) for c in INDICATOR_COLUMNS])
+
+            table = Table(indicator_content, colWidths=[1.6*inch, 0.6*inch] + [0.8*inch] * len(INDICATOR_COLUMNS))
+            table.setStyle(table_style)
+            story.append(Paragraph("Front Quality Indicators:", styles['Heading2']))
+            story.append(table)
+            story.append(Paragraph(
+                f"Reference set: {reference_label}. Normalized objective space; HV higher is better, "
+                "the remaining indicators lower is better.", styles['Small']))
+            story.append(Spacer(1, 0.3*inch))
+
 
     # --- Sección 2: Pareto Plot ---
     story.append(Paragraph("2. Pareto Front Visualization", styles['Heading1']))
@@ -246,11 +266,19 @@ def generate_pdf_report(data_store, enrichment_data, title="BioPareto Analysis R
     
     if all_solutions and len(main_objectives) >= 2:
         try:
-            plot_buffer = create_pareto_plot_for_pdf(fronts, main_objectives)
+            # Frentes grandes: se grafican sus representantes por cajas epsilon
+            plot_fronts = thinned_fronts(data_store, REPORT_MAX_POINTS)
+            plot_buffer = create_pareto_plot_for_pdf(plot_fronts, main_objectives)
             if plot_buffer:
                 img = Image(plot_buffer, 6.5*inch, 4.5*inch)
                 story.append(Paragraph(f"Pareto Plot ({main_objectives[1]} vs {main_objectives[0]}):", styles['Heading2']))
                 story.append(img)
+                thinned = [f"{f['name']} ({len(f['data'])} of {len(o['data'])})"
+                           for f, o in zip(plot_fronts, fronts) if len(f['data']) < len(o['data'])]
+                if thinned:
+                    story.append(Paragraph(
+                        f"Fronts above {REPORT_MAX_POINTS} solutions are plotted through their epsilon-box "
+                        f"representatives: {', '.join(thinned)}.", styles['Small']))
                 story.append(Spacer(1, 0.3*inch))
             else:
                  story.append(Paragraph("Pareto plot could not be generated.", styles['Normal']))
@@ -268,7 +296,8 @@ def generate_pdf_report(data_store, enrichment_data, title="BioPareto Analysis R
     
     if all_solutions:
         try:
-            chart_buffer = create_genes_frequency_chart_for_pdf(all_solutions)
+            frequency = gene_frequencies(data_store)
+            chart_buffer = create_genes_frequency_chart_for_pdf(frequency)
             if chart_buffer:
                 img = Image(chart_buffer, 6.5*inch, 4*inch)
                 story.append(Paragraph("Top 15 Gene Frequency:", styles['Heading2']))
@@ -276,13 +305,11 @@ def generate_pdf_report(data_store, enrichment_data, title="BioPareto Analysis R
                 story.append(Spacer(1, 0.3*inch))
                 
                 # Table of 100% genes
-                gene_counts = Counter(g for sol in all_solutions for g in sol.get('selected_genes', []))
-                total_solutions = len(all_solutions)
-                genes_100_percent = [gene for gene, count in gene_counts.items() if count == total_solutions]
+                genes_100_percent = conserved_genes(frequency)
 
                 if genes_100_percent:
                     story.append(Paragraph("Genes present in 100% of solutions:", styles['Heading2']))
-                    story.append(Paragraph(', '.join(sorted(genes_100_percent)), styles['Normal']))
+                    story.append(Paragraph(', '.join(genes_100_percent), styles['Normal']))
                 else:
                     story.append(Paragraph("No genes found in 100% of solutions.", styles['Normal']))
                 
@@ -292,6 +319,27 @@ def generate_pdf_report(data_store, enrichment_data, title="BioPareto Analysis R
             logger.error(f"Error generating Gene Frequency chart for PDF: {e}")
             story.append(Paragraph("Error generating Gene Frequency chart.", styles['Normal']))
 
+        # Estabilidad de la selección de genes
+        try:
+            stability = stability_indices(data_store)
+        except Exception as e:
+            logger.error(f"Error computing selection stability for PDF: {e}")
+            stability = None
+
+        if stability:
+            stability_content = [['Front', 'Solutions', 'Mean Genes', 'Genes >= 50%', 'Kuncheva', 'Jaccard']]
+            for row in stability['rows']:
+                stability_content.append([row['front'], row['solutions'], f"{row['mean_size']:.1f}", row['core_genes'],
+                                          format_stability(row['kuncheva']), format_stability(row['jaccard'])])
+            table = Table(stability_content, colWidths=[2*inch, 0.9*inch, 1*inch, 1*inch, 0.9*inch, 0.9*inch])
+            table.setStyle(table_style)
+            story.append(Paragraph("Gene Selection Stability:", styles['Heading2']))
+            story.append(table)
+            story.append(Paragraph(
+                "Mean over all pairs of solutions. Kuncheva: 0 = overlap expected by chance, 1 = identical subsets; "
+                "Jaccard: mean intersection / union of the gene subsets.", styles['Small']))
+            story.append(Spacer(1, 0.3*inch))
+
     
     # --- Sección 4: Enrichment Analysis Results (if provided) ---
     if enrichment_data:
@@ -694,7 +742,7 @@ def generate_item_pdf(item, include_pareto=False, data_store=None):
 
 # --- 3. Generación de Reporte TXT ---
 
-def generate_txt_report(data_store, enrichment_data):
+def generate_txt_report(data_store, enrichment_data, reference_solutions=None, reference_point=None):
     """Generates a plain text report."""
     
     output = io.StringIO()
@@ -717,22 +765,53 @@ def generate_txt_report(data_store, enrichment_data):
         for front in fronts:
             output.write(f"  - Name: {front['name']} | Solutions: {len(front['data'])} | Objectives: {', '.join(front['objectives'])}\n")
         output.write("\n")
+
+        try:
+            indicator_rows, reference_label = compute_front_indicators(data_store, reference_solutions, reference_point)
+        except Exception as e:
+            logger.error(f"Error computing quality indicators for TXT: {e}")
+            indicator_rows, reference_label = [], None
+
+        if indicator_rows:
+            output.write("Front Quality Indicators:\n")
+            output.write(f"  Reference set: {reference_label}\n")
+            df_indicators = pd.DataFrame([
+                {'Front': r['front'], 'Size': r['size'], **{INDICATOR_LABELS[c]: format_indicator(r[c]) for c in INDICATOR_COLUMNS}}
+                for r in indicator_rows
+            ])
+            output.write(df_indicators.to_string(index=False))
+            output.write("\n  (normalized objective space; HV higher is better, the remaining indicators lower is better)\n\n")
         
     # Gene Frequency Summary
     all_solutions = [s for f in fronts for s in f['data'] if f.get('visible', True)]
     if all_solutions:
         output.write("2. GENE FREQUENCY SUMMARY\n")
         output.write("-" * 25 + "\n")
-        gene_counts = Counter(g for sol in all_solutions for g in sol.get('selected_genes', []))
-        total_solutions = len(all_solutions)
-        
-        genes_100_percent = [gene for gene, count in gene_counts.items() if count == total_solutions]
-        output.write(f"Total Unique Genes: {len(gene_counts)}\n")
+        frequency = gene_frequencies(data_store)
+        genes_100_percent = conserved_genes(frequency)
+        output.write(f"Total Unique Genes: {len(frequency.genes)}\n")
         output.write(f"Genes in 100% of solutions: {len(genes_100_percent)}\n")
         if genes_100_percent:
-            output.write(f"  > 100% Genes: {', '.join(sorted(genes_100_percent))}\n")
+            output.write(f"  > 100% Genes: {', '.join(genes_100_percent)}\n")
         output.write("\n")
 
+        try:
+            stability = stability_indices(data_store)
+        except Exception as e:
+            logger.error(f"Error computing selection stability for TXT: {e}")
+            stability = None
+
+        if stability:
+            output.write("Gene Selection Stability:\n")
+            df_stability = pd.DataFrame([
+                {'Front': r['front'], 'Solutions': r['solutions'], 'Mean Genes': f"{r['mean_size']:.1f}",
+                 'Genes >= 50%': r['core_genes'], 'Kuncheva': format_stability(r['kuncheva']),
+                 'Jaccard': format_stability(r['jaccard'])}
+                for r in stability['rows']
+            ])
+            output.write(df_stability.to_string(index=False))
+            output.write("\n  (mean over all pairs of solutions; Kuncheva 0 = chance overlap, 1 = identical subsets)\n\n")
+
 
     # Enrichment Results
     if enrichment_data:
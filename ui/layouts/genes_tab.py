@@ -1,7 +1,7 @@
 # ui/layouts/genes_tab.py
 
 import dash_bootstrap_components as dbc
-from dash import html, dcc 
+from dash import html, dcc, dash_table
 
 def create_genes_tab():
     """
@@ -175,6 +175,401 @@ def create_genes_tab():
             ], width=12),
         ]),
         
+        # --- SECCIÓN 3: SIMILITUD ENTRE SOLUCIONES (ESPACIO DE DECISIÓN) ---
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.Div([
+                            html.I(className="bi bi-grid-3x3-gap-fill me-2"),
+                            html.H5("Solution Similarity (Gene Sets)", className="d-inline-block m-0 fw-bold"),
+                        ], className="d-flex align-items-center text-primary")
+                    ], className="bg-white border-bottom position-relative"),
+
+                    dbc.CardBody([
+                        html.P("Pairwise similarity of the solutions' gene subsets. Solutions with close objectives may still "
+                               "select very different genes. Click a cell to look up the most similar solutions.",
+                               className="text-muted small mb-3"),
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("Front", className="small text-uppercase text-muted fw-bold"),
+                                dcc.Dropdown(id='similarity-front-select', value='all', clearable=False, className="shadow-sm")
+                            ], width=12, md=4, className="mb-2 mb-md-0"),
+                            dbc.Col([
+                                dbc.Label("Similarity", className="small text-uppercase text-muted fw-bold d-block"),
+                                dbc.RadioItems(
+                                    id='similarity-metric',
+                                    options=[
+                                        {'label': 'Jaccard', 'value': 'jaccard'},
+                                        {'label': 'Overlap', 'value': 'overlap'},
+                                    ],
+                                    value='jaccard',
+                                    inline=True,
+                                    className="small",
+                                    persistence=True,
+                                    persistence_type='session'
+                                )
+                            ], width=12, md=3, className="mb-2 mb-md-0"),
+                            dbc.Col([
+                                dbc.Label("Similar solutions to", className="small text-uppercase text-muted fw-bold"),
+                                dcc.Dropdown(id='similarity-query-select', placeholder="Type a solution id...", className="shadow-sm")
+                            ], width=12, md=3, className="mb-2 mb-md-0"),
+                            dbc.Col([
+                                dbc.Label("Top", className="small text-uppercase text-muted fw-bold"),
+                                dbc.Input(id='similarity-topk-input', type="number", min=1, max=100, step=1, value=10, size="sm")
+                            ], width=12, md=2),
+                        ], className="mb-3"),
+                        dcc.Loading(html.Div(id='similarity-heatmap-container'), type="circle", color="#0d6efd"),
+                        html.Div(id='similarity-results-container', className="mt-3")
+                    ])
+                ], className="shadow-sm border-0 mt-4")
+            ], width=12),
+        ]),
+
+        # --- SECCIÓN 4: MAPA 2D DE SOLUCIONES EN EL ESPACIO DE GENES ---
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.Div([
+                            html.I(className="bi bi-bullseye me-2"),
+                            html.H5("Gene-Space Map", className="d-inline-block m-0 fw-bold"),
+                        ], className="d-flex align-items-center text-primary")
+                    ], className="bg-white border-bottom position-relative"),
+
+                    dbc.CardBody([
+                        html.P("Principal components of the solution x gene matrix: every point is a solution, and solutions "
+                               "selecting similar genes lie close together. The map is precomputed when data is loaded.",
+                               className="text-muted small mb-3"),
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("Color by", className="small text-uppercase text-muted fw-bold"),
+                                dcc.Dropdown(id='gene-embedding-color-select', value='__front__', clearable=False,
+                                             className="shadow-sm", persistence=True, persistence_type='session')
+                            ], width=12, md=4),
+                        ], className="mb-3"),
+                        dcc.Interval(id='gene-embedding-interval', interval=1000, disabled=True),
+                        html.Div(id='gene-embedding-container')
+                    ])
+                ], className="shadow-sm border-0 mt-4")
+            ], width=12),
+        ]),
+
+        # --- SECCIÓN 5: FRECUENCIA DIFERENCIAL ENTRE FRENTES ---
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.Div([
+                            html.I(className="bi bi-arrow-left-right me-2"),
+                            html.H5("Front Comparison (Differential Gene Frequency)", className="d-inline-block m-0 fw-bold"),
+                        ], className="d-flex align-items-center text-primary")
+                    ], className="bg-white border-bottom position-relative"),
+
+                    dbc.CardBody([
+                        html.P("Which genes are selected more often in one front than in another? Every gene is tested "
+                               "with a two-proportion z-test; q-values are Benjamini-Hochberg corrected.",
+                               className="text-muted small mb-3"),
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("Front A", className="small text-uppercase text-muted fw-bold"),
+                                dcc.Dropdown(id='front-diff-a-select', clearable=False, className="shadow-sm")
+                            ], width=12, md=4, className="mb-2 mb-md-0"),
+                            dbc.Col([
+                                dbc.Label("Front B", className="small text-uppercase text-muted fw-bold"),
+                                dcc.Dropdown(id='front-diff-b-select', value='__rest__', clearable=False, className="shadow-sm")
+                            ], width=12, md=4),
+                        ], className="mb-3"),
+                        dcc.Loading(html.Div(id='front-diff-summary-container'), type="circle", color="#0d6efd"),
+                        dash_table.DataTable(
+                            id='front-diff-table',
+                            data=[],
+                            columns=[
+                                {'name': 'Gene/Probe', 'id': 'gene'},
+                                {'name': 'Count A', 'id': 'count_a', 'type': 'numeric'},
+                                {'name': 'Freq. A', 'id': 'freq_a', 'type': 'numeric', 'format': {'specifier': '.1%'}},
+                                {'name': 'Count B', 'id': 'count_b', 'type': 'numeric'},
+                                {'name': 'Freq. B', 'id': 'freq_b', 'type': 'numeric', 'format': {'specifier': '.1%'}},
+                                {'name': 'Difference', 'id': 'difference', 'type': 'numeric', 'format': {'specifier': '+.1%'}},
+                                {'name': 'log2 Ratio', 'id': 'log2_ratio', 'type': 'numeric', 'format': {'specifier': '.2f'}},
+                                {'name': 'P-value', 'id': 'p_value', 'type': 'numeric', 'format': {'specifier': '.2e'}},
+                                {'name': 'Q-value (FDR)', 'id': 'q_value', 'type': 'numeric', 'format': {'specifier': '.2e'}},
+                            ],
+                            sort_action='custom',
+                            sort_mode='multi',
+                            sort_by=[],
+                            filter_action='custom',
+                            filter_query='',
+                            page_action='custom',
+                            page_current=0,
+                            page_size=15,
+                            style_table={'overflowX': 'auto'},
+                            style_header={'backgroundColor': '#f8f9fa', 'color': '#333', 'fontWeight': 'bold',
+                                          'borderBottom': '2px solid #dee2e6'},
+                            style_cell={'textAlign': 'left', 'padding': '8px', 'fontFamily': 'sans-serif', 'fontSize': '0.9rem'},
+                            style_data_conditional=[
+                                {'if': {'row_index': 'odd'}, 'backgroundColor': '#f8f9fa'},
+                                {'if': {'filter_query': '{q_value} < 0.05 && {difference} > 0'}, 'color': '#0d6efd', 'fontWeight': 'bold'},
+                                {'if': {'filter_query': '{q_value} < 0.05 && {difference} < 0'}, 'color': '#dc3545', 'fontWeight': 'bold'},
+                            ],
+                        )
+                    ])
+                ], className="shadow-sm border-0 mt-4")
+            ], width=12),
+        ]),
+
+        # --- SECCIÓN 6: CO-OCURRENCIA DE GENES ---
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.Div([
+                            html.I(className="bi bi-share-fill me-2"),
+                            html.H5("Gene Co-occurrence", className="d-inline-block m-0 fw-bold"),
+                        ], className="d-flex align-items-center text-primary")
+                    ], className="bg-white border-bottom position-relative"),
+
+                    dbc.CardBody([
+                        html.P("Genes that tend to be selected together across the visible solutions. Count ranks frequent "
+                               "pairs; lift and PMI rank pairs that co-occur more often than their individual frequencies predict.",
+                               className="text-muted small mb-3"),
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("Rank pairs by", className="small text-uppercase text-muted fw-bold d-block"),
+                                dbc.RadioItems(
+                                    id='cooccurrence-metric',
+                                    options=[
+                                        {'label': 'Count', 'value': 'count'},
+                                        {'label': 'Lift', 'value': 'lift'},
+                                        {'label': 'PMI', 'value': 'pmi'},
+                                    ],
+                                    value='count',
+                                    inline=True,
+                                    className="small",
+                                    persistence=True,
+                                    persistence_type='session'
+                                )
+                            ], width=12, md=4, className="mb-2 mb-md-0"),
+                            dbc.Col([
+                                dbc.Label("Top pairs", className="small text-uppercase text-muted fw-bold"),
+                                dbc.Input(id='cooccurrence-topk-input', type="number", min=1, max=200, step=1, value=30, size="sm")
+                            ], width=6, md=2),
+                            dbc.Col([
+                                dbc.Label("Min. count", className="small text-uppercase text-muted fw-bold"),
+                                dbc.Input(id='cooccurrence-min-count-input', type="number", min=1, step=1, value=2, size="sm")
+                            ], width=6, md=2),
+                        ], className="mb-3"),
+                        dcc.Loading(html.Div(id='cooccurrence-container'), type="circle", color="#0d6efd")
+                    ])
+                ], className="shadow-sm border-0 mt-4")
+            ], width=12),
+        ]),
+
+        # --- SECCIÓN 7: ASOCIACIÓN GEN-OBJETIVO ---
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.Div([
+                            html.I(className="bi bi-activity me-2"),
+                            html.H5("Gene-Objective Association", className="d-inline-block m-0 fw-bold"),
+                        ], className="d-flex align-items-center text-primary")
+                    ], className="bg-white border-bottom position-relative"),
+
+                    dbc.CardBody([
+                        html.P("Does selecting a gene go with better or worse objective values? For every gene, the "
+                               "solutions containing it are compared with the rest; q-values are Benjamini-Hochberg corrected.",
+                               className="text-muted small mb-3"),
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("Objective", className="small text-uppercase text-muted fw-bold"),
+                                dcc.Dropdown(id='gene-association-objective-select', clearable=False, className="shadow-sm")
+                            ], width=12, md=4, className="mb-2 mb-md-0"),
+                            dbc.Col([
+                                dbc.Label("Test", className="small text-uppercase text-muted fw-bold d-block"),
+                                dbc.RadioItems(
+                                    id='gene-association-test',
+                                    options=[
+                                        {'label': 'Mann-Whitney U', 'value': 'mannwhitney'},
+                                        {'label': 'Welch t-test', 'value': 'welch'},
+                                    ],
+                                    value='mannwhitney',
+                                    inline=True,
+                                    className="small",
+                                    persistence=True,
+                                    persistence_type='session'
+                                )
+                            ], width=12, md=5),
+                        ], className="mb-3"),
+                        dcc.Loading(html.Div(id='gene-association-summary-container'), type="circle", color="#0d6efd"),
+                        dash_table.DataTable(
+                            id='gene-association-table',
+                            data=[],
+                            columns=[
+                                {'name': 'Gene/Probe', 'id': 'gene'},
+                                {'name': 'With Gene', 'id': 'n_with', 'type': 'numeric'},
+                                {'name': 'Without', 'id': 'n_without', 'type': 'numeric'},
+                                {'name': 'Mean With', 'id': 'mean_with', 'type': 'numeric', 'format': {'specifier': '.4g'}},
+                                {'name': 'Mean Without', 'id': 'mean_without', 'type': 'numeric', 'format': {'specifier': '.4g'}},
+                                {'name': 'Effect Size', 'id': 'effect', 'type': 'numeric', 'format': {'specifier': '.3f'}},
+                                {'name': 'P-value', 'id': 'p_value', 'type': 'numeric', 'format': {'specifier': '.2e'}},
+                                {'name': 'Q-value (FDR)', 'id': 'q_value', 'type': 'numeric', 'format': {'specifier': '.2e'}},
+                                {'name': 'Better With Gene', 'id': 'better_with_gene'},
+                            ],
+                            sort_action='custom',
+                            sort_mode='multi',
+                            sort_by=[],
+                            filter_action='custom',
+                            filter_query='',
+                            page_action='custom',
+                            page_current=0,
+                            page_size=15,
+                            style_table={'overflowX': 'auto'},
+                            style_header={'backgroundColor': '#f8f9fa', 'color': '#333', 'fontWeight': 'bold',
+                                          'borderBottom': '2px solid #dee2e6'},
+                            style_cell={'textAlign': 'left', 'padding': '8px', 'fontFamily': 'sans-serif', 'fontSize': '0.9rem'},
+                            style_data_conditional=[
+                                {'if': {'row_index': 'odd'}, 'backgroundColor': '#f8f9fa'},
+                                {'if': {'filter_query': '{q_value} < 0.05 && {better_with_gene} = yes'}, 'color': '#198754', 'fontWeight': 'bold'},
+                                {'if': {'filter_query': '{q_value} < 0.05 && {better_with_gene} = no'}, 'color': '#dc3545', 'fontWeight': 'bold'},
+                            ],
+                        )
+                    ])
+                ], className="shadow-sm border-0 mt-4")
+            ], width=12),
+        ]),
+
+        # --- SECCIÓN 8: ESTABILIDAD DE LA SELECCIÓN DE GENES ---
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.Div([
+                            html.I(className="bi bi-shield-check me-2"),
+                            html.H5("Selection Stability", className="d-inline-block m-0 fw-bold"),
+                        ], className="d-flex align-items-center text-primary")
+                    ], className="bg-white border-bottom position-relative"),
+
+                    dbc.CardBody([
+                        html.P("How consistently do the solutions of a front select the same genes? Stability indices are "
+                               "averaged over all pairs of solutions, per front and for all visible fronts pooled.",
+                               className="text-muted small mb-3"),
+                        dcc.Loading(html.Div(id='gene-stability-container'), type="circle", color="#0d6efd")
+                    ])
+                ], className="shadow-sm border-0 mt-4")
+            ], width=12),
+        ]),
+
+        # --- SECCIÓN 9: SIGNIFICANCIA DE LA FRECUENCIA (TEST DE PERMUTACIÓN) ---
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.Div([
+                            html.I(className="bi bi-shuffle me-2"),
+                            html.H5("Frequency Significance", className="d-inline-block m-0 fw-bold"),
+                        ], className="d-flex align-items-center text-primary")
+                    ], className="bg-white border-bottom position-relative"),
+
+                    dbc.CardBody([
+                        html.P("Is a gene selected more often than chance? Gene membership is shuffled while every solution "
+                               "keeps its number of genes, and each gene's frequency is compared with the permuted ones.",
+                               className="text-muted small mb-3"),
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("Permutations", className="small text-uppercase text-muted fw-bold"),
+                                dbc.Input(id='gene-permutation-count-input', type='number', min=100, max=20000,
+                                          step=100, value=1000, className="shadow-sm",
+                                          persistence=True, persistence_type='session')
+                            ], width=12, md=3, className="mb-2 mb-md-0"),
+                            dbc.Col([
+                                dbc.Button([html.I(className="bi bi-play-fill me-1"), "Run Test"],
+                                           id='gene-permutation-run-btn', color="primary", size="sm", className="shadow-sm")
+                            ], width=12, md=3, className="d-flex align-items-end"),
+                        ], className="mb-3"),
+                        dcc.Interval(id='gene-permutation-interval', interval=1000, disabled=True),
+                        dcc.Store(id='gene-permutation-state-store'),
+                        html.Div(id='gene-permutation-container'),
+                        html.Div(id='gene-permutation-progress'),
+                        dash_table.DataTable(
+                            id='gene-permutation-table',
+                            data=[],
+                            columns=[
+                                {'name': 'Gene/Probe', 'id': 'gene'},
+                                {'name': 'Solutions', 'id': 'count', 'type': 'numeric'},
+                                {'name': 'Frequency', 'id': 'frequency', 'type': 'numeric', 'format': {'specifier': '.1%'}},
+                                {'name': 'Expected', 'id': 'expected', 'type': 'numeric', 'format': {'specifier': '.1%'}},
+                                {'name': 'Fold', 'id': 'fold', 'type': 'numeric', 'format': {'specifier': '.2f'}},
+                                {'name': 'P-value', 'id': 'p_value', 'type': 'numeric', 'format': {'specifier': '.2e'}},
+                                {'name': 'Q-value (FDR)', 'id': 'q_value', 'type': 'numeric', 'format': {'specifier': '.2e'}},
+                            ],
+                            sort_action='custom',
+                            sort_mode='multi',
+                            sort_by=[],
+                            filter_action='custom',
+                            filter_query='',
+                            page_action='custom',
+                            page_current=0,
+                            page_size=15,
+                            style_table={'overflowX': 'auto'},
+                            style_header={'backgroundColor': '#f8f9fa', 'color': '#333', 'fontWeight': 'bold',
+                                          'borderBottom': '2px solid #dee2e6'},
+                            style_cell={'textAlign': 'left', 'padding': '8px', 'fontFamily': 'sans-serif', 'fontSize': '0.9rem'},
+                            style_data_conditional=[
+                                {'if': {'row_index': 'odd'}, 'backgroundColor': '#f8f9fa'},
+                                {'if': {'filter_query': '{q_value} < 0.05'}, 'color': '#198754', 'fontWeight': 'bold'},
+                            ],
+                        )
+                    ])
+                ], className="shadow-sm border-0 mt-4")
+            ], width=12),
+        ]),
+
+        # --- SECCIÓN 10: FRECUENCIA SEGÚN UN CORTE DEL OBJETIVO ---
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.Div([
+                            html.I(className="bi bi-sliders me-2"),
+                            html.H5("Frequency vs Objective Cutoff", className="d-inline-block m-0 fw-bold"),
+                        ], className="d-flex align-items-center text-primary")
+                    ], className="bg-white border-bottom position-relative"),
+
+                    dbc.CardBody([
+                        html.P("How does a gene's frequency change when only the solutions below (or above) an objective "
+                               "cutoff are kept? Every point is the frequency among the solutions up to that cutoff.",
+                               className="text-muted small mb-3"),
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("Objective", className="small text-uppercase text-muted fw-bold"),
+                                dcc.Dropdown(id='gene-cutoff-objective-select', clearable=False, className="shadow-sm")
+                            ], width=12, md=3, className="mb-2 mb-md-0"),
+                            dbc.Col([
+                                dbc.Label("Keep Solutions", className="small text-uppercase text-muted fw-bold d-block"),
+                                dbc.RadioItems(
+                                    id='gene-cutoff-direction',
+                                    options=[
+                                        {'label': 'Below cutoff (≤)', 'value': 'below'},
+                                        {'label': 'Above cutoff (≥)', 'value': 'above'},
+                                    ],
+                                    value='below',
+                                    inline=True,
+                                    className="small"
+                                )
+                            ], width=12, md=3, className="mb-2 mb-md-0"),
+                            dbc.Col([
+                                dbc.Label("Genes", className="small text-uppercase text-muted fw-bold"),
+                                dcc.Dropdown(id='gene-cutoff-genes-select', multi=True, placeholder="Most frequent genes",
+                                             className="shadow-sm")
+                            ], width=12, md=6),
+                        ], className="mb-3"),
+                        dcc.Loading(html.Div(id='gene-cutoff-container'), type="circle", color="#0d6efd")
+                    ])
+                ], className="shadow-sm border-0 mt-4")
+            ], width=12),
+        ]),
+
         # --- STORES Y MODALES ---
         dcc.Store(id='genes-analysis-internal-store'),
         dcc.Store(id='genes-graph-temp-store'),
@@ -45,6 +45,11 @@ def create_pareto_tab():
                     html.Span(": Create a new 'Best of' front merging selected solutions from multiple files.", className="small text-muted")
                 ], className="mb-2"),
                 
+                html.Div([
+                    html.Code("Merge All", className="text-success fw-bold"),
+                    html.Span(": Create a new front with the non-dominated solutions of ALL visible fronts (no selection needed).", className="small text-muted")
+                ], className="mb-2"),
+
                 html.Div([
                     html.Code("Add All", className="text-primary fw-bold"),
                     html.Span(": Send ALL currently selected solutions to the Interest Panel for further analysis.", className="small text-muted")
@@ -58,6 +63,17 @@ def create_pareto_tab():
                 html.Div([
                     html.Code("Clear", className="text-danger fw-bold"),
                     html.Span(": Deselect all points in the graph.", className="small text-muted")
+                ], className="mb-2"),
+
+                html.Div([
+                    html.Code("Select Suggested", className="text-warning fw-bold"),
+                    html.Span(": Add the knee and/or extreme points of each visible front to the selection.", className="small text-muted")
+                ], className="mb-2"),
+
+                html.Div([
+                    html.Code("Attainment Surfaces", className="text-dark fw-bold"),
+                    html.Span(": Treat each visible front as one run and draw the k%-attainment surfaces (best, median, worst "
+                              "or a custom level) on the current axes.", className="small text-muted")
                 ], className="mb-0")
             ], style={'maxWidth': '350px'})
         ],
@@ -162,7 +178,22 @@ def create_pareto_tab():
                                                     disabled=True,
                                                     title="Create a new Pareto front from selected solutions"
                                                     )
-                                                ], width=6),
+                                                ], width=4),
+
+                                                # Botón Fusionar todos los frentes
+                                                dbc.Col([
+                                                    dbc.Button([
+                                                        html.I(className="bi bi-intersect me-2"),
+                                                        "Merge All"
+                                                    ],
+                                                    id="merge-all-fronts-btn",
+                                                    color="success",
+                                                    outline=True,
+                                                    size="sm",
+                                                    className="w-100 d-flex align-items-center justify-content-center shadow-sm fw-bold",
+                                                    title="Create a new Pareto front with the non-dominated solutions of all visible fronts"
+                                                    )
+                                                ], width=4),
                                                 
                                                 # Botón Añadir Todos
                                                 dbc.Col([
@@ -177,7 +208,7 @@ def create_pareto_tab():
                                                     disabled=True,
                                                     title="Add all selected solutions to Interest Panel"
                                                     )
-                                                ], width=6),
+                                                ], width=4),
                                             ], className="g-2")
                                         ], width=12, lg=7, className="mb-3 mb-lg-0 border-end-lg pe-lg-3"), 
 
@@ -210,6 +241,81 @@ def create_pareto_tab():
                                                 ),
                                             ], className="d-flex w-100 shadow-sm")
                                         ], width=12, lg=5)
+                                    ], className="align-items-end"),
+
+                                    # GRUPO 3: Soluciones representativas (knee / extremos)
+                                    html.Hr(className="my-3"),
+                                    dbc.Row([
+                                        dbc.Col([
+                                            dbc.Label("Representative Solutions", className="small text-muted fw-bold text-uppercase mb-1"),
+                                            dbc.Checklist(
+                                                id='decision-highlight-options',
+                                                options=[
+                                                    {'label': 'Knee points', 'value': 'knees'},
+                                                    {'label': 'Extreme points', 'value': 'extremes'},
+                                                ],
+                                                value=[],
+                                                inline=True,
+                                                switch=True,
+                                                className="small"
+                                            ),
+                                        ], width=12, lg=4, className="mb-2 mb-lg-0"),
+                                        dbc.Col([
+                                            dbc.InputGroup([
+                                                dbc.InputGroupText("Knee method", className="small"),
+                                                dbc.Select(
+                                                    id='knee-method-select',
+                                                    options=[
+                                                        {'label': 'Convex bulge', 'value': 'bulge'},
+                                                        {'label': 'Marginal utility', 'value': 'utility'},
+                                                    ],
+                                                    value='bulge'
+                                                ),
+                                                dbc.InputGroupText("Knees", className="small"),
+                                                dbc.Input(id='knee-count-input', type='number', min=1, max=20, step=1, value=1, style={'maxWidth': '70px'}),
+                                            ], size="sm"),
+                                        ], width=12, lg=5, className="mb-2 mb-lg-0"),
+                                        dbc.Col([
+                                            dbc.Button([
+                                                html.I(className="bi bi-stars me-2"),
+                                                "Select Suggested"
+                                            ],
+                                            id="select-suggested-btn",
+                                            color="warning",
+                                            outline=True,
+                                            size="sm",
+                                            className="w-100 shadow-sm fw-bold",
+                                            title="Add the highlighted knee/extreme points of the visible fronts to the selection"
+                                            )
+                                        ], width=12, lg=3),
+                                    ], className="align-items-end"),
+
+                                    # GRUPO 4: Superficies de alcance (EAF) entre ejecuciones
+                                    html.Hr(className="my-3"),
+                                    dbc.Row([
+                                        dbc.Col([
+                                            dbc.Label("Attainment Surfaces (runs = visible fronts)", className="small text-muted fw-bold text-uppercase mb-1"),
+                                            dbc.Checklist(
+                                                id='eaf-surface-options',
+                                                options=[
+                                                    {'label': 'Best', 'value': 'best'},
+                                                    {'label': 'Median', 'value': 'median'},
+                                                    {'label': 'Worst', 'value': 'worst'},
+                                                ],
+                                                value=[],
+                                                inline=True,
+                                                switch=True,
+                                                className="small"
+                                            ),
+                                        ], width=12, lg=6, className="mb-2 mb-lg-0"),
+                                        dbc.Col([
+                                            dbc.InputGroup([
+                                                dbc.InputGroupText("Custom level", className="small"),
+                                                dbc.Input(id='eaf-custom-level-input', type='number', min=0, max=100, step=5,
+                                                          placeholder="k %", debounce=True),
+                                                dbc.InputGroupText("%", className="small"),
+                                            ], size="sm"),
+                                        ], width=12, lg=6),
                                     ], className="align-items-end")
                                 ], className="bg-light p-3 rounded border mb-4"),
                                 
@@ -229,7 +335,227 @@ def create_pareto_tab():
                 ], className="mb-3"),
             ], width=12),
         ]),
-        
+
+        # --- INDICADORES DE CALIDAD DE LOS FRENTES ---
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader(
+                        html.Div([
+                            html.I(className="bi bi-speedometer2 me-2"),
+                            html.H5("Front Quality Indicators", className="d-inline-block m-0 fw-bold"),
+                        ], className="d-flex align-items-center text-primary"),
+                        className="bg-white border-bottom"
+                    ),
+                    dbc.CardBody([
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("Reference Set", className="small text-muted fw-bold text-uppercase mb-1"),
+                                dbc.RadioItems(
+                                    id='indicator-reference-source',
+                                    options=[
+                                        {'label': 'Merged non-dominated set of all fronts', 'value': 'merged'},
+                                        {'label': 'Uploaded reference front', 'value': 'uploaded'},
+                                    ],
+                                    value='merged',
+                                    inline=True,
+                                    persistence=True,
+                                    persistence_type='session',
+                                    className="small"
+                                ),
+                            ], width=12, lg=7),
+                            dbc.Col([
+                                dcc.Upload(
+                                    id='reference-front-upload',
+                                    children=html.Div([
+                                        html.I(className="bi bi-cloud-upload me-2"),
+                                        "Drop or select a reference front (JSON)"
+                                    ], id='reference-front-upload-label', className="small"),
+                                    style={
+                                        'borderWidth': '1px', 'borderStyle': 'dashed', 'borderRadius': '5px',
+                                        'textAlign': 'center', 'padding': '6px', 'cursor': 'pointer'
+                                    },
+                                    multiple=False
+                                ),
+                            ], width=12, lg=5),
+                        ], className="align-items-end mb-3"),
+                        dcc.Loading(html.Div(id='front-indicators-container'), type="default")
+                    ])
+                ], className="shadow-sm border-0")
+            ], width=12)
+        ], className="mb-3"),
+
+        # --- COMPARACIÓN ENTRE FRENTES (C-METRIC) ---
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader(
+                        dbc.Row([
+                            dbc.Col(
+                                html.Div([
+                                    html.I(className="bi bi-grid-3x3-gap-fill me-2"),
+                                    html.H5("Front Comparison", className="d-inline-block m-0 fw-bold"),
+                                ], className="d-flex align-items-center text-primary"),
+                                width="auto"
+                            ),
+                            dbc.Col(
+                                dbc.RadioItems(
+                                    id='front-comparison-metric',
+                                    options=[
+                                        {'label': 'Coverage C(A,B)', 'value': 'coverage'},
+                                        {'label': 'Dominated solutions', 'value': 'dominated'},
+                                    ],
+                                    value='coverage',
+                                    inline=True,
+                                    className="small"
+                                ),
+                                width="auto", className="ms-auto"
+                            )
+                        ], align="center", justify="between"),
+                        className="bg-white border-bottom"
+                    ),
+                    dbc.CardBody([
+                        dcc.Loading(html.Div(id='front-comparison-container'), type="default")
+                    ])
+                ], className="shadow-sm border-0")
+            ], width=12)
+        ], className="mb-3"),
+
+        # --- RANKING MULTI-CRITERIO ---
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader(
+                        html.Div([
+                            html.I(className="bi bi-sort-numeric-down me-2"),
+                            html.H5("Multi-Criteria Ranking", className="d-inline-block m-0 fw-bold"),
+                        ], className="d-flex align-items-center text-primary"),
+                        className="bg-white border-bottom"
+                    ),
+                    dbc.CardBody([
+                        html.P("Score every visible solution with user weights (and a reference point for ASF). "
+                               "Weights apply to the normalized objectives, so their units and directions do not matter.",
+                               className="text-muted small mb-3"),
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("Method", className="small text-muted fw-bold text-uppercase mb-1"),
+                                dbc.Select(
+                                    id='ranking-method-select',
+                                    options=[
+                                        {'label': 'Weighted sum', 'value': 'weighted_sum'},
+                                        {'label': 'TOPSIS', 'value': 'topsis'},
+                                        {'label': 'Achievement scalarizing (ASF)', 'value': 'asf'},
+                                    ],
+                                    value='weighted_sum',
+                                    size="sm",
+                                    persistence=True,
+                                    persistence_type='session'
+                                ),
+                            ], width=12, lg=4, className="mb-2 mb-lg-0"),
+                            dbc.Col([
+                                dbc.Label("Top", className="small text-muted fw-bold text-uppercase mb-1"),
+                                dbc.Input(id='ranking-topk-input', type='number', min=1, max=500, step=1, value=10, size="sm"),
+                            ], width=6, lg=2),
+                            dbc.Col([
+                                dbc.Button([
+                                    html.I(className="bi bi-pin-angle-fill me-2"),
+                                    "Add Top to Interest Panel"
+                                ],
+                                id="ranking-to-interest-btn",
+                                color="success",
+                                outline=True,
+                                size="sm",
+                                className="w-100 shadow-sm fw-bold"
+                                )
+                            ], width=6, lg={'size': 4, 'offset': 2}),
+                        ], className="align-items-end mb-3"),
+                        html.Div(id='ranking-controls-container', className="mb-3"),
+                        dcc.Loading(html.Div(id='ranking-results-container'), type="default")
+                    ])
+                ], className="shadow-sm border-0")
+            ], width=12)
+        ], className="mb-3"),
+
+        # --- CLUSTERS EN EL ESPACIO DE OBJETIVOS ---
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader(
+                        html.Div([
+                            html.I(className="bi bi-diagram-3-fill me-2"),
+                            html.H5("Objective-Space Clusters", className="d-inline-block m-0 fw-bold"),
+                        ], className="d-flex align-items-center text-primary"),
+                        className="bg-white border-bottom"
+                    ),
+                    dbc.CardBody([
+                        html.P("Group the visible solutions by their position in the normalized objective space "
+                               "and compare the genes that dominate each region of the front.",
+                               className="text-muted small mb-3"),
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("Method", className="small text-muted fw-bold text-uppercase mb-1"),
+                                dbc.Select(
+                                    id='cluster-method-select',
+                                    options=[
+                                        {'label': 'Mini-batch k-means (k clusters)', 'value': 'kmeans'},
+                                        {'label': 'Grid (k cells per objective)', 'value': 'grid'},
+                                    ],
+                                    value='kmeans',
+                                    size="sm",
+                                    persistence=True,
+                                    persistence_type='session'
+                                ),
+                            ], width=8, lg=4),
+                            dbc.Col([
+                                dbc.Label("k", className="small text-muted fw-bold text-uppercase mb-1"),
+                                dbc.Input(id='cluster-k-input', type='number', min=1, max=50, step=1, value=6,
+                                          size="sm", debounce=True),
+                            ], width=4, lg=2),
+                        ], className="align-items-end mb-3"),
+                        dcc.Loading(html.Div(id='cluster-view-container'), type="default")
+                    ])
+                ], className="shadow-sm border-0")
+            ], width=12)
+        ], className="mb-3"),
+
+        # --- EVOLUCIÓN DE LOS FRENTES (PLAYBACK) ---
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader(
+                        dbc.Row([
+                            dbc.Col(
+                                html.Div([
+                                    html.I(className="bi bi-play-circle-fill me-2"),
+                                    html.H5("Front Evolution Playback", className="d-inline-block m-0 fw-bold"),
+                                ], className="d-flex align-items-center text-primary"),
+                                width="auto"
+                            ),
+                            dbc.Col(
+                                dbc.RadioItems(
+                                    id='front-playback-order',
+                                    options=[
+                                        {'label': 'Upload order', 'value': 'upload'},
+                                        {'label': 'Name order', 'value': 'name'},
+                                    ],
+                                    value='upload',
+                                    inline=True,
+                                    persistence=True,
+                                    persistence_type='session',
+                                    className="small"
+                                ),
+                                width="auto", className="ms-auto"
+                            )
+                        ], align="center", justify="between"),
+                        className="bg-white border-bottom"
+                    ),
+                    dbc.CardBody([
+                        dcc.Loading(html.Div(id='front-playback-container'), type="default")
+                    ])
+                ], className="shadow-sm border-0")
+            ], width=12)
+        ], className="mb-3"),
+
         # Store y Modal para puntos múltiples
         dcc.Store(id='multi-solution-modal-store'),
         
@@ -134,12 +134,108 @@ def create_upload_tab():
                                 html.I(className="bi bi-list-check me-2 text-primary"),
                                 html.H6("Loaded Fronts", className="fw-bold d-inline-block m-0")
                             ], className="d-flex align-items-center mb-3"),
+
+                            # --- Punto de referencia del Hypervolume ---
+                            dbc.InputGroup([
+                                dbc.InputGroupText("HV Reference Point", className="small"),
+                                dbc.Input(
+                                    id='hv-reference-input',
+                                    placeholder="Auto (normalized nadir + 10%) - or comma-separated values, one per objective",
+                                    debounce=True,
+                                    type="text",
+                                    persistence=True,
+                                    persistence_type='session'
+                                )
+                            ], size="sm", className="mb-3"),
                             
                             html.Div(id='fronts-list', children=[
                                 dbc.Alert("No fronts loaded yet. Upload files to see them here.", color="light", className="text-center small text-muted border-0")
                             ], style={'maxHeight': '400px', 'overflowY': 'auto', 'paddingRight': '5px'}) # Scroll interno si hay muchos
                         ]),
 
+                        # --- Dirección y límites de los objetivos ---
+                        html.Div([
+                            html.Div([
+                                html.Div([
+                                    html.I(className="bi bi-arrow-down-up me-2 text-primary"),
+                                    html.H6("Objective Settings", className="fw-bold d-inline-block m-0")
+                                ], className="d-flex align-items-center"),
+                                dbc.Button(
+                                    [html.I(className="bi bi-arrow-counterclockwise me-1"), "Reset to inferred"],
+                                    id="objective-settings-reset-btn",
+                                    color="secondary",
+                                    outline=True,
+                                    size="sm",
+                                    title="Discard user-set directions and bounds"
+                                )
+                            ], className="d-flex justify-content-between align-items-center mb-2"),
+                            html.Small(
+                                "Direction (minimize/maximize) drives dominance, ranks and every indicator. "
+                                "Optional bounds fix the normalization range (leave empty to use the data range).",
+                                className="text-muted d-block mb-2"
+                            ),
+                            html.Div(id='objective-settings-container')
+                        ], className="mt-4"),
+
+                        # --- Reducción de frentes (representantes) ---
+                        html.Div([
+                            html.Div([
+                                html.I(className="bi bi-funnel-fill me-2 text-primary"),
+                                html.H6("Front Reduction", className="fw-bold d-inline-block m-0")
+                            ], className="d-flex align-items-center mb-2"),
+                            html.Small(
+                                "Replace the visible fronts by representative solutions. Each representative keeps the ids "
+                                "of the solutions it stands for. Use 'Restore' in the Pareto tab to undo.",
+                                className="text-muted d-block mb-2"
+                            ),
+                            dbc.Row([
+                                dbc.Col(dbc.InputGroup([
+                                    dbc.InputGroupText("Near-duplicate Jaccard ≥", className="small"),
+                                    dbc.Input(
+                                        id='duplicate-threshold-input',
+                                        type="number", min=0.5, max=1, step=0.05, value=0.9,
+                                        persistence=True,
+                                        persistence_type='session'
+                                    )
+                                ], size="sm"), width=12, md=6, className="mb-2 mb-md-0"),
+                                dbc.Col(dbc.Button(
+                                    [html.I(className="bi bi-search me-1"), "Detect"],
+                                    id="detect-duplicates-btn", color="secondary", outline=True, size="sm", className="w-100"
+                                ), width=6, md=3),
+                                dbc.Col(dbc.Button(
+                                    [html.I(className="bi bi-intersect me-1"), "Collapse"],
+                                    id="collapse-duplicates-btn", color="primary", outline=True, size="sm", className="w-100",
+                                    title="Keep one solution (best Pareto rank) per near-duplicate gene subset"
+                                ), width=6, md=3),
+                            ], className="g-2 align-items-center"),
+                            dbc.Row([
+                                dbc.Col(dbc.InputGroup([
+                                    dbc.InputGroupText("Thin to", className="small"),
+                                    dbc.Input(
+                                        id='thinning-target-input',
+                                        type="number", min=2, step=1, value=500,
+                                        persistence=True,
+                                        persistence_type='session'
+                                    ),
+                                    dbc.InputGroupText("or ε", className="small"),
+                                    dbc.Input(
+                                        id='thinning-epsilon-input',
+                                        type="number", min=0.0001, max=1, step=0.005,
+                                        placeholder="auto",
+                                        persistence=True,
+                                        persistence_type='session'
+                                    )
+                                ], size="sm"), width=12, md=9, className="mb-2 mb-md-0"),
+                                dbc.Col(dbc.Button(
+                                    [html.I(className="bi bi-grid-3x3 me-1"), "Thin"],
+                                    id="thin-fronts-btn", color="primary", outline=True, size="sm", className="w-100",
+                                    title="Keep one solution per non-dominated ε-box of the normalized objective space "
+                                          "(target size, or a fixed ε when given)"
+                                ), width=12, md=3),
+                            ], className="g-2 align-items-center mt-1"),
+                            html.Div(id='front-reduction-status', className="mt-2")
+                        ], className="mt-4"),
+
                         html.Hr(className="my-4"),
 
                         # --- Información de Formato (Collapse) ---